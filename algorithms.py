@@ -1,7 +1,9 @@
 import os
 import time
-import numpy as np
+import heapq
 import random
+from array import array
+from collections import deque
 
 
 # OPT
@@ -160,9 +162,14 @@ class BasicAlgorithm:
 
     Attributes:
         frame_size (int): The size of the frame (maximum number of pages that can be stored).
-        frame (list): A list representing the current state of the frame.
+        frame (array): The pages currently in the frame, as a compact array of 64-bit integers.
+
+    Algorithms declare `__slots__`, so tens of thousands of instances carry no per-instance
+    `__dict__`, and keep per-slot state in arrays and bytearrays rather than lists of ints.
     """
 
+    __slots__ = ('frame_size', 'frame')
+
     def __init__(self, frame_size):
         """
         Initialize the base algorithm with a given frame size.
@@ -171,13 +178,13 @@ class BasicAlgorithm:
             frame_size (int): The maximum size of the frame.
         """
         self.frame_size = frame_size
-        self.frame = []  # Initialize an empty frame.
+        self.frame = array('q')  # Initialize an empty frame.
 
     def reset(self):
         """
-        Reset the frame to an empty state.
+        Reset the frame to an empty state, keeping its buffer.
         """
-        self.frame = []
+        del self.frame[:]
 
     def step(self, pages, page_index = None, page_list = None):
         """
@@ -219,6 +226,8 @@ class OPT(BasicAlgorithm):
     replacing the page that will not be used for the longest period of time.
     """
 
+    __slots__ = ()
+
     def __init__(self, frame_size):
         """
         Initialize the OPT algorithm with a given frame size.
@@ -239,7 +248,8 @@ class OPT(BasicAlgorithm):
             page_index (int, optional): The current index in the reference string.
                 Must be provided to track the order of page accesses.
             page_list (list, optional): The sequence of future pages to be accessed,
-                required for predicting future page usage.
+                required for predicting future page usage. Any sequence with a list-like
+                `index(value, start)` method works, e.g. `engine.ReferenceString`.
 
         Returns:
             tuple: (frame_id, old_page)
@@ -269,8 +279,8 @@ class OPT(BasicAlgorithm):
 
             for j, current_page in enumerate(self.frame):
                 try:
-                    # Determine the next use of the current page.
-                    next_use = page_list[page_index + 1:].index(current_page)
+                    # Determine the next use of the current page (searching in place, without slicing).
+                    next_use = page_list.index(current_page, page_index + 1)
                 except ValueError:
                     # If the page is not in the remaining sequence, it will not be used again.
                     next_use = float('inf')
@@ -287,12 +297,113 @@ class OPT(BasicAlgorithm):
         return frame_id, old_page
 
 
+class LA_OPT(BasicAlgorithm):
+    """
+    Bounded look-ahead OPT.
+    Like OPT, but only the next `window` references are examined, so it can run on
+    streamed traces with a fixed amount of memory. Pages not referenced inside the
+    window are treated as never reused; ties among them are broken by a fallback
+    policy (LRU: least recently used, FIFO: loaded first).
+    """
+
+    lookahead = True  # Tells the engine to keep a window of future references.
+    __slots__ = ('window', 'fallback', 'last_use', 'loaded_at')
+
+    def __init__(self, frame_size, window = 64, fallback = 'LRU'):
+        """
+        Initialize the look-ahead OPT algorithm.
+
+        Args:
+            frame_size (int): The maximum size of the frame.
+            window (int): Number of future references examined on a fault.
+            fallback (str): Tie-break among pages not seen in the window, 'LRU' or 'FIFO'.
+        """
+        super().__init__(frame_size)
+        if fallback not in ('LRU', 'FIFO'):
+            raise ValueError("The fallback policy must be 'LRU' or 'FIFO'.")
+        self.window = window
+        self.fallback = fallback
+        self.last_use = {}  # page -> index of its last access
+        self.loaded_at = {}  # page -> index at which it was loaded
+
+    def reset(self):
+        """
+        Reset the frame and the fallback bookkeeping.
+        """
+        super().reset()
+        self.last_use.clear()
+        self.loaded_at.clear()
+
+    def step(self, pages, page_index = None, page_list = None):
+        """
+        Process a page access using bounded look-ahead OPT.
+
+        Args:
+            pages (tuple): A tuple representing the page to access and its read/write status.
+                - pages[0] (int): The page number being accessed.
+                - pages[1] (int): The read/write bit (0 for read, 1 for write).
+            page_index (int): The current index in the reference string.
+            page_list (sequence): The reference string (or a window of it) addressed by
+                absolute indices; only `page_list[page_index + 1:page_index + 1 + window]` is read.
+
+        Returns:
+            tuple: (frame_id, old_page)
+                - frame_id (int): The index in the frame where the page was added or replaced.
+                - old_page (int or None): The page that was replaced, or None if no replacement occurred.
+
+        Raises:
+            ValueError: If either `page_list` or `page_index` is not provided.
+        """
+        if page_list is None or page_index is None:
+            raise ValueError("Both 'page_list' and 'page_index' arguments are required for the LA_OPT algorithm.")
+
+        page = pages[0]
+        old_page = None
+        if len(self.frame) < self.frame_size:
+            self.frame.append(page)
+            frame_id = len(self.frame) - 1
+        else:
+            # First use of every page inside the look-ahead window, in one pass.
+            next_use = {}
+            for offset, future_page in enumerate(page_list[page_index + 1:page_index + 1 + self.window]):
+                if future_page not in next_use:
+                    next_use[future_page] = offset
+
+            unseen = [j for j, current_page in enumerate(self.frame) if current_page not in next_use]
+            if unseen:
+                # Never reused within the window: defer to the fallback policy.
+                age = self.last_use if self.fallback == 'LRU' else self.loaded_at
+                frame_id = min(unseen, key = lambda j: age.get(self.frame[j], -1))
+            else:
+                frame_id = max(range(self.frame_size), key = lambda j: next_use[self.frame[j]])
+
+            old_page = self.frame[frame_id]
+            self.frame[frame_id] = page
+            self.last_use.pop(old_page, None)
+            self.loaded_at.pop(old_page, None)
+
+        self.loaded_at[page] = page_index
+        return frame_id, old_page
+
+    def update(self, pages, page_index):
+        """
+        Record the access time of the current page for the LRU fallback.
+
+        Args:
+            pages (tuple): A tuple containing the page and its read/write bit.
+            page_index (int): The current index in the reference string.
+        """
+        self.last_use[pages[0]] = page_index
+
+
 class FIFO(BasicAlgorithm):
     """
     First-In-First-Out (FIFO) page replacement algorithm.
     Replaces the oldest page in the frame, following a cyclic order.
     """
 
+    __slots__ = ('pointer',)
+
     def __init__(self, frame_size):
         """
         Initialize the FIFO algorithm with a given frame size.
@@ -350,6 +461,8 @@ class LRU(BasicAlgorithm):
     Replaces the page that has been used least recently.
     """
 
+    __slots__ = ('page_indices', 'page_frame_idx')
+
     def __init__(self, frame_size):
         """
         Initialize the LRU algorithm with a given frame size.
@@ -366,8 +479,8 @@ class LRU(BasicAlgorithm):
         Reset the frame and page indices to their initial states.
         """
         super().reset()  # Reset the frame using the base class method.
-        self.page_indices = {}  # Clear the page access tracking dictionary.
-        self.page_frame_idx = {}
+        self.page_indices.clear()  # Clear the page access tracking dictionary.
+        self.page_frame_idx.clear()
 
     def step(self, pages, page_index = None, page_list = None):
         """
@@ -431,6 +544,177 @@ class LRU(BasicAlgorithm):
         self.page_indices[page] = page_index  # Update its access index.
 
 
+class SAMPLED_LRU(BasicAlgorithm):
+    """
+    Sampled approximate LRU, as used by Redis.
+    Instead of finding the least recently used page among all frames, a fault samples
+    `samples` distinct random frames and evicts the least recently used of them, so a
+    fault costs O(samples) however many frames there are; with `samples` at least the
+    frame count it is exactly LRU. An optional eviction pool keeps the oldest candidates
+    seen by earlier samplings, which brings the choice closer to LRU.
+    """
+
+    __slots__ = ('samples', 'pool_size', 'seed', 'random', 'stamp', 'page_frame_idx', 'pool')
+
+    def __init__(self, frame_size, samples = 5, pool_size = 0, seed = 0):
+        """
+        Initialize the sampled LRU algorithm.
+
+        Args:
+            frame_size (int): The maximum size of the frame.
+            samples (int): Number of distinct frames sampled on each fault.
+            pool_size (int): Size of the eviction pool (0 disables it).
+            seed (int): Seed of the sampling generator, so runs are reproducible.
+        """
+        super().__init__(frame_size)
+        self.samples = samples
+        self.pool_size = pool_size
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.stamp = array('q', [-1]) * frame_size  # Last access index of the page in each slot.
+        self.page_frame_idx = {}  # page -> frame_idx
+        self.pool = deque()  # (stamp, frame_idx) eviction candidates, oldest first
+
+    def reset(self):
+        """
+        Reset the frame, the timestamps, the pool and the sampling generator.
+        """
+        super().reset()
+        self.random.seed(self.seed)
+        self.stamp[:] = array('q', [-1]) * self.frame_size
+        self.page_frame_idx.clear()
+        self.pool.clear()
+
+    def __victim(self):
+        stamp = self.stamp
+        sampled = self.random.sample(range(self.frame_size), min(self.samples, self.frame_size))
+        if not self.pool_size:
+            return min(sampled, key = stamp.__getitem__)
+
+        # Merge the samples into the pool and keep its `pool_size` oldest candidates
+        pooled = set(self.pool)
+        pooled.update((stamp[frame_id], frame_id) for frame_id in sampled)
+        self.pool = deque(sorted(pooled)[:self.pool_size])
+        while self.pool:
+            old_stamp, frame_id = self.pool.popleft()
+            if stamp[frame_id] == old_stamp:  # Not accessed since it entered the pool
+                return frame_id
+        return min(sampled, key = stamp.__getitem__)
+
+    def step(self, pages, page_index = None, page_list = None):
+        """
+        Process a page using sampled LRU.
+
+        Args:
+            pages (tuple): A tuple representing the page to access and its read/write status.
+                - pages[0] (int): The page number being accessed.
+                - pages[1] (int): The read/write bit (0 for read, 1 for write).
+            page_index (int, optional): The current index in the reference string.
+            page_list (list, optional): Not used in sampled LRU but included for consistency.
+
+        Returns:
+            tuple: (frame_id, old_page)
+                - frame_id (int): The index in the frame where the page was added or replaced.
+                - old_page (int or None): The page that was replaced, or None if no replacement occurred.
+        """
+        page = pages[0]
+        old_page = None
+
+        if len(self.frame) < self.frame_size:
+            # Frame is not full; add the page.
+            self.frame.append(page)
+            frame_id = len(self.frame) - 1
+        else:
+            # Frame is full; replace the oldest of the sampled pages.
+            frame_id = self.__victim()
+            old_page = self.frame[frame_id]
+            self.frame[frame_id] = page
+            del self.page_frame_idx[old_page]
+        self.page_frame_idx[page] = frame_id
+
+        return frame_id, old_page
+
+    def update(self, pages, page_index):
+        """
+        Record the access time of the page in its slot.
+
+        Args:
+            pages (tuple): A tuple containing the page and its read/write bit.
+                - pages[0] (int): The page number being accessed.
+                - pages[1] (int): The read/write bit (0 for read, 1 for write).
+            page_index (int): The current index in the reference string.
+        """
+        self.stamp[self.page_frame_idx[pages[0]]] = page_index
+
+
+class NUMA_LRU(LRU):
+    """
+    Node-aware LRU for NUMA machines.
+    Among the `candidates` least recently used pages, the oldest one on the preferred
+    side is evicted. By default that is a page held in a home-node frame: the faulting
+    page takes the frame of its victim, so cold pages are left in remote frames and the
+    incoming (hot) page lands locally. With `prefer_remote` set, the oldest page in a
+    remote frame is evicted instead, which frees remote memory first. With no remote
+    frames marked (or one candidate) it behaves exactly like LRU.
+    """
+
+    __slots__ = ('candidates', 'prefer_remote', 'remote')
+
+    def __init__(self, frame_size, candidates = 4, prefer_remote = 0):
+        """
+        Initialize the node-aware LRU algorithm.
+
+        Args:
+            frame_size (int): The maximum size of the frame.
+            candidates (int): Number of least recently used pages considered for eviction.
+            prefer_remote (int): Nonzero to evict pages in remote frames first, zero for home-node frames.
+        """
+        super().__init__(frame_size)
+        self.candidates = max(1, candidates)
+        self.prefer_remote = 1 if prefer_remote else 0
+        self.remote = bytearray(frame_size)  # 1 if the frame slot lives on a remote node.
+
+    def set_remote(self, remote):
+        """
+        Mark which frame slots live on a remote node.
+
+        Args:
+            remote (iterable): One truth value per frame slot.
+        """
+        self.remote[:] = bytes(1 if flag else 0 for flag in remote)
+
+    def step(self, pages, page_index = None, page_list = None):
+        """
+        Process a page using node-aware LRU.
+
+        Args:
+            pages (tuple): A tuple representing the page to access and its read/write status.
+                - pages[0] (int): The page number being accessed.
+                - pages[1] (int): The read/write bit (0 for read, 1 for write).
+            page_index (int, optional): The current index in the reference string.
+            page_list (list, optional): Not used but included for consistency with other algorithms.
+
+        Returns:
+            tuple: (frame_id, old_page)
+                - frame_id (int): The index in the frame where the page was added or replaced.
+                - old_page (int or None): The page that was replaced, or None if no replacement occurred.
+        """
+        if len(self.frame) < self.frame_size or self.candidates == 1:
+            return super().step(pages, page_index, page_list)
+
+        # Oldest page on the preferred side among the least recently used ones, else the least recently used
+        oldest = heapq.nsmallest(self.candidates, self.page_indices, key = self.page_indices.get)
+        victim = next((p for p in oldest if self.remote[self.page_frame_idx[p]] == self.prefer_remote), oldest[0])
+        frame_id = self.page_frame_idx[victim]
+        page = pages[0]
+
+        self.frame[frame_id] = page
+        self.page_frame_idx[page] = frame_id
+        del self.page_indices[victim]
+        del self.page_frame_idx[victim]
+        return frame_id, victim
+
+
 class S_CLOCK(BasicAlgorithm):
     """
     Second Chance (CLOCK) Page Replacement Algorithm.
@@ -438,6 +722,8 @@ class S_CLOCK(BasicAlgorithm):
     simulating a circular queue structure.
     """
 
+    __slots__ = ('use_bit', 'pointer')
+
     def __init__(self, frame_size):
         """
         Initialize the CLOCK algorithm with a given frame size.
@@ -446,7 +732,7 @@ class S_CLOCK(BasicAlgorithm):
             frame_size (int): The maximum size of the frame.
         """
         super(S_CLOCK, self).__init__(frame_size)
-        self.use_bit = [0] * self.frame_size  # Initialize use bits for all frame slots.
+        self.use_bit = bytearray(self.frame_size)  # Initialize use bits for all frame slots.
         self.pointer = 0  # Pointer to the current position in the circular frame.
 
     def reset(self):
@@ -454,7 +740,7 @@ class S_CLOCK(BasicAlgorithm):
         Reset the frame, use bits, and pointer to their initial states.
         """
         super(S_CLOCK, self).reset()
-        self.use_bit = [0] * self.frame_size  # Reset all use bits to 0.
+        self.use_bit[:] = bytes(self.frame_size)  # Reset all use bits to 0 in place.
         self.pointer = 0  # Reset the pointer to the start of the frame.
 
     def step(self, pages, page_index = None, page_list = None):
@@ -521,6 +807,8 @@ class E_CLOCK(BasicAlgorithm):
     allowing it to prioritize pages for replacement based on both usage and modification status.
     """
 
+    __slots__ = ('use_bit', 'modify_bit', 'pointer', 'full_resets')
+
     def __init__(self, frame_size):
         """
         Initialize the E-CLOCK algorithm with a given frame size.
@@ -529,18 +817,20 @@ class E_CLOCK(BasicAlgorithm):
             frame_size (int): The maximum size of the frame.
         """
         super(E_CLOCK, self).__init__(frame_size)
-        self.use_bit = [0] * self.frame_size  # Tracks if a page has been accessed recently.
-        self.modify_bit = [0] * self.frame_size  # Tracks if a page has been modified (write access).
+        self.use_bit = bytearray(self.frame_size)  # Tracks if a page has been accessed recently.
+        self.modify_bit = bytearray(self.frame_size)  # Tracks if a page has been modified (write access).
         self.pointer = 0  # Pointer to the current position in the circular frame.
+        self.full_resets = 0  # Faults that found no (U=0) page and cleared every use bit.
 
     def reset(self):
         """
         Reset the frame, use bits, modify bits, and pointer to their initial states.
         """
         super(E_CLOCK, self).reset()
-        self.use_bit = [0] * self.frame_size  # Reset all use bits to 0.
-        self.modify_bit = [0] * self.frame_size  # Reset all modify bits to 0.
+        self.use_bit[:] = bytes(self.frame_size)  # Reset all use bits to 0 in place.
+        self.modify_bit[:] = bytes(self.frame_size)  # Reset all modify bits to 0 in place.
         self.pointer = 0  # Reset the pointer to the start of the frame.
+        self.full_resets = 0
 
     def step(self, pages, page_index = None, page_list = None):
         """
@@ -609,7 +899,8 @@ class E_CLOCK(BasicAlgorithm):
             else:
                 # Case 3: No (U=0) pages found.
                 # Reset all use bits to allow consideration of (U=1) pages.
-                self.use_bit = [0] * self.frame_size
+                self.use_bit[:] = bytes(self.frame_size)
+                self.full_resets += 1
                 # Replace (U=1, M=0) page if found, otherwise replace (U=1, M=1).
                 self.pointer = found_10 if found_10 > -1 else found_11
 
@@ -643,6 +934,385 @@ class E_CLOCK(BasicAlgorithm):
         self.modify_bit[index] = rw  # Update modify bit based on access type.
 
 
+class LFU(BasicAlgorithm):
+    """
+    Least Frequently Used (LFU) Page Replacement Algorithm.
+    Replaces the resident page with the fewest references since it was loaded, the
+    least recently used one among equals: each bucket keeps its pages in the order they
+    reached its frequency, that is in the order of their last reference. Pages are kept
+    in frequency buckets with the lowest non-empty frequency tracked, so both accesses
+    and evictions take O(1).
+    """
+
+    __slots__ = ('freq', 'buckets', 'min_freq', 'page_frame_idx')
+
+    def __init__(self, frame_size):
+        """
+        Initialize the LFU algorithm with a given frame size.
+
+        Args:
+            frame_size (int): The maximum size of the frame.
+        """
+        super().__init__(frame_size)
+        self.freq = {}  # page -> references since it was loaded
+        self.buckets = {}  # frequency -> pages with that frequency, least recently used first
+        self.min_freq = 0
+        self.page_frame_idx = {}  # page -> frame_idx
+
+    def reset(self):
+        """
+        Reset the frame, the frequencies and the buckets.
+        """
+        super().reset()
+        self.freq.clear()
+        self.buckets.clear()
+        self.min_freq = 0
+        self.page_frame_idx.clear()
+
+    def step(self, pages, page_index = None, page_list = None):
+        """
+        Process a page using the LFU algorithm.
+
+        Args:
+            pages (tuple): A tuple representing the page to access and its read/write status.
+                - pages[0] (int): The page number being accessed.
+                - pages[1] (int): The read/write bit (0 for read, 1 for write).
+            page_index (int, optional): Not used in LFU but included for consistency.
+            page_list (list, optional): Not used in LFU but included for consistency.
+
+        Returns:
+            tuple: (frame_id, old_page)
+                - frame_id (int): The index in the frame where the page was added or replaced.
+                - old_page (int or None): The page that was replaced, or None if no replacement occurred.
+        """
+        page = pages[0]
+        old_page = None
+
+        if len(self.frame) < self.frame_size:
+            # Frame is not full; add the page.
+            self.frame.append(page)
+            frame_id = len(self.frame) - 1
+        else:
+            # Frame is full; replace the least recently used page of the lowest frequency.
+            bucket = self.buckets[self.min_freq]
+            old_page = next(iter(bucket))
+            del bucket[old_page]
+            if not bucket:
+                del self.buckets[self.min_freq]
+            del self.freq[old_page]
+            frame_id = self.page_frame_idx.pop(old_page)
+            self.frame[frame_id] = page
+
+        # The new page starts at frequency 0; update() counts this reference.
+        self.page_frame_idx[page] = frame_id
+        self.freq[page] = 0
+        self.buckets.setdefault(0, {})[page] = None
+        self.min_freq = 0
+        return frame_id, old_page
+
+    def update(self, pages, page_index):
+        """
+        Move the page to the next frequency bucket.
+
+        Args:
+            pages (tuple): A tuple containing the page and its read/write bit.
+                - pages[0] (int): The page number being accessed.
+                - pages[1] (int): The read/write bit (0 for read, 1 for write).
+            page_index (int): The current index in the reference string.
+        """
+        page = pages[0]
+        count = self.freq[page]
+        bucket = self.buckets[count]
+        del bucket[page]
+        if not bucket:
+            del self.buckets[count]
+            if self.min_freq == count:
+                self.min_freq = count + 1
+        self.freq[page] = count + 1
+        self.buckets.setdefault(count + 1, {})[page] = None
+
+
+class NFU(BasicAlgorithm):
+    """
+    Not Frequently Used (NFU) Page Replacement Algorithm.
+    Every `tick` references, the referenced bit of each frame is added to its counter and
+    cleared; the page with the smallest counter is replaced (a page referenced since the
+    last tick wins ties). Ticks are applied lazily: each slot remembers the tick its
+    counter is up to date with, so an access folds the missed ticks of one slot in O(1),
+    and only an eviction brings every slot up to date and scans them, in O(frames).
+    """
+
+    __slots__ = ('tick', 'counter', 'referenced', 'stamp', 'page_frame_idx', 'clock')
+
+    def __init__(self, frame_size, tick = 4):
+        """
+        Initialize the NFU algorithm.
+
+        Args:
+            frame_size (int): The maximum size of the frame.
+            tick (int): Number of references between clock ticks.
+        """
+        super().__init__(frame_size)
+        self.tick = max(1, tick)
+        self.counter = array('q', [0]) * frame_size  # Reference count of the page in each slot.
+        self.referenced = bytearray(frame_size)  # Referenced bit of each slot during its stamp tick.
+        self.stamp = array('q', [0]) * frame_size  # Tick each slot's counter and bit belong to.
+        self.page_frame_idx = {}  # page -> frame_idx
+        self.clock = 0
+
+    def reset(self):
+        """
+        Reset the frame, the counters and the clock.
+        """
+        super().reset()
+        self.counter[:] = array('q', [0]) * self.frame_size
+        self.referenced[:] = bytes(self.frame_size)
+        self.stamp[:] = array('q', [0]) * self.frame_size
+        self.page_frame_idx.clear()
+        self.clock = 0
+
+    def _age(self, frame_id, ticks):
+        """
+        Fold the referenced bit of a slot into its counter at the first of `ticks` clock
+        ticks; the following ticks see the bit cleared and add nothing.
+        """
+        self.counter[frame_id] += self.referenced[frame_id]
+
+    def _catch_up(self, frame_id):
+        """
+        Apply the clock ticks a slot has missed since its stamp.
+        """
+        now = self.clock // self.tick
+        if self.stamp[frame_id] != now:
+            self._age(frame_id, now - self.stamp[frame_id])
+            self.referenced[frame_id] = 0
+            self.stamp[frame_id] = now
+
+    def step(self, pages, page_index = None, page_list = None):
+        """
+        Process a page, replacing the page with the smallest counter when the frame is full.
+
+        Args:
+            pages (tuple): A tuple representing the page to access and its read/write status.
+                - pages[0] (int): The page number being accessed.
+                - pages[1] (int): The read/write bit (0 for read, 1 for write).
+            page_index (int, optional): Not used but included for consistency.
+            page_list (list, optional): Not used but included for consistency.
+
+        Returns:
+            tuple: (frame_id, old_page)
+                - frame_id (int): The index in the frame where the page was added or replaced.
+                - old_page (int or None): The page that was replaced, or None if no replacement occurred.
+        """
+        page = pages[0]
+        old_page = None
+
+        if len(self.frame) < self.frame_size:
+            # Frame is not full; add the page.
+            self.frame.append(page)
+            frame_id = len(self.frame) - 1
+        else:
+            # Frame is full; replace the page with the smallest counter.
+            for i in range(self.frame_size):
+                self._catch_up(i)
+            counter, referenced = self.counter, self.referenced
+            frame_id = min(range(self.frame_size), key = lambda i: (counter[i], referenced[i]))
+            old_page = self.frame[frame_id]
+            self.frame[frame_id] = page
+            del self.page_frame_idx[old_page]
+
+        self.page_frame_idx[page] = frame_id
+        self.counter[frame_id] = 0
+        self.referenced[frame_id] = 0
+        self.stamp[frame_id] = self.clock // self.tick
+        return frame_id, old_page
+
+    def update(self, pages, page_index):
+        """
+        Bring the page's slot up to date, set its referenced bit and advance the clock.
+
+        Args:
+            pages (tuple): A tuple containing the page and its read/write bit.
+                - pages[0] (int): The page number being accessed.
+                - pages[1] (int): The read/write bit (0 for read, 1 for write).
+            page_index (int): The current index in the reference string.
+        """
+        frame_id = self.page_frame_idx[pages[0]]
+        self._catch_up(frame_id)
+        self.referenced[frame_id] = 1
+        self.clock += 1
+
+
+class AGING(NFU):
+    """
+    Aging Page Replacement Algorithm.
+    Like NFU, but at every tick each counter is shifted right before the referenced bit
+    enters at the top, so the counter is a `bits`-wide shift register and references
+    lose weight as they age.
+    """
+
+    __slots__ = ('bits',)
+
+    def __init__(self, frame_size, tick = 4, bits = 8):
+        """
+        Initialize the Aging algorithm.
+
+        Args:
+            frame_size (int): The maximum size of the frame.
+            tick (int): Number of references between clock ticks.
+            bits (int): Width of each counter (at most 62).
+        """
+        super().__init__(frame_size, tick)
+        self.bits = min(max(1, bits), 62)
+
+    def _age(self, frame_id, ticks):
+        """
+        Shift the counter of a slot once per tick, the referenced bit entering at the top
+        on the first.
+        """
+        counter = (self.counter[frame_id] >> 1) | (self.referenced[frame_id] << (self.bits - 1))
+        self.counter[frame_id] = counter >> min(ticks - 1, self.bits)
+
+
+class ADAPTIVE(BasicAlgorithm):
+    """
+    Adaptive meta-policy choosing among several replacement policies at run time.
+    Shadow copies of the candidate policies replay a hash-sampled subset of the pages
+    (one page in `sample`, with the frames scaled down to match), so the shadow cost is
+    bounded by the number of candidates and falls with the sampling rate. At the end of
+    every `epoch` references the live policy becomes the shadow with the fewest faults in
+    that epoch. A switch costs no faults: the new policy loads the resident pages in the
+    order they were loaded, so FIFO and CLOCK queues keep their order, and then replays
+    their last accesses, so recency policies see the true recency order. Reference
+    counts are not carried over. The live policy's slots are mapped onto fixed frame
+    slots, so pages keep their frame across switches. Look-ahead policies cannot be
+    candidates.
+    """
+
+    POLICIES = ('LRU', 'S_CLOCK', 'FIFO')
+
+    __slots__ = ('epoch', 'sample', 'names', 'current', 'live', 'slot', 'shadows', 'epoch_faults', 'loaded_at',
+                 'last_use', 'clock', 'switches')
+
+    def __init__(self, frame_size, epoch = 256, sample = 1, policies = None):
+        """
+        Initialize the adaptive meta-policy.
+
+        Args:
+            frame_size (int): The maximum size of the frame.
+            epoch (int): Number of references between policy decisions.
+            sample (int): One page in `sample` is replayed by the shadows (1 replays all).
+            policies (sequence, optional): Names of the candidate policies; the first starts live.
+        """
+        super().__init__(frame_size)
+        from engine import Pager  # engine imports this module
+
+        self.epoch = max(1, epoch)
+        self.sample = max(1, sample)
+        self.names = list(policies or self.POLICIES)
+        self.current = 0
+        self.live = ALGORITHMS[self.names[0]](frame_size)
+        self.slot = array('q')  # Live policy slot -> frame slot
+        shadow_size = max(1, frame_size // self.sample)
+        self.shadows = [Pager(ALGORITHMS[name](shadow_size)) for name in self.names]
+        self.epoch_faults = [0] * len(self.names)
+        self.loaded_at = {}  # Resident page -> index at which it was loaded, for handing pages over
+        self.last_use = {}  # Resident page -> last access index
+        self.clock = 0
+        self.switches = []  # (page_index, from policy, to policy)
+
+    def reset(self):
+        """
+        Restart with the first candidate live and cold shadows.
+        """
+        super().reset()
+        self.current = 0
+        self.live = ALGORITHMS[self.names[0]](self.frame_size)
+        del self.slot[:]
+        for shadow in self.shadows:
+            shadow.reset()
+        self.epoch_faults[:] = [0] * len(self.names)
+        self.loaded_at.clear()
+        self.last_use.clear()
+        self.clock = 0
+        self.switches.clear()
+
+    def step(self, pages, page_index = None, page_list = None):
+        """
+        Process a page with the live policy.
+
+        Args:
+            pages (tuple): A tuple representing the page to access and its read/write status.
+                - pages[0] (int): The page number being accessed.
+                - pages[1] (int): The read/write bit (0 for read, 1 for write).
+            page_index (int, optional): The current index in the reference string.
+            page_list (list, optional): Passed on to the live policy.
+
+        Returns:
+            tuple: (frame_id, old_page)
+                - frame_id (int): The index in the frame where the page was added or replaced.
+                - old_page (int or None): The page that was replaced, or None if no replacement occurred.
+        """
+        live_id, old_page = self.live.step(pages, page_index, page_list)
+        if live_id == len(self.slot):
+            # The live policy filled a new slot
+            self.slot.append(len(self.frame))
+            self.frame.append(pages[0])
+        else:
+            self.frame[self.slot[live_id]] = pages[0]
+        if old_page is not None:
+            del self.loaded_at[old_page]
+            del self.last_use[old_page]
+        self.loaded_at[pages[0]] = page_index
+        return self.slot[live_id], old_page
+
+    def update(self, pages, page_index):
+        """
+        Update the live policy, replay sampled pages in the shadows and decide at epoch ends.
+
+        Args:
+            pages (tuple): A tuple containing the page and its read/write bit.
+                - pages[0] (int): The page number being accessed.
+                - pages[1] (int): The read/write bit (0 for read, 1 for write).
+            page_index (int): The current index in the reference string.
+        """
+        page = pages[0]
+        self.live.update(pages, page_index)
+        self.last_use[page] = page_index
+
+        # Multiplicative hashing spreads the sample over the address space
+        if self.sample == 1 or ((page * 2654435761) & 0xFFFFFFFF) % self.sample == 0:
+            for i, shadow in enumerate(self.shadows):
+                self.epoch_faults[i] += shadow.access(page, pages[1], self.clock)[0]
+        self.clock += 1
+        if self.clock % self.epoch == 0:
+            best = min(range(len(self.names)), key = lambda i: (self.epoch_faults[i], i != self.current))
+            if best != self.current:
+                self.__switch(best, page_index)
+            self.epoch_faults[:] = [0] * len(self.names)
+
+    def __switch(self, best, page_index):
+        # The new policy loads the resident pages in load order, then sees their last accesses
+        live = ALGORITHMS[self.names[best]](self.frame_size)
+        frame_slot = {page: frame_id for frame_id, page in enumerate(self.frame)}
+        slot = array('q', [0]) * len(self.frame)
+        for page in sorted(self.loaded_at, key = self.loaded_at.get):
+            live_id, _ = live.step((page, 0), self.loaded_at[page])
+            slot[live_id] = frame_slot[page]
+        for page in sorted(self.last_use, key = self.last_use.get):
+            live.update((page, 0), self.last_use[page])
+        self.switches.append((page_index, self.names[self.current], self.names[best]))
+        self.current = best
+        self.live = live
+        self.slot = slot
+
+
+# Replacement policies selectable by name (engine.make_algorithm, the CLI and ADAPTIVE candidates)
+ALGORITHMS = {algorithm.__name__: algorithm
+              for algorithm in (OPT, LA_OPT, FIFO, LRU, SAMPLED_LRU, NUMA_LRU, S_CLOCK, E_CLOCK, LFU, NFU, AGING,
+                                ADAPTIVE)}
+
+
 if __name__ == '__main__':
     pages = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
     fifo_pages = [1, 2, 3, 4, 2, 1, 5, 6, 2, 1, 2, 3, 7, 6, 3, 2, 1, 2, 3, 6]
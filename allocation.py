@@ -0,0 +1,314 @@
+from collections import OrderedDict, deque
+
+
+class FramePool:
+    """
+    Shared pool of free physical frames used by variable allocation.
+    """
+
+    def __init__(self, frames):
+        """
+        :param frames: Physical frame numbers that start out free
+        """
+        self.free = list(frames)
+
+    def __len__(self):
+        return len(self.free)
+
+    def take(self):
+        """
+        :return: A free frame, or None if the pool is empty
+        """
+        return self.free.pop() if self.free else None
+
+    def give(self, frame):
+        """
+        Returns a frame to the pool.
+
+        :param frame: Physical frame number
+        """
+        self.free.append(frame)
+
+
+class ResidentSet:
+    """
+    Pages a process holds under variable allocation, kept in LRU order for local replacement.
+    `process.frame_list` always lists the frames the process currently holds.
+    """
+
+    def __init__(self, process):
+        """
+        :param process: Process whose frames and page table are managed
+        """
+        self.process = process
+        self.process.reset()
+        self.process.frame_list = []
+        self.process.frame_size = 0
+        self.pages = OrderedDict()  # page -> frame, least recently used first
+        self.spare = []  # Frames held but not mapped (fixed allocation)
+        self.referenced = set()  # Pages referenced since the last fault (PFF)
+        self.window = deque()  # Last references, for the working set
+        self.window_counts = {}
+        self.clock = 0  # References made by this process (virtual time)
+        self.last_fault = 0
+        self.faults = 0
+
+    def hold(self, frame):
+        """
+        Adds a frame to the process.
+
+        :param frame: Physical frame number
+        """
+        self.process.frame_list.append(frame)
+        self.process.frame_size += 1
+
+    def drop(self, frame):
+        """
+        Removes a frame from the process.
+
+        :param frame: Physical frame number
+        """
+        self.process.frame_list.remove(frame)
+        self.process.frame_size -= 1
+
+    def map(self, page, frame, rw):
+        """
+        Maps a page onto a frame the process already holds.
+
+        :param page: Page number
+        :param frame: Physical frame number
+        :param rw: Read/write bit of the access
+        """
+        self.pages[page] = frame
+        self.process.map_page(page, frame, rw)
+
+    def unmap(self, page):
+        """
+        Unmaps a resident page.
+
+        :param page: Page number
+        :return: The frame the page occupied
+        """
+        frame = self.pages.pop(page)
+        self.process.unmap_page(page)
+        return frame
+
+
+class BasicAllocator:
+    """
+    A base class for frame allocation policies.
+    Subclasses decide where the frame for a faulting page comes from and may release
+    frames after every reference; replacement inside a process is LRU.
+    """
+
+    name = None
+
+    def __init__(self, pool):
+        """
+        :param pool: FramePool shared by all processes
+        """
+        self.pool = pool
+        self.resident_sets = []
+
+    def register(self, resident_set):
+        """
+        Adds a process to the policy before the simulation starts.
+
+        :param resident_set: ResidentSet of the process
+        """
+        self.resident_sets.append(resident_set)
+
+    def release(self, rs, page):
+        """
+        Evicts a page and gives its frame back to the pool.
+
+        :param rs: ResidentSet holding the page
+        :param page: Page number
+        """
+        frame = rs.unmap(page)
+        rs.drop(frame)
+        self.pool.give(frame)
+
+    def replace(self, rs):
+        """
+        Local replacement: evicts the least recently used page of the process.
+
+        :param rs: ResidentSet of the process
+        :return: The freed frame, still held by the process
+        """
+        page = next(iter(rs.pages))
+        return rs.unmap(page)
+
+    def grow(self, rs):
+        """
+        Takes a frame from the pool. If it is empty, steals the least recently used page
+        of the largest other process, or falls back to local replacement when no other
+        process has a page to give.
+
+        :param rs: ResidentSet that receives the frame
+        :return: A frame now held by `rs`
+        :raises ValueError: If no frame can be found at all
+        """
+        frame = self.pool.take()
+        if frame is None:
+            victims = [other for other in self.resident_sets if other is not rs and other.pages]
+            if not victims:
+                if not rs.pages:
+                    raise ValueError('No free frame and no resident page to replace')
+                return self.replace(rs)
+            victim = max(victims, key = lambda other: len(other.pages))
+            self.release(victim, next(iter(victim.pages)))
+            frame = self.pool.take()
+        rs.hold(frame)
+        return frame
+
+    def frame_for_fault(self, rs, page):
+        """
+        Chooses the frame for a faulting page. Must be implemented by subclasses.
+
+        :param rs: ResidentSet of the faulting process
+        :param page: Faulting page
+        :return: A frame held by `rs` and not mapped
+        """
+        raise NotImplementedError("The 'frame_for_fault' method must be implemented by subclasses.")
+
+    def after_access(self, rs, page):
+        """
+        Hook run after every reference, e.g. to trim the working set.
+
+        :param rs: ResidentSet of the process
+        :param page: Page just referenced
+        """
+        pass
+
+    def access(self, rs, page, rw):
+        """
+        Simulates one reference of a process.
+
+        :param rs: ResidentSet of the process
+        :param page: Page number
+        :param rw: Read/write bit (0 for read, 1 for write)
+        :return: 1 if a page fault occurred, otherwise 0
+        """
+        rs.clock += 1
+        fault = 0
+        if page in rs.pages:
+            rs.pages.move_to_end(page)
+            rs.process.map_page(page, rs.pages[page], rw)
+        else:
+            frame = self.frame_for_fault(rs, page)
+            rs.map(page, frame, rw)
+            rs.faults += 1
+            rs.last_fault = rs.clock
+            fault = 1
+        rs.referenced.add(page)
+        self.after_access(rs, page)
+        return fault
+
+
+class FixedAllocator(BasicAllocator):
+    """
+    Fixed allocation, local replacement: every process keeps the same number of frames.
+    """
+
+    name = 'FIXED'
+
+    def __init__(self, pool, frames_per_process):
+        super().__init__(pool)
+        self.frames_per_process = frames_per_process
+
+    def register(self, resident_set):
+        super().register(resident_set)
+        for _ in range(self.frames_per_process):
+            frame = self.pool.take()
+            if frame is None:
+                raise ValueError('Not enough frames for fixed allocation')
+            resident_set.hold(frame)
+            resident_set.spare.append(frame)
+
+    def frame_for_fault(self, rs, page):
+        if rs.spare:
+            return rs.spare.pop()
+        return self.replace(rs)
+
+
+class WorkingSetAllocator(BasicAllocator):
+    """
+    Working-set policy: a process holds exactly the pages referenced in its last `delta`
+    references. Pages leaving the window release their frames to the pool.
+    """
+
+    name = 'WS'
+
+    def __init__(self, pool, delta = 10):
+        super().__init__(pool)
+        self.delta = delta
+
+    def frame_for_fault(self, rs, page):
+        return self.grow(rs)
+
+    def after_access(self, rs, page):
+        rs.window.append(page)
+        rs.window_counts[page] = rs.window_counts.get(page, 0) + 1
+        if len(rs.window) > self.delta:
+            old = rs.window.popleft()
+            rs.window_counts[old] -= 1
+            if rs.window_counts[old] == 0:
+                del rs.window_counts[old]
+                if old in rs.pages:
+                    self.release(rs, old)
+
+
+class PFFAllocator(BasicAllocator):
+    """
+    Page-fault-frequency policy. On a fault, a process whose fault rate (faults per
+    reference since its previous fault) exceeds `upper` gets a new frame; one whose rate
+    falls below `lower` first releases every page not referenced since the previous fault.
+    """
+
+    name = 'PFF'
+
+    def __init__(self, pool, upper = 0.5, lower = 0.1):
+        super().__init__(pool)
+        if lower > upper:
+            raise ValueError('The lower fault-rate threshold must not exceed the upper one')
+        self.upper = upper
+        self.lower = lower
+
+    def frame_for_fault(self, rs, page):
+        interval = rs.clock - rs.last_fault
+        rate = 1 / interval if interval else 1.0
+        if rate < self.lower:
+            for old in [old for old in rs.pages if old not in rs.referenced]:
+                self.release(rs, old)
+        rs.referenced = set()
+
+        if not rs.pages or rate > self.upper or rate < self.lower:
+            return self.grow(rs)
+        return self.replace(rs)
+
+
+def simulate_allocation(allocator, process_list, traces, sample_every = 1):
+    """
+    Runs the processes round-robin, one reference per process per turn.
+
+    :param allocator: BasicAllocator instance
+    :param process_list: Processes to simulate
+    :param traces: One (access, modify) pair of sequences per process
+    :param sample_every: Number of turns between samples of the frames each process holds
+    :return: Tuple of (faults per process, history) where history lists
+             (turn, frames held by each process) samples
+    """
+    resident_sets = [ResidentSet(process) for process in process_list]
+    for rs in resident_sets:
+        allocator.register(rs)
+
+    history = []
+    longest = max(len(access) for access, _ in traces)
+    for turn in range(longest):
+        for rs, (access, modify) in zip(resident_sets, traces):
+            if turn < len(access):
+                allocator.access(rs, access[turn], modify[turn])
+        if turn % sample_every == 0 or turn == longest - 1:
+            history.append((turn, [rs.process.frame_size for rs in resident_sets]))
+    return [rs.faults for rs in resident_sets], history
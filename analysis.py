@@ -0,0 +1,211 @@
+import json
+from collections import Counter, deque
+
+
+class Fenwick:
+    """
+    Binary indexed tree over 0/1 marks, giving prefix sums in O(log n).
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, index, value):
+        index += 1
+        while index <= self.size:
+            self.tree[index] += value
+            index += index & -index
+
+    def prefix(self, index):
+        """
+        :return: Sum of the marks at positions [0, index]
+        """
+        total = 0
+        index += 1
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+
+class TraceAnalyzer:
+    """
+    One-pass characterization of a page trace, fed in any number of blocks.
+    Reuse distances (distinct pages between two accesses to the same page) use a Fenwick
+    tree over access times: O(log n) per access. Times are renumbered whenever the tree
+    fills up, so memory stays proportional to the footprint rather than the trace length.
+    """
+
+    def __init__(self, window = 10, sample_every = 1):
+        """
+        :param window: Working-set window delta, in references
+        :param sample_every: Number of references between working-set samples
+        """
+        self.window = window
+        self.sample_every = sample_every
+
+        self.accesses = 0
+        self.reads = 0
+        self.writes = 0
+        self.pages = set()  # Distinct pages ever seen
+        self.compulsory = 0
+        self.histogram = Counter()  # reuse distance -> count
+
+        self.capacity = 1024
+        self.tree = Fenwick(self.capacity)
+        self.last = {}  # page -> time of its last access (current numbering)
+        self.now = 0
+
+        self.ws_window = deque()
+        self.ws_counts = {}
+        self.ws_samples = []  # (reference number, W(t, delta))
+        self.ws_total = 0
+        self.ws_max = 0
+
+    def restart(self):
+        """
+        Starts a new run of the process: memory is cold again, so the next access to every
+        page is a compulsory miss. Totals and histograms keep accumulating.
+        """
+        self.tree = Fenwick(self.capacity)
+        self.last = {}
+        self.now = 0
+        self.ws_window = deque()
+        self.ws_counts = {}
+
+    def __compact(self):
+        # Renumber the live last-access times to 0..k-1, keeping their order
+        order = sorted(self.last, key = self.last.get)
+        self.capacity = max(1024, 2 * len(order))
+        self.tree = Fenwick(self.capacity)
+        for time, page in enumerate(order):
+            self.last[page] = time
+            self.tree.add(time, 1)
+        self.now = len(order)
+
+    def push(self, page, rw):
+        """
+        Adds one reference.
+
+        :param page: Page number
+        :param rw: Read/write bit (0 for read, 1 for write)
+        """
+        if self.now >= self.capacity:
+            self.__compact()
+
+        previous = self.last.get(page)
+        if previous is None:
+            self.compulsory += 1
+        else:
+            # Distinct pages touched strictly between the two accesses
+            self.histogram[self.tree.prefix(self.now - 1) - self.tree.prefix(previous)] += 1
+            self.tree.add(previous, -1)
+        self.tree.add(self.now, 1)
+        self.last[page] = self.now
+        self.now += 1
+
+        self.accesses += 1
+        self.pages.add(page)
+        if rw:
+            self.writes += 1
+        else:
+            self.reads += 1
+
+        # Working set W(t, delta): distinct pages among the last delta references
+        self.ws_window.append(page)
+        self.ws_counts[page] = self.ws_counts.get(page, 0) + 1
+        if len(self.ws_window) > self.window:
+            old = self.ws_window.popleft()
+            self.ws_counts[old] -= 1
+            if self.ws_counts[old] == 0:
+                del self.ws_counts[old]
+        size = len(self.ws_counts)
+        self.ws_total += size
+        self.ws_max = max(self.ws_max, size)
+        if (self.accesses - 1) % self.sample_every == 0:
+            self.ws_samples.append((self.accesses - 1, size))
+
+    def feed(self, access, modify):
+        """
+        Adds a block of references.
+
+        :param access: Sequence of page numbers
+        :param modify: Sequence of read/write bits
+        """
+        access = access.tolist() if hasattr(access, 'tolist') else access
+        modify = modify.tolist() if hasattr(modify, 'tolist') else modify
+        for page, rw in zip(access, modify):
+            self.push(page, rw)
+
+    def lru_fault_curve(self, frame_sizes):
+        """
+        Faults LRU would take with each frame count, read off the reuse-distance histogram
+        (a reuse at distance d hits iff d < frame_size). The histogram is summed once from
+        the largest distance down, so every frame count then costs O(1).
+
+        :param frame_sizes: Frame counts
+        :return: Dictionary of frame count -> number of faults
+        """
+        longest = max(self.histogram, default = -1)
+        # at_least[d]: reuses at distance d or more (at_least[longest + 1] = 0)
+        at_least = [0] * (longest + 2)
+        for distance in range(longest, -1, -1):
+            at_least[distance] = at_least[distance + 1] + self.histogram.get(distance, 0)
+        return {f: self.compulsory + at_least[min(max(f, 0), longest + 1)] for f in frame_sizes}
+
+    def lru_faults(self, frame_size):
+        """
+        Faults LRU would take with `frame_size` frames.
+
+        :param frame_size: Number of frames
+        :return: Number of faults
+        """
+        return self.lru_fault_curve([frame_size])[frame_size]
+
+    def report(self, frame_sizes = None):
+        """
+        :param frame_sizes: Frame counts for which the LRU fault count is derived
+                            (defaults to the powers of two below the footprint, and the
+                            footprint itself)
+        :return: JSON-serializable dictionary describing the trace
+        """
+        footprint = len(self.pages)
+        if not frame_sizes:
+            frame_sizes = [1 << i for i in range(footprint.bit_length()) if 1 << i < footprint] + [footprint]
+        return {
+            'accesses': self.accesses,
+            'footprint': footprint,
+            'compulsory_misses': self.compulsory,
+            'reads': self.reads,
+            'writes': self.writes,
+            'read_write_ratio': self.reads / self.writes if self.writes else None,
+            'reuse_distance_histogram': {str(d): c for d, c in sorted(self.histogram.items())},
+            'lru_faults': {str(f): faults for f, faults in self.lru_fault_curve(frame_sizes).items()},
+            'working_set': {
+                'window': self.window,
+                'mean': self.ws_total / self.accesses if self.accesses else 0,
+                'max': self.ws_max,
+                'samples': self.ws_samples,
+            },
+        }
+
+
+# Write analysis reports as JSON to a file, or to stdout for '-'
+def write_report(reports, path):
+    text = json.dumps(reports, indent = 2)
+    if path == '-':
+        print(text)
+    else:
+        with open(path, 'w') as f:
+            f.write(text)
+
+
+if __name__ == '__main__':
+    import random
+
+    random.seed(42)
+    analyzer = TraceAnalyzer(window = 10, sample_every = 1000)
+    analyzer.feed([random.randint(0, 31) for _ in range(5000)], [random.randint(0, 1) for _ in range(5000)])
+    report = analyzer.report([4, 8, 16])
+    print(json.dumps({key: report[key] for key in ['accesses', 'footprint', 'compulsory_misses', 'lru_faults']}))
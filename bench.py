@@ -0,0 +1,64 @@
+import time
+import argparse
+import numpy as np
+from engine import run_trace, make_algorithm
+
+
+def zipf_trace(length, pages, alpha = 1.1, rng = None):
+    """
+    Generates a skewed trace: page popularity follows a Zipf law, as in caches and
+    databases, so replacement quality matters even with a large frame pool.
+
+    :param length: Number of references
+    :param pages: Number of distinct pages
+    :param alpha: Zipf exponent (larger is more skewed)
+    :param rng: numpy.random.Generator (a fresh default one if None)
+    :return: Tuple of (access, modify) arrays
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    ranks = np.arange(1, pages + 1, dtype = np.float64)
+    weights = ranks ** -alpha
+    popularity = rng.permutation(pages)  # Popular pages are scattered over the address space
+    access = popularity[rng.choice(pages, size = length, p = weights / weights.sum())]
+    modify = rng.integers(0, 2, size = length, dtype = np.uint8)
+    return access.astype(np.int64), modify
+
+
+def benchmark(algorithm_names, access, modify, frame_size):
+    """
+    Runs every algorithm over the same trace through the headless engine.
+
+    :param algorithm_names: Names understood by engine.make_algorithm
+    :param access: Page array
+    :param modify: Read/write bit array
+    :param frame_size: Number of frames
+    :return: Dictionary of name -> (faults, seconds)
+    """
+    results = {}
+    for name in algorithm_names:
+        T0 = time.perf_counter()
+        faults = run_trace(make_algorithm(name), access, modify, frame_size)
+        T1 = time.perf_counter()
+        results[name] = (faults, T1 - T0)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Compare fault rate and speed of algorithms on a Zipf trace.')
+    parser.add_argument('--algorithm', type = str, nargs = '+',
+                        default = ['LRU', 'SAMPLED_LRU(1)', 'SAMPLED_LRU(3)', 'SAMPLED_LRU(5)', 'SAMPLED_LRU(10)',
+                                   'SAMPLED_LRU(5,16)'])
+    parser.add_argument('--length', type = int, default = 100000)
+    parser.add_argument('--pages', type = int, default = 50000)
+    parser.add_argument('--frames', type = int, default = 2048)
+    parser.add_argument('--alpha', type = float, default = 1.1)
+    parser.add_argument('--seed', type = int, default = 42)
+    args = parser.parse_args()
+
+    access, modify = zipf_trace(args.length, args.pages, args.alpha, np.random.default_rng(args.seed))
+    results = benchmark(args.algorithm, access, modify, args.frames)
+    baseline = results.get('LRU')
+    for name, (faults, seconds) in results.items():
+        excess = f", {(faults / baseline[0] - 1) * 100:+.2f}% faults vs LRU" if baseline else ''
+        print(f"{name:>18}: fault rate {faults / len(access) * 100:.2f}%, "
+              f"{len(access) / seconds / 1e6:.3f} M accesses/s{excess}")
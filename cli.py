@@ -0,0 +1,155 @@
+"""
+Headless command line for scripted runs.
+
+    python cli.py simulate [--trace FILE] [--json]       fault counts of every algorithm
+    python cli.py sweep --frames 2 4 8 16                 fault curve over frame counts (CSV)
+    python cli.py analyze [--trace FILE] [--output F]     one-pass trace characterization (JSON)
+    python cli.py visualize {table,steps} [ARGS ...]      colored simulation of main.py / quick_start.py
+
+Only argparse is imported up front. Each command imports what it needs when it runs,
+so the headless commands never load NumPy (unless they read a trace file), colorama or
+tabulate, and algorithms are resolved by name through algorithms.ALGORITHMS.
+"""
+import sys
+import argparse
+
+DEFAULT_ALGORITHMS = ['OPT', 'FIFO', 'LRU', 'S_CLOCK', 'E_CLOCK', 'LFU', 'NFU', 'AGING']
+
+
+def generated_traces(args):
+    """
+    Generates the sequences main.py simulates, with the same generator and seed, so both
+    report identical fault counts.
+
+    :return: List of (pid, access, modify) triples
+    """
+    import random
+    from workload import generate_sequences
+
+    return list(generate_sequences(args.pid_num, args.max_pages, *args.sequence_length, args.page_seq_count,
+                                   random.Random(args.seed)))
+
+
+def fault_counts(args, frame_size):
+    """
+    :return: Tuple of (dictionary of algorithm -> page faults, accesses)
+    """
+    from engine import run_trace, make_algorithm, trace_faults
+
+    if args.trace is not None:
+        return trace_faults(args.trace, args.algorithm, frame_size, args.trace_format, args.page_size * 1024)
+    traces = generated_traces(args)
+    results = {}
+    for name in args.algorithm:
+        factory = make_algorithm(name)
+        results[name] = sum(run_trace(factory, access, modify, frame_size) for _, access, modify in traces)
+    return results, sum(len(access) for _, access, _ in traces)
+
+
+def simulate(args):
+    results, access_n = fault_counts(args, args.frame_per_process)
+    if args.json:
+        import json
+        print(json.dumps({'accesses': access_n, 'faults': results}))
+        return
+    for name, faults in results.items():
+        print(f"{name}: {faults} faults, {faults / access_n * 100:.2f}%")
+
+
+def sweep(args):
+    print('algorithm,frames,faults,accesses,fault_rate')
+    for frame_size in args.frames:
+        results, access_n = fault_counts(args, frame_size)
+        for name, faults in results.items():
+            print(f"{name},{frame_size},{faults},{access_n},{faults / access_n:.6f}")
+
+
+def analyze(args):
+    from analysis import TraceAnalyzer, write_report
+
+    if args.trace is not None:
+        from traces import open_trace
+
+        analyzer = TraceAnalyzer(args.window, args.sample)
+        for chunk in open_trace(args.trace, args.trace_format, args.page_size * 1024):
+            analyzer.feed(chunk['page'], chunk['rw'])
+        write_report({'trace': args.trace, **analyzer.report(args.frames)}, args.output)
+        return
+
+    # One analyzer per process; each sequence restarts the process cold, as in main.py
+    analyzers = {pid: TraceAnalyzer(args.window, args.sample) for pid in range(args.pid_num)}
+    for pid, access, modify in generated_traces(args):
+        analyzers[pid].restart()
+        analyzers[pid].feed(access, modify)
+    write_report({f'pid{pid}': analyzer.report(args.frames) for pid, analyzer in analyzers.items()}, args.output)
+
+
+def visualize(args):
+    if args.view == 'table':
+        import main
+        main.main(args.args)
+    else:
+        import runpy
+        sys.argv = ['quick_start.py'] + args.args
+        runpy.run_module('quick_start', run_name = '__main__')
+
+
+def get_parser():
+    # Workload options shared by the headless commands, with main.py's defaults
+    workload = argparse.ArgumentParser(add_help = False)
+    workload.add_argument('--pid_num', type = int, default = 3, help = 'Number of processes.')
+    workload.add_argument('--page_seq_count', type = int, default = 10, help = 'Sequences generated per process.')
+    workload.add_argument('--frame_per_process', type = int, default = 5, help = 'Physical frames per process.')
+    workload.add_argument('--max_pages', type = int, default = 8, help = 'Pages in each address space.')
+    workload.add_argument('--sequence_length', type = int, nargs = 2, default = [8, 20],
+                          help = 'Minimum and maximum sequence length.')
+    workload.add_argument('--seed', type = int, default = 42)
+    workload.add_argument('--algorithm', type = str, nargs = '+', default = DEFAULT_ALGORITHMS,
+                          help = 'Algorithms by name, e.g. LRU or LA_OPT(16).')
+    workload.add_argument('--trace', type = str, default = None,
+                          help = 'Trace file to use instead of generated sequences.')
+    workload.add_argument('--trace_format', type = str, default = 'bin', choices = ['bin', 'lackey'])
+    workload.add_argument('--page_size', type = int, default = 4, help = 'Page size in KB for Lackey traces.')
+
+    parser = argparse.ArgumentParser(description = 'Headless page replacement simulator.')
+    commands = parser.add_subparsers(dest = 'command', required = True)
+
+    command = commands.add_parser('simulate', parents = [workload], help = 'Fault counts of every algorithm.')
+    command.add_argument('--json', action = 'store_true', help = 'Print the results as JSON.')
+    command.set_defaults(run = simulate)
+
+    command = commands.add_parser('sweep', parents = [workload], help = 'Fault curve over frame counts as CSV.')
+    command.add_argument('--frames', type = int, nargs = '+', default = [1, 2, 3, 4, 5, 6, 7, 8])
+    command.set_defaults(run = sweep)
+
+    command = commands.add_parser('analyze', parents = [workload], help = 'Characterize the workload as JSON.')
+    command.add_argument('--window', type = int, default = 10, help = 'Working-set window in references.')
+    command.add_argument('--sample', type = int, default = 100, help = 'Sample the working set every this many references.')
+    command.add_argument('--frames', type = int, nargs = '+', default = None,
+                         help = 'Frame counts to derive LRU fault counts for.')
+    command.add_argument('--output', type = str, default = '-', help = "Report file ('-' for stdout).")
+    command.set_defaults(run = analyze)
+
+    command = commands.add_parser('visualize', help = 'Colored simulation: the main.py tables or quick_start steps.')
+    command.add_argument('view', choices = ['table', 'steps'])
+    command.add_argument('args', nargs = argparse.REMAINDER, help = 'Arguments passed on to main.py or quick_start.py.')
+    command.set_defaults(run = visualize)
+    return parser
+
+
+def run(argv = None):
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    if hasattr(args, 'algorithm'):
+        from engine import make_algorithm
+
+        for name in args.algorithm:
+            try:
+                make_algorithm(name)
+            except ValueError as error:
+                parser.error(f"argument --algorithm: {error}")
+    args.run(args)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,244 @@
+import sys
+import time
+import itertools
+from collections import deque
+from algorithms import ALGORITHMS, FIFO, OPT, LRU, S_CLOCK, E_CLOCK
+
+
+def make_algorithm(name):
+    """
+    Resolves an algorithm name into a factory taking the frame count.
+    Integer arguments in parentheses are passed after the frame count, e.g. `LA_OPT(16)`
+    selects the look-ahead window of LA_OPT and `SAMPLED_LRU(5,16)` the sample and pool sizes.
+
+    :param name: Name of an algorithm in algorithms.ALGORITHMS
+    :return: Callable frame_size -> BasicAlgorithm instance
+    :raises ValueError: If the name is not registered
+    """
+    args = None
+    if name.endswith(')') and '(' in name:
+        name, args = name[:-1].split('(', 1)
+    algorithm = ALGORITHMS.get(name)
+    if algorithm is None:
+        raise ValueError(f"Unknown algorithm {name}; choose from {', '.join(ALGORITHMS)}")
+    if args is None:
+        return algorithm
+    args = [int(arg) for arg in args.split(',')]
+    return lambda frame_size: algorithm(frame_size, *args)
+
+
+def is_ndarray(value):
+    """
+    :return: True if the value is a NumPy array. NumPy is only imported by callers that
+             build arrays, so plain-list runs never pay for loading it.
+    """
+    np = sys.modules.get('numpy')
+    return np is not None and isinstance(value, np.ndarray)
+
+
+class FutureWindow:
+    """
+    The next references of a streamed trace, addressed by absolute index, so look-ahead
+    algorithms can read `page_list[i:j]` without the whole trace in memory.
+    """
+
+    def __init__(self, future, base):
+        """
+        :param future: Deque of upcoming pages
+        :param base: Absolute index of future[0]
+        """
+        self.future = future
+        self.base = base
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice):
+            return self.future[item - self.base]
+        start = max((item.start or self.base) - self.base, 0)
+        stop = len(self.future) if item.stop is None else max(item.stop - self.base, 0)
+        return list(itertools.islice(self.future, start, stop))
+
+
+class ReferenceString:
+    """
+    List-like wrapper around a NumPy page array, so look-ahead algorithms such as OPT
+    can search the future with `index` without converting the array into a list.
+    """
+
+    def __init__(self, pages, block = 1 << 16):
+        """
+        :param pages: One-dimensional array of page numbers (may be a shared-memory view)
+        :param block: Number of elements compared per search step
+        """
+        self.pages = pages
+        self.block = block
+
+    def __len__(self):
+        return len(self.pages)
+
+    def __getitem__(self, item):
+        return self.pages[item]
+
+    def index(self, value, start = 0):
+        """
+        :return: Position of the first `value` at or after `start`
+        :raises ValueError: If the value does not occur again
+        """
+        import numpy as np
+
+        for begin in range(start, len(self.pages), self.block):
+            hits = np.flatnonzero(self.pages[begin:begin + self.block] == value)
+            if hits.size:
+                return begin + int(hits[0])
+        raise ValueError(f"{value} is not in the reference string")
+
+
+class Pager:
+    """
+    Headless page-fault engine around a replacement algorithm.
+    It tracks residency with a dictionary instead of a `Process` page table, so it
+    runs on any page numbers and skips all display bookkeeping.
+    """
+
+    def __init__(self, function):
+        """
+        :param function: BasicAlgorithm instance that chooses the frames
+        """
+        self.function = function
+        self.resident = {}  # page -> frame_id
+
+    def reset(self):
+        """
+        Resets the algorithm and the resident set.
+        """
+        self.function.reset()
+        self.resident = {}
+
+    def access(self, page, rw, page_index, page_list = None):
+        """
+        Simulates one page access.
+
+        :param page: Page number being accessed
+        :param rw: Read/write bit (0 for read, 1 for write)
+        :param page_index: Position of the access in the reference string
+        :param page_list: Reference string, required by look-ahead algorithms like OPT
+        :return: Tuple of (fault, frame_id, old_page)
+        """
+        old_page = None
+        frame_id = self.resident.get(page)
+        if frame_id is None:
+            frame_id, old_page = self.function.step((page, rw), page_index, page_list)
+            if old_page is not None:
+                del self.resident[old_page]
+            self.resident[page] = frame_id
+            fault = 1
+        else:
+            fault = 0
+        self.function.update((page, rw), page_index)
+        return fault, frame_id, old_page
+
+
+def run_trace(algorithm, access, modify, frame_size, block = 1 << 16):
+    """
+    Counts the page faults of an algorithm over a whole trace.
+    NumPy arrays are walked block by block, so a shared or memory-mapped trace is never
+    copied as a whole.
+
+    :param algorithm: BasicAlgorithm subclass or factory taking the frame count
+    :param access: Sequence of page numbers (list or NumPy array)
+    :param modify: Sequence of read/write bits
+    :param frame_size: Number of frames available
+    :param block: Number of accesses converted to Python integers at a time
+    :return: Number of page faults
+    """
+    pager = Pager(algorithm(frame_size))
+    faults = 0
+    if not is_ndarray(access):
+        for page_index, (page, rw) in enumerate(zip(access, modify)):
+            faults += pager.access(page, rw, page_index, access)[0]
+        return faults
+
+    page_list = ReferenceString(access)
+    for begin in range(0, len(access), block):
+        pages = access[begin:begin + block].tolist()
+        rws = modify[begin:begin + block].tolist()
+        for offset, (page, rw) in enumerate(zip(pages, rws)):
+            faults += pager.access(page, rw, begin + offset, page_list)[0]
+    return faults
+
+
+def run_stream(algorithm, chunks, frame_size):
+    """
+    Counts the page faults of an algorithm over a trace delivered in blocks, e.g. from
+    `traces.iter_trace` or `traces.iter_lackey_trace`. Memory use is bounded by one block.
+
+    :param algorithm: BasicAlgorithm subclass or factory taking the frame count
+    :param chunks: Iterable of structured arrays with `page` and `rw` fields
+    :param frame_size: Number of frames available
+    :return: Tuple of (page faults, accesses)
+    """
+    if algorithm is OPT:
+        raise ValueError("OPT needs the whole reference string and cannot run on a stream; use LA_OPT.")
+
+    pager = Pager(algorithm(frame_size))
+    records = (record for chunk in chunks for record in zip(chunk['page'].tolist(), chunk['rw'].tolist()))
+    faults = 0
+    page_index = 0
+    if not getattr(pager.function, 'lookahead', False):
+        for page, rw in records:
+            faults += pager.access(page, rw, page_index)[0]
+            page_index += 1
+        return faults, page_index
+
+    # Keep the current reference plus `window` future ones buffered
+    window = pager.function.window
+    pending = deque(itertools.islice(records, window + 1))
+    future = deque(page for page, _ in pending)
+    while pending:
+        page, rw = pending.popleft()
+        future.popleft()
+        for record in itertools.islice(records, 1):
+            pending.append(record)
+            future.append(record[0])
+        faults += pager.access(page, rw, page_index, FutureWindow(future, page_index + 1))[0]
+        page_index += 1
+    return faults, page_index
+
+
+def trace_faults(path, algorithm_names, frame_size, trace_format = 'bin', page_size = 4096):
+    """
+    Counts the page faults of several algorithms over a trace file. The trace is streamed
+    except for OPT, which needs the whole future.
+
+    :param path: Trace file
+    :param algorithm_names: Names understood by make_algorithm
+    :param frame_size: Number of frames available
+    :param trace_format: 'bin' (see traces.save_trace) or 'lackey' (Valgrind Lackey output)
+    :param page_size: Page size in bytes used to map Lackey addresses to pages
+    :return: Tuple of (dictionary of name -> page faults, accesses)
+    """
+    from traces import open_trace, read_trace
+
+    results = {}
+    access_n = 0
+    for name in algorithm_names:
+        algorithm = make_algorithm(name)
+        if algorithm is OPT:
+            trace = read_trace(path, trace_format, page_size)
+            results[name] = run_trace(algorithm, trace['page'], trace['rw'], frame_size)
+            access_n = len(trace)
+        else:
+            results[name], access_n = run_stream(algorithm, open_trace(path, trace_format, page_size), frame_size)
+    return results, access_n
+
+
+if __name__ == '__main__':
+    import random
+
+    random.seed(42)
+    access = [random.randint(0, 79) for _ in range(20000)]
+    modify = [random.randint(0, 1) for _ in range(20000)]
+    for algorithm in [FIFO, LRU, S_CLOCK, E_CLOCK]:
+        T0 = time.perf_counter()
+        faults = run_trace(algorithm, access, modify, 16)
+        T1 = time.perf_counter()
+        print(f"{algorithm.__name__}: {faults} faults, {len(access) / (T1 - T0) / 1e6:.2f} M accesses/s")
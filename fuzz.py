@@ -0,0 +1,339 @@
+import sys
+import random
+import argparse
+import algorithms
+from algorithms import ADAPTIVE, LA_OPT, SAMPLED_LRU
+from engine import Pager, make_algorithm
+
+
+def run_reference(function):
+    """
+    Wraps a functional reference implementation (fault counts only).
+    """
+    def run(access, modify, frame_size):
+        if function is algorithms.enhanced_clock:
+            return function(access, frame_size, modify), None
+        return function(access, frame_size), None
+    return run
+
+
+def run_class(name):
+    """
+    Runs a BasicAlgorithm through the headless pager, recording the page evicted at every
+    step (-1 if none).
+    """
+    return run_instance(lambda frame_size, access: make_algorithm(name)(frame_size))
+
+
+def run_instance(build):
+    """
+    Like run_class, for algorithms whose parameters depend on the trace.
+
+    :param build: Callable (frame_size, access) -> BasicAlgorithm instance
+    """
+    def run(access, modify, frame_size):
+        pager = Pager(build(frame_size, access))
+        faults = 0
+        evictions = []
+        for page_index, (page, rw) in enumerate(zip(access, modify)):
+            fault, _, old_page = pager.access(page, rw, page_index, access)
+            faults += fault
+            evictions.append(-1 if old_page is None else old_page)
+        return faults, evictions
+    return run
+
+
+def run_batch(name):
+    """
+    Runs the batch-vectorized engine on a single row.
+    """
+    def run(access, modify, frame_size):
+        import numpy as np
+        from batch import simulate_batch
+
+        faults, evictions = simulate_batch(name, np.array([access], dtype = np.int64), frame_size,
+                                           return_evictions = True)
+        return int(faults[0]), evictions[0].tolist()
+    return run
+
+
+def run_faults_only(run):
+    """
+    Drops the evictions of an engine, for invariants that only hold for fault counts.
+    """
+    return lambda access, modify, frame_size: (run(access, modify, frame_size)[0], None)
+
+
+def run_lfu_reference(access, modify, frame_size):
+    """
+    Brute-force LFU: evicts the resident page with the fewest references since it was
+    loaded, the least recently used one among equals.
+    """
+    frames, freq, last_use = [], {}, {}
+    faults = 0
+    evictions = []
+    for page_index, page in enumerate(access):
+        old_page = -1
+        if page not in freq:
+            faults += 1
+            if len(frames) < frame_size:
+                frames.append(page)
+            else:
+                old_page = min(frames, key = lambda p: (freq[p], last_use[p]))
+                frames[frames.index(old_page)] = page
+                del freq[old_page]
+            freq[page] = 0
+        freq[page] += 1
+        last_use[page] = page_index
+        evictions.append(old_page)
+    return faults, evictions
+
+
+def run_nfu_reference(tick = 4, bits = None):
+    """
+    Brute-force NFU, or Aging with `bits`-wide counters: every clock tick updates the
+    counter of every frame at once, and a fault evicts the first slot with the smallest
+    (counter, referenced) pair.
+    """
+    def run(access, modify, frame_size):
+        frames, counter, referenced = [], [], []
+        faults = 0
+        evictions = []
+        for page_index, page in enumerate(access):
+            old_page = -1
+            if page in frames:
+                slot = frames.index(page)
+            else:
+                faults += 1
+                if len(frames) < frame_size:
+                    frames.append(page)
+                    counter.append(0)
+                    referenced.append(0)
+                    slot = len(frames) - 1
+                else:
+                    slot = min(range(frame_size), key = lambda i: (counter[i], referenced[i]))
+                    old_page = frames[slot]
+                    frames[slot], counter[slot], referenced[slot] = page, 0, 0
+            referenced[slot] = 1
+            if (page_index + 1) % tick == 0:
+                for i in range(len(frames)):
+                    if bits is None:
+                        counter[i] += referenced[i]
+                    else:
+                        counter[i] = (counter[i] >> 1) | (referenced[i] << (bits - 1))
+                    referenced[i] = 0
+            evictions.append(old_page)
+        return faults, evictions
+    return run
+
+
+def run_sampled_lru_reference(samples, seed = 0):
+    """
+    Brute-force sampled LRU without an eviction pool, drawing the same samples from the
+    same seeded generator as SAMPLED_LRU.
+    """
+    def run(access, modify, frame_size):
+        rng = random.Random(seed)
+        frames, last_use = [], []
+        faults = 0
+        evictions = []
+        for page_index, page in enumerate(access):
+            old_page = -1
+            if page in frames:
+                slot = frames.index(page)
+            else:
+                faults += 1
+                if len(frames) < frame_size:
+                    frames.append(page)
+                    last_use.append(page_index)
+                    slot = len(frames) - 1
+                else:
+                    sampled = rng.sample(range(frame_size), min(samples, frame_size))
+                    slot = min(sampled, key = last_use.__getitem__)
+                    old_page = frames[slot]
+                    frames[slot] = page
+            last_use[slot] = page_index
+            evictions.append(old_page)
+        return faults, evictions
+    return run
+
+
+def run_stack_distance(access, modify, frame_size):
+    """
+    LRU fault count read off the reuse-distance histogram of TraceAnalyzer.
+    """
+    from analysis import TraceAnalyzer
+
+    analyzer = TraceAnalyzer()
+    analyzer.feed(access, modify)
+    return analyzer.lru_faults(frame_size), None
+
+
+# Every engine of a policy must agree with the others; the first one is the reference.
+# Fault counts are compared across all engines, evictions only between the engines that
+# record them: the functional references (and run_faults_only wrappers) return None.
+ENGINES = {
+    'OPT': {'opt()': run_reference(algorithms.opt), 'OPT': run_class('OPT')},
+    'FIFO': {'fifo()': run_reference(algorithms.fifo), 'FIFO': run_class('FIFO'), 'batch FIFO': run_batch('FIFO')},
+    'LRU': {'lru()': run_reference(algorithms.lru), 'LRU': run_class('LRU'), 'batch LRU': run_batch('LRU'),
+            'stack distance': run_stack_distance, 'NUMA_LRU(4)': run_class('NUMA_LRU(4)')},
+    'S_CLOCK': {'simple_clock()': run_reference(algorithms.simple_clock), 'S_CLOCK': run_class('S_CLOCK'),
+                'batch S_CLOCK': run_batch('S_CLOCK')},
+    'E_CLOCK': {'enhanced_clock()': run_reference(algorithms.enhanced_clock), 'E_CLOCK': run_class('E_CLOCK')},
+    # With a window covering the whole trace LA_OPT is OPT, up to ties among pages never used again
+    'LA_OPT': {'OPT': run_class('OPT'),
+               'LA_OPT(full window)': run_faults_only(run_instance(
+                   lambda frame_size, access: LA_OPT(frame_size, len(access)))),
+               'LA_OPT(full window, FIFO)': run_faults_only(run_instance(
+                   lambda frame_size, access: LA_OPT(frame_size, len(access), 'FIFO')))},
+    'SAMPLED_LRU': {'sampled LRU reference': run_sampled_lru_reference(3),
+                    'SAMPLED_LRU(3)': run_class('SAMPLED_LRU(3)')},
+    # Sampling every frame is exactly LRU
+    'SAMPLED_LRU(all frames)': {'LRU': run_class('LRU'),
+                                'SAMPLED_LRU(frames)': run_instance(
+                                    lambda frame_size, access: SAMPLED_LRU(frame_size, frame_size)),
+                                'SAMPLED_LRU(frames, pool)': run_instance(
+                                    lambda frame_size, access: SAMPLED_LRU(frame_size, frame_size, 4))},
+    'LFU': {'LFU reference': run_lfu_reference, 'LFU': run_class('LFU')},
+    'NFU': {'NFU reference': run_nfu_reference(), 'NFU': run_class('NFU')},
+    'NFU(3)': {'NFU(3) reference': run_nfu_reference(3), 'NFU(3)': run_class('NFU(3)')},
+    'AGING': {'AGING reference': run_nfu_reference(bits = 8), 'AGING': run_class('AGING')},
+    'AGING(3,2)': {'AGING(3,2) reference': run_nfu_reference(3, 2), 'AGING(3,2)': run_class('AGING(3,2)')},
+    # A single candidate, or an epoch past the end of the trace, leaves the first policy live throughout
+    'ADAPTIVE': {'LRU': run_class('LRU'),
+                 'ADAPTIVE(LRU only)': run_instance(lambda frame_size, access: ADAPTIVE(frame_size, 4, 1, ['LRU'])),
+                 'ADAPTIVE(epoch past the end)': run_instance(
+                     lambda frame_size, access: ADAPTIVE(frame_size, len(access) + 1))},
+}
+
+
+def compare(engines, access, modify, frame_size):
+    """
+    Runs every engine of a policy on one trace.
+
+    :return: Description of the first disagreement, or None if all engines agree
+    """
+    results = {label: run(access, modify, frame_size) for label, run in engines.items()}
+    (base_label, (base_faults, _)), *others = results.items()
+    for label, (faults, _) in others:
+        if faults != base_faults:
+            return f"{base_label} takes {base_faults} faults, {label} takes {faults}"
+    traced = [(label, evictions) for label, (_, evictions) in results.items() if evictions is not None]
+    for (label_a, evictions_a), (label_b, evictions_b) in zip(traced, traced[1:]):
+        for page_index, (a, b) in enumerate(zip(evictions_a, evictions_b)):
+            if a != b:
+                return f"at step {page_index} {label_a} evicts {a}, {label_b} evicts {b}"
+    return None
+
+
+def minimize(engines, access, modify, frame_size):
+    """
+    Shrinks a failing case with delta debugging: the smallest failing frame count first,
+    then ddmin over the references, then clearing write bits one at a time.
+
+    :return: Tuple of (access, modify, frame_size) that still fails
+    """
+    def fails(a, m, f):
+        return bool(a) and compare(engines, a, m, f) is not None
+
+    frame_size = next(f for f in range(1, frame_size + 1) if fails(access, modify, f))
+
+    n = 2
+    while len(access) >= 2:
+        chunk = -(-len(access) // n)
+        for start in range(0, len(access), chunk):
+            a = access[:start] + access[start + chunk:]
+            m = modify[:start] + modify[start + chunk:]
+            if fails(a, m, frame_size):
+                access, modify = a, m
+                n = max(n - 1, 2)
+                break
+        else:
+            if n >= len(access):
+                break
+            n = min(n * 2, len(access))
+
+    for i in range(len(modify)):
+        if modify[i]:
+            m = modify[:i] + [0] + modify[i + 1:]
+            if fails(access, m, frame_size):
+                modify = m
+    return access, modify, frame_size
+
+
+def random_case(rng, max_pages, max_length):
+    """
+    Draws a trace mixing uniform, looping and hot-set references, with a frame count that
+    is sometimes at least the number of distinct pages (no evictions at all).
+
+    :return: Tuple of (access, modify, frame_size)
+    """
+    pages = rng.randint(1, max_pages)
+    length = rng.randint(1, max_length)
+    shape = rng.choice(['uniform', 'loop', 'hot'])
+    if shape == 'uniform':
+        access = [rng.randrange(pages) for _ in range(length)]
+    elif shape == 'loop':
+        access = [i % pages for i in range(rng.randrange(pages), length + rng.randrange(pages))][:length]
+    else:
+        hot = rng.randint(1, pages)
+        access = [rng.randrange(hot) if rng.random() < 0.8 else rng.randrange(pages) for _ in range(length)]
+    modify = [rng.randint(0, 1) for _ in access]
+    frame_size = rng.randint(1, len(set(access)) + 2)
+    return access, modify, frame_size
+
+
+def fuzz(policies, cases, seed = 0, max_pages = 12, max_length = 60):
+    """
+    Cross-checks the engines of every policy on random traces.
+
+    :param policies: Names of policies in ENGINES
+    :param cases: Number of random traces per policy
+    :param seed: Seed of the trace generator
+    :param max_pages: Largest number of distinct pages in a trace
+    :param max_length: Longest trace
+    :return: Dictionary of policy -> minimized counterexample (access, modify, frame_size, reason)
+             for the policies that failed
+    """
+    failures = {}
+    for policy in policies:
+        engines = ENGINES[policy]
+        rng = random.Random(seed)
+        for _ in range(cases):
+            access, modify, frame_size = random_case(rng, max_pages, max_length)
+            if compare(engines, access, modify, frame_size) is not None:
+                access, modify, frame_size = minimize(engines, access, modify, frame_size)
+                failures[policy] = (access, modify, frame_size, compare(engines, access, modify, frame_size))
+                break
+    return failures
+
+
+def main(args = None):
+    """
+    Fuzzes the selected policies and prints one line per policy, with the minimized
+    counterexample of each mismatch.
+
+    :param args: Command-line arguments (sys.argv when None)
+    :return: Exit status, 1 if any engines disagree
+    """
+    parser = argparse.ArgumentParser(description = 'Differential fuzzing of the replacement engines.')
+    parser.add_argument('--policy', type = str, nargs = '+', default = list(ENGINES), choices = list(ENGINES))
+    parser.add_argument('--cases', type = int, default = 2000)
+    parser.add_argument('--seed', type = int, default = 0)
+    parser.add_argument('--max_pages', type = int, default = 12)
+    parser.add_argument('--max_length', type = int, default = 60)
+    args = parser.parse_args(args)
+
+    failures = fuzz(args.policy, args.cases, args.seed, args.max_pages, args.max_length)
+    for policy in args.policy:
+        if policy not in failures:
+            print(f"{policy}: {', '.join(ENGINES[policy])} agree on {args.cases} traces")
+            continue
+        access, modify, frame_size, reason = failures[policy]
+        print(f"{policy}: MISMATCH, {reason}")
+        print(f"    frames {frame_size}, access {access}, modify {modify}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11 +1,22 @@
 import time
 import os
 from process import Process
-from algorithms import FIFO, OPT, LRU, S_CLOCK, E_CLOCK
+from algorithms import FIFO, OPT, LRU, S_CLOCK, E_CLOCK, ADAPTIVE
 from utils import *
+from engine import make_algorithm, trace_faults
+from tlb import TLB, effective_access_time
+from swap import SwapDevice
+from tiers import CompressedPool, TierChain
+from prefetch import PREFETCHERS
+from stats import StatsCollector
+from analysis import TraceAnalyzer, write_report
+from scheduler import sweep_multiprogramming, detect_thrashing
+from numa import NUMA_POLICIES, NumaTopology, NumaCost
+from sharing import simulate_sharing
+from allocation import FramePool, FixedAllocator, WorkingSetAllocator, PFFAllocator, simulate_allocation
+from workload import generate_sequences, generate_process_traces
 import argparse
 import random
-import numpy as np
 
 # Parse configuration settings using command-line arguments
 def get_config(args = None):
@@ -32,7 +43,126 @@ def get_config(args = None):
     # Define random seed for reproducibility
     parser.add_argument('--seed', type = int, default = 42)
     # Define available page replacement algorithms
-    parser.add_argument('--algorithm', type = list, default = ['OPT', 'FIFO', 'LRU', 'S_CLOCK', 'E_CLOCK'])
+    parser.add_argument('--algorithm', type = list, default = ['OPT', 'FIFO', 'LRU', 'S_CLOCK', 'E_CLOCK', 'LFU', 'NFU', 'AGING'])
+    # Define an optional recorded trace to simulate instead of random sequences
+    parser.add_argument('--trace', type = str, default = None,
+                        help = 'Path of a memory-reference trace to simulate instead of random sequences.')
+    parser.add_argument('--trace_format', type = str, default = 'bin', choices = ['bin', 'lackey'],
+                        help = 'Format of --trace: a binary page trace (see traces.py) or a Valgrind Lackey text trace.')
+    # Define the TLB model and the latencies of the effective-access-time cost model
+    parser.add_argument('--tlb_entries', type = int, default = 0,
+                        help = 'Number of TLB entries; 0 disables the TLB model.')
+    parser.add_argument('--tlb_ways', type = int, default = 4,
+                        help = 'TLB associativity (entries per set).')
+    parser.add_argument('--tlb_page_size', type = int, nargs = '+', default = [4],
+                        help = 'Page sizes mapped by a TLB entry in KB; one TLB is simulated per size (e.g. 4 2048).')
+    parser.add_argument('--mem_ns', type = float, default = 100,
+                        help = 'Memory access latency in nanoseconds.')
+    parser.add_argument('--tlb_ns', type = float, default = 1,
+                        help = 'TLB lookup latency in nanoseconds.')
+    parser.add_argument('--fault_ns', type = float, default = 8000000,
+                        help = 'Page-fault service latency in nanoseconds.')
+    parser.add_argument('--walk_levels', type = int, default = 4,
+                        help = 'Memory reads needed by a page-table walk after a TLB miss.')
+    # Define the simulated swap device
+    parser.add_argument('--swap', action = 'store_true',
+                        help = 'Simulate a swap device with dirty write-back accounting.')
+    parser.add_argument('--swap_cluster', type = int, default = 8,
+                        help = 'Number of queued write-backs issued together as clustered I/O.')
+    parser.add_argument('--io_latency_ns', type = float, default = 100000,
+                        help = 'Fixed latency of one swap I/O request in nanoseconds.')
+    parser.add_argument('--io_page_ns', type = float, default = 10000,
+                        help = 'Transfer time of one page to or from swap in nanoseconds.')
+    # Define the compressed memory tier between the frames and swap
+    parser.add_argument('--compressed_kb', type = int, default = 0,
+                        help = 'Capacity of a zswap-style compressed tier in KB (0 = off); implies --swap.')
+    parser.add_argument('--compression_ratio', type = float, default = 3.0,
+                        help = 'Mean compression ratio of the compressed tier.')
+    parser.add_argument('--compression_spread', type = float, default = 0.5,
+                        help = 'Relative spread of compressed page sizes around the mean.')
+    parser.add_argument('--compress_ns', type = float, default = 2000,
+                        help = 'Time to compress one page in nanoseconds.')
+    parser.add_argument('--decompress_ns', type = float, default = 1000,
+                        help = 'Time to decompress one page in nanoseconds.')
+    # Define the prefetcher invoked on page faults
+    parser.add_argument('--prefetch', type = str, default = None, choices = list(PREFETCHERS),
+                        help = 'Prefetch (read-ahead) policy invoked on page faults.')
+    parser.add_argument('--prefetch_window', type = int, default = 8,
+                        help = 'Maximum number of pages prefetched on one fault.')
+    # Define variable frame allocation modes compared against fixed allocation
+    parser.add_argument('--allocation', type = str, nargs = '+', default = None, choices = ['ws', 'pff'],
+                        help = 'Variable allocation policies to compare with fixed allocation (working set, PFF).')
+    parser.add_argument('--ws_window', type = int, default = 10,
+                        help = 'Working-set window (delta) in references.')
+    parser.add_argument('--pff_upper', type = float, default = 0.5,
+                        help = 'PFF fault rate above which a process gains a frame.')
+    parser.add_argument('--pff_lower', type = float, default = 0.1,
+                        help = 'PFF fault rate below which a process releases unreferenced pages.')
+    # Define the number of worker processes sharing the sequences through shared memory
+    parser.add_argument('--workers', type = int, default = 1,
+                        help = 'Worker processes for the fault sweep; sequences are shared, not copied, between them.')
+    # Define the confidence intervals and the adaptive stopping rule
+    parser.add_argument('--ci_level', type = float, default = 0.95,
+                        help = 'Confidence level of the reported fault-rate intervals.')
+    parser.add_argument('--ci_target', type = float, default = None,
+                        help = 'Stop generating sequences once every algorithm\'s fault-rate interval half-width '
+                               'is below this value (e.g. 0.01 for +-1%%); --page_seq_count is ignored.')
+    parser.add_argument('--min_seq_count', type = int, default = 5,
+                        help = 'Minimum number of sequences per process before adaptive stopping.')
+    parser.add_argument('--max_seq_count', type = int, default = 100000,
+                        help = 'Maximum number of sequences per process in adaptive mode.')
+    # Define the directory receiving recorded timelines for later replay
+    parser.add_argument('--record', type = str, default = None,
+                        help = 'Record every step into DIR/pid<N>_<algorithm> timelines for replay with recorder.py.')
+    # Define look-ahead windows of the bounded OPT variant compared against OPT
+    parser.add_argument('--lookahead', type = int, nargs = '+', default = None,
+                        help = 'Look-ahead windows of LA_OPT to add to the comparison (e.g. 8 64 512).')
+    # Define the batch-vectorized Monte Carlo mode
+    parser.add_argument('--batch', action = 'store_true',
+                        help = 'Simulate all sequences at once with the vectorized engine (FIFO, LRU, S_CLOCK only).')
+    # Define the JSON trace characterization report
+    parser.add_argument('--analyze', type = str, default = None,
+                        help = 'Write reuse distances, working set, footprint and read/write ratio as JSON to FILE (- for stdout).')
+    parser.add_argument('--analyze_sample', type = int, default = 100,
+                        help = 'Number of references between working-set samples in the report.')
+
+    # Define the live Prometheus metrics endpoint
+    parser.add_argument('--metrics_port', type = int, default = None,
+                        help = 'Serve sweep progress in Prometheus text format on 127.0.0.1:PORT/metrics (0 = any free port).')
+    # Define the discrete-event multiprogramming experiment
+    parser.add_argument('--multiprogramming', type = int, nargs = '+', default = None,
+                        help = 'Degrees of multiprogramming to schedule over max_frames frames (e.g. 1 2 4 8 16).')
+    parser.add_argument('--quantum', type = int, default = 10,
+                        help = 'References a process executes per round-robin turn.')
+    parser.add_argument('--fault_service', type = float, default = 100,
+                        help = 'Paging-device time to service a fault, in units of one reference.')
+    parser.add_argument('--horizon', type = float, default = 100000,
+                        help = 'Simulated time of each scheduler run, in units of one reference.')
+    parser.add_argument('--thrashing_drop', type = float, default = 0.2,
+                        help = 'Fall in CPU utilization from its peak that counts as thrashing.')
+    # Define the NUMA model: frames split into nodes, each process running on a home node
+    parser.add_argument('--numa_nodes', type = int, default = 0,
+                        help = 'Number of NUMA nodes the frames are split into (0 or 1 disables the model).')
+    parser.add_argument('--numa_policy', type = str, default = 'random', choices = NUMA_POLICIES,
+                        help = 'Frame allocation policy: random (topology-unaware), local (home node first) or interleave.')
+    parser.add_argument('--numa_local_ns', type = float, default = 100,
+                        help = 'Latency of an access to a frame on the home node in nanoseconds.')
+    parser.add_argument('--numa_remote_ns', type = float, default = 160,
+                        help = 'Latency of an access to a frame on another node in nanoseconds.')
+    parser.add_argument('--numa_victim', type = int, nargs = '+', default = None,
+                        help = 'Candidate counts of node-aware LRU columns (NUMA_LRU), which evict home-node pages first.')
+    parser.add_argument('--numa_evict_remote', action = 'store_true',
+                        help = 'Make the NUMA_LRU columns evict remote pages first instead.')
+    # Define the fork model: processes share leading pages copy-on-write over a global frame table
+    parser.add_argument('--shared_pages', type = int, default = None,
+                        help = 'Leading pages every process inherits copy-on-write from a common parent.')
+    # Define the adaptive meta-policy column, switching between shadow-simulated policies
+    parser.add_argument('--adaptive', action = 'store_true',
+                        help = 'Add an ADAPTIVE column that switches among LRU, S_CLOCK and FIFO by shadow simulation.')
+    parser.add_argument('--adaptive_epoch', type = int, default = 16,
+                        help = 'References between policy decisions of ADAPTIVE.')
+    parser.add_argument('--adaptive_sample', type = int, default = 1,
+                        help = 'ADAPTIVE shadows replay one page in this many (1 replays every page).')
 
     config = parser.parse_args(args)
 
@@ -44,6 +174,14 @@ def get_config(args = None):
     # Define the minimum and maximum access sequence lengths
     config.min_sequence_length = int(config.sequence_length[0])
     config.max_sequence_length = int(config.sequence_length[1])
+
+    # Every look-ahead window becomes its own LA_OPT column
+    config.algorithm = list(config.algorithm) + [f'LA_OPT({window})' for window in config.lookahead or []]
+    # Every node-aware candidate count becomes its own NUMA_LRU column
+    config.algorithm += [f'NUMA_LRU({candidates},1)' if config.numa_evict_remote else f'NUMA_LRU({candidates})'
+                         for candidates in config.numa_victim or []]
+    if config.adaptive:
+        config.algorithm.append(f'ADAPTIVE({config.adaptive_epoch},{config.adaptive_sample})')
     return config
 
 
@@ -59,27 +197,56 @@ def allocate_frames(total_frames, num_processes, frames_per_process):
     return allocations
 
 
-# Generate a random memory access sequence for testing
-def generate_access_sequence(max_page, length):
-    if max_page < 1 or length < 1:
-        raise ValueError('Both max_page and length must be greater than 0')
+# Propagate an eviction to the TLBs, the swap device and the prefetcher
+def evict_page(process, old_page, page, tlbs = None, swap = None, prefetcher = None):
+    # The evicted page loses its translation
+    for tlb in tlbs or ():
+        tlb.invalidate(old_page, page)
+    if swap is not None:
+        # Write back the victim if it is dirty
+        process.set_swap_address(old_page, swap.evict(process.pid, old_page))
+    if prefetcher is not None:
+        prefetcher.evicted(old_page)
 
-    # Generate random page access and modify bit sequences
-    access_sequence = [random.randint(0, max_page - 1) for _ in range(length)]
-    modify_bits = [random.randint(0, 1) for _ in range(length)]
 
-    return {
-        'access': access_sequence,
-        'modify': modify_bits
-    }
+# Read ahead the pages chosen by the prefetcher through the normal admission path.
+# Called before the faulting page is admitted, so the policy can never pick it as the victim
+# of a prefetched page; the faulting page then takes its frame like any demand fault.
+def prefetch_pages(process, page, page_id, function, page_list = None, tlbs = None, swap = None, prefetcher = None):
+    # Leave a frame for the faulting page
+    budget = process.frame_size - 1
+    for next_page in prefetcher.on_fault(page, page_id):
+        if budget <= 0:
+            break
+        if not 0 <= next_page < process.total_pages or next_page == page:
+            continue
+        if next_page in process.page_table and process.page_table[next_page][2] == 1:
+            continue
+        frame_id, old_page = function.step((next_page, 0), page_id, page_list)
+        process.frame[frame_id] = next_page
+        if old_page is not None:
+            evict_page(process, old_page, next_page, tlbs, swap, prefetcher)
+        process.update_page_table((next_page, 0), frame_id, old_page, accessed = False)
+        if swap is not None:
+            process.set_swap_address(next_page, swap.page_in(process.pid, next_page))
+        function.update((next_page, 0), page_id)
+        prefetcher.admitted(next_page)
+        budget -= 1
 
 
 # Perform a single step in page processing
-def process_page_step(process, pages, function, page_list = None):
+def process_page_step(process, pages, function, page_list = None, tlbs = None, swap = None, prefetcher = None,
+                      recorder = None):
     page_id, (page, rw) = pages
     if page >= process.total_pages:
         raise ValueError(f"Page {page} exceeds process total pages {process.total_pages}")
 
+    # Translate through the TLBs before consulting the page table
+    for tlb in tlbs or ():
+        tlb.lookup(page)
+    if prefetcher is not None:
+        prefetcher.observe(page, page_id)
+
     # Check if the page exists in the page table
     page_table = process.page_table
     page_data = page_table[page]
@@ -87,9 +254,13 @@ def process_page_step(process, pages, function, page_list = None):
     old_page = None
 
     if page_data is None or page_data[2] == 0:
-        # Page not in memory, trigger page fault
+        # Page not in memory, trigger page fault; read ahead first so the faulting page stays resident
+        if prefetcher is not None:
+            prefetch_pages(process, page, page_id, function, page_list, tlbs, swap, prefetcher)
         frame_id, old_page = function.step((page, rw), page_id, page_list)
         process.frame[frame_id] = page
+        if old_page is not None:
+            evict_page(process, old_page, page, tlbs, swap, prefetcher)
         out = 1
     else:
         # Page already in memory
@@ -98,20 +269,314 @@ def process_page_step(process, pages, function, page_list = None):
 
     # Update the page table and algorithm state
     process.update_page_table((page, rw), frame_id, old_page)
+    if swap is not None:
+        # Read the faulting page in
+        if out:
+            process.set_swap_address(page, swap.page_in(process.pid, page))
+        swap.access(process.pid, page, rw)
     function.update((page, rw), page_id)
     process.update_table((page, rw), out)
+
+    if recorder is not None:
+        recorder.record(page, rw, out, frame_id, old_page, process, function)
     return out
 
 
+# Build the TLB rows of the fault table, including the effective access time
+def tlb_rows(config, alg_tlbs, results, access_n):
+    rows = {}
+    for i, size in enumerate(config.tlb_page_size if config.tlb_entries > 0 else []):
+        miss_title = f"TLB misses ({size}KB)"
+        eat_title = f"Effective access time ({size}KB)"
+        rows[miss_title] = {}
+        rows[eat_title] = {}
+        for algorithm, tlbs in alg_tlbs.items():
+            misses = tlbs[i].misses
+            eat = effective_access_time(access_n, misses, results[algorithm], config.mem_ns, config.tlb_ns,
+                                        config.fault_ns, config.walk_levels)
+            rows[miss_title][algorithm] = f"{misses} ({misses / access_n * 100:.2f}%)"
+            rows[eat_title][algorithm] = f"{eat:.1f}ns"
+    return rows
+
+
+# Build the swap I/O rows of the fault table
+def swap_rows(alg_swaps):
+    rows = {}
+    if any(swap is None for swap in alg_swaps.values()):
+        return rows
+    rows["Page-ins"] = {alg: f"{swap.page_ins} (+{swap.cache_hits} cached)" for alg, swap in alg_swaps.items()}
+    rows["Dirty write-backs"] = {alg: f"{swap.write_backs} ({swap.write_ios} I/Os)" for alg, swap in alg_swaps.items()}
+    rows["I/O volume"] = {alg: f"{swap.io_bytes() / 1024:.0f}KB" for alg, swap in alg_swaps.items()}
+    rows["Simulated I/O time"] = {alg: f"{swap.io_time_ns / 1e6:.2f}ms" for alg, swap in alg_swaps.items()}
+    return rows
+
+
+# Build the per-tier rows of the fault table: where faults were served and what they cost
+def tier_rows(config, alg_tiers, results, access_n):
+    rows = {}
+    if any(chain is None for chain in alg_tiers.values()):
+        return rows
+    rows["RAM hits"] = {alg: access_n - results[alg] for alg in alg_tiers}
+    rows["Compressed-tier hits"] = {alg: chain.pool.hits for alg, chain in alg_tiers.items()}
+    rows["Swap-ins"] = {alg: chain.swap.page_ins + chain.swap.cache_hits for alg, chain in alg_tiers.items()}
+    rows["Zero-fills"] = {alg: chain.swap.zero_fills for alg, chain in alg_tiers.items()}
+    rows["Compressed rejects/write-backs"] = {alg: f"{chain.pool.rejects}/{chain.pool.write_backs}"
+                                              for alg, chain in alg_tiers.items()}
+    rows["Compressed tier peak"] = {alg: f"{chain.pool.peak / 1024:.1f}KB" for alg, chain in alg_tiers.items()}
+    rows["Simulated latency"] = {alg: f"{(access_n * config.mem_ns + chain.time_ns()) / 1e6:.2f}ms"
+                                 for alg, chain in alg_tiers.items()}
+    return rows
+
+
+# Build the NUMA rows of the fault table: remote accesses and what memory latency they cost
+def numa_rows(config, alg_numa, results, access_n):
+    rows = {}
+    if any(cost is None for cost in alg_numa.values()):
+        return rows
+    rows["Remote accesses"] = {alg: f"{cost.remote} ({cost.remote / access_n * 100:.2f}%)"
+                               for alg, cost in alg_numa.items()}
+    rows["Mean memory latency"] = {alg: f"{cost.mean_latency():.1f}ns" for alg, cost in alg_numa.items()}
+    rows["NUMA effective access time"] = {
+        alg: f"{(cost.latency_ns + results[alg] * config.fault_ns) / access_n:.1f}ns" for alg, cost in alg_numa.items()}
+    return rows
+
+
+# Build the rows of the adaptive meta-policy: its switches and its gain over every other column
+def adaptive_rows(results, alg_switches):
+    rows = {}
+    for adaptive, switches in alg_switches.items():
+        faults = results[adaptive]
+        rows[f"{adaptive} switches"] = {adaptive: switches}
+        rows[f"{adaptive} fault reduction"] = {
+            alg: f"{(fault - faults) / fault * 100:+.2f}%" if fault else '-'
+            for alg, fault in results.items() if alg != adaptive}
+    return rows
+
+
+# Build the row showing how far each algorithm is from OPT (only with bounded look-ahead columns)
+def opt_gap_rows(results):
+    if 'OPT' not in results or not any(alg.startswith('LA_OPT') for alg in results):
+        return {}
+    opt = results['OPT']
+    return {"Faults over OPT": {alg: f"+{(fault - opt) / opt * 100:.2f}%" if opt else '-' for alg, fault in results.items()}}
+
+
+# Build the confidence-interval rows of the fault table
+def stats_rows(collector, seq_n):
+    pooled = collector.by_algorithm()
+    return {
+        f"Mean sequence fault rate ({collector.level * 100:.0f}% CI)": {
+            alg: f"{stats.mean * 100:.2f}% ± {stats.half_width(collector.level) * 100:.2f}%" for alg, stats in pooled.items()},
+        "Sequences per process": {alg: seq_n for alg in pooled},
+    }
+
+
+# Build the prefetch rows of the fault table
+def prefetch_rows(alg_prefetchers, results):
+    rows = {}
+    if any(prefetcher is None for prefetcher in alg_prefetchers.values()):
+        return rows
+    rows["Prefetched pages"] = {alg: p.issued for alg, p in alg_prefetchers.items()}
+    rows["Faults avoided"] = {alg: p.useful for alg, p in alg_prefetchers.items()}
+    rows["Prefetch accuracy"] = {alg: f"{p.accuracy() * 100:.2f}%" for alg, p in alg_prefetchers.items()}
+    rows["Prefetch coverage"] = {alg: f"{p.coverage(results[alg]) * 100:.2f}%" for alg, p in alg_prefetchers.items()}
+    return rows
+
+
+# Compare fixed allocation with working-set / PFF variable allocation over a shared frame pool
+def compare_allocation(config):
+    # One long trace per process, built from page_seq_count random sequences
+    traces = generate_process_traces(config.pid_num, config.page_seq_count, config.max_pages,
+                                     config.min_sequence_length, config.max_sequence_length)
+    access_n = sum(len(access) for access, _ in traces)
+
+    allocators = {'FIXED': lambda pool: FixedAllocator(pool, config.frame_per_process)}
+    if 'ws' in config.allocation:
+        allocators['WS'] = lambda pool: WorkingSetAllocator(pool, config.ws_window)
+    if 'pff' in config.allocation:
+        allocators['PFF'] = lambda pool: PFFAllocator(pool, config.pff_upper, config.pff_lower)
+
+    results = {}
+    histories = {}
+    for name, build in allocators.items():
+        process_list = [Process(pid, [], config.logic_size, config.page_size) for pid in range(config.pid_num)]
+        allocator = build(FramePool(range(config.max_frames)))
+        faults, history = simulate_allocation(allocator, process_list, traces, sample_every = config.max_sequence_length)
+        results[name] = sum(faults)
+        histories[name] = history
+
+    rows = {}
+    for pid in range(config.pid_num):
+        rows[f"PID {pid} frames (avg/max)"] = {
+            name: f"{sum(h[1][pid] for h in history) / len(history):.1f}/{max(h[1][pid] for h in history)}"
+            for name, history in histories.items()}
+    rows["Peak frames in use"] = {name: max(sum(h[1]) for h in history) for name, history in histories.items()}
+    show_fault_table(results, access_n, rows)
+    show_frame_history(histories)
+
+
+# Schedule a rising number of processes over the same memory and find where thrashing begins
+def compare_multiprogramming(config):
+    # One trace per process, built from page_seq_count random sequences; processes loop over it
+    traces = generate_process_traces(max(config.multiprogramming), config.page_seq_count, config.max_pages,
+                                     config.min_sequence_length, config.max_sequence_length)
+
+    degrees = sorted(set(config.multiprogramming))
+    sweeps = {}
+    onsets = {}
+    for algorithm in config.algorithm:
+        sweeps[algorithm] = sweep_multiprogramming(algorithm, traces, config.max_frames, degrees, config.horizon,
+                                                   quantum = config.quantum, fault_time = config.fault_service)
+        onsets[algorithm] = detect_thrashing(sweeps[algorithm], config.thrashing_drop)
+    show_schedule_table(sweeps, onsets)
+
+
+# Run the processes as one forked group sharing pages copy-on-write, against fully duplicated memory
+def compare_sharing(config):
+    # One long trace per process, built from page_seq_count random sequences
+    traces = generate_process_traces(config.pid_num, config.page_seq_count, config.max_pages,
+                                     config.min_sequence_length, config.max_sequence_length)
+    access_n = sum(len(access) for access, _ in traces)
+
+    # The whole machine's frames form one global frame table
+    frames = config.frame_per_process * config.pid_num
+    results = {}
+    rows = {"Faults without sharing": {}, "COW faults": {}, "Duplicate pages avoided (mean/peak)": {}}
+    for algorithm in config.algorithm:
+        shared = simulate_sharing(algorithm, traces, frames, config.max_pages, config.shared_pages)
+        private = simulate_sharing(algorithm, traces, frames, config.max_pages, 0)
+        results[algorithm] = shared['faults']
+        rows["Faults without sharing"][algorithm] = private['faults']
+        rows["COW faults"][algorithm] = f"{shared['cow_faults']} ({shared['cow_faults'] / access_n * 100:.2f}%)"
+        rows["Duplicate pages avoided (mean/peak)"][algorithm] = (f"{shared['mean_duplicates_avoided']:.1f}/"
+                                                                  f"{shared['peak_duplicates_avoided']}")
+    show_fault_table(results, access_n, rows)
+
+
+# Sequences of the fault sweep, drawn from their own stream seeded with config.seed so they do
+# not depend on the frame allocation; cli.py generates the same ones
+def sweep_sequences(config, rounds = None):
+    return generate_sequences(config.pid_num, config.max_pages, config.min_sequence_length,
+                              config.max_sequence_length, rounds, random.Random(config.seed))
+
+
+# Run the fault sweep in worker processes that read the sequences from shared memory
+def simulate_shared(config, metrics = None):
+    from shared_trace import SharedTraceStore, run_shared_sweep
+
+    # The sequential sweep's sequences, in its order
+    traces = [(access, modify) for _, access, modify in sweep_sequences(config, config.page_seq_count)]
+
+    store = SharedTraceStore.create(traces)
+    try:
+        faults = run_shared_sweep(store, config.algorithm, config.frame_per_process, config.workers, metrics)
+    finally:
+        store.close()
+    results = {algorithm: sum(faults[algorithm]) for algorithm in config.algorithm}
+
+    # Per-sequence fault rates, pushed in the order the sequential sweep pushes them
+    collector = StatsCollector(config.ci_level)
+    for index, (access, _) in enumerate(traces):
+        for algorithm in config.algorithm:
+            collector.push(algorithm, index % config.pid_num, config.frame_per_process,
+                           faults[algorithm][index] / len(access))
+    return results, sum(len(access) for access, _ in traces), collector
+
+
+# Simulate every sequence of every process at once with the batch-vectorized engine
+def simulate_batched(config):
+    from batch import BATCH_ALGORITHMS, pad_batch, simulate_batch
+
+    skipped = [alg for alg in config.algorithm if alg not in BATCH_ALGORITHMS]
+    if skipped:
+        print(f"--batch has no vectorized engine for {', '.join(skipped)}; they are skipped.")
+    # The sequential sweep's sequences, so both report the same fault counts
+    pages, lengths = pad_batch([access for _, access, _ in sweep_sequences(config, config.page_seq_count)])
+    results = {alg: int(simulate_batch(alg, pages, config.frame_per_process).sum())
+               for alg in config.algorithm if alg in BATCH_ALGORITHMS}
+    return results, int(lengths.sum())
+
+
+# Simulate a recorded trace with every algorithm through the headless engine
+def simulate_trace_file(config):
+    return trace_faults(config.trace, config.algorithm, config.frame_per_process, config.trace_format,
+                        config.page_size)
+
+
+# Characterize a recorded trace in one streamed pass
+def analyze_trace_file(config):
+    from traces import open_trace
+
+    analyzer = TraceAnalyzer(config.ws_window, config.analyze_sample)
+    for chunk in open_trace(config.trace, config.trace_format, config.page_size):
+        analyzer.feed(chunk['page'], chunk['rw'])
+    return {'trace': config.trace, **analyzer.report()}
+
+
 # Main function for simulating memory management and page replacement
-def main():
+def main(args = None):
     # Load configuration and initialize random seeds
-    config = get_config()
+    config = get_config(args)
     random.seed(config.seed)
-    np.random.seed(config.seed)
 
-    # Allocate frames to processes
-    Process_allocations = allocate_frames(config.max_frames, config.pid_num, config.frame_per_process)
+    if config.trace is not None:
+        if (config.tlb_entries > 0 or config.swap or config.compressed_kb > 0 or config.prefetch is not None
+                or config.numa_nodes > 1 or config.ci_target is not None or config.record is not None
+                or config.workers > 1 or config.batch or config.metrics_port is not None):
+            raise ValueError('--trace only runs the headless fault sweep; TLB, swap, tier, prefetch and NUMA models, '
+                             '--ci_target, --record, --workers, --batch and --metrics_port need generated sequences')
+        results, access_n = simulate_trace_file(config)
+        show_fault_table(results, access_n, opt_gap_rows(results))
+        if config.analyze is not None:
+            write_report(analyze_trace_file(config), config.analyze)
+        return
+    if config.allocation is not None:
+        compare_allocation(config)
+        return
+    if config.multiprogramming is not None:
+        compare_multiprogramming(config)
+        return
+    if config.shared_pages is not None:
+        compare_sharing(config)
+        return
+    if config.batch:
+        results, access_n = simulate_batched(config)
+        show_fault_table(results, access_n)
+        return
+
+    # Allocate frames to processes, node by node when modelling a NUMA machine
+    numa = None
+    if config.numa_nodes > 1:
+        numa = NumaTopology(config.max_frames, config.numa_nodes, config.numa_local_ns, config.numa_remote_ns)
+        Process_allocations = numa.allocate(config.pid_num, config.frame_per_process, config.numa_policy)
+        remote = sum(numa.is_remote(pid, frame) for pid, frames in Process_allocations.items() for frame in frames)
+        print(f"NUMA {config.numa_policy} allocation: {remote} of {config.pid_num * config.frame_per_process} "
+              f"frames are remote to their process")
+    else:
+        Process_allocations = allocate_frames(config.max_frames, config.pid_num, config.frame_per_process)
+
+    # Serve live progress of the sweep from a background thread
+    metrics = None
+    if config.metrics_port is not None:
+        from metrics import SweepMetrics, MetricsServer
+
+        seq_limit = config.page_seq_count if config.ci_target is None else config.max_seq_count
+        metrics = SweepMetrics(config.algorithm, seq_limit * config.pid_num * len(config.algorithm))
+        print(f"Serving metrics at {MetricsServer(metrics, config.metrics_port).start().url}")
+
+    # Fan the fault sweep out to worker processes over shared-memory sequences
+    if config.workers > 1:
+        if (config.tlb_entries > 0 or config.swap or config.compressed_kb > 0 or config.prefetch is not None
+                or numa is not None or config.ci_target is not None or config.record is not None
+                or config.analyze is not None or config.adaptive):
+            raise ValueError('--workers only runs the fault sweep; TLB, swap, tier, prefetch and NUMA models, '
+                             '--ci_target, --record, --analyze and --adaptive need --workers 1')
+        results, access_n, collector = simulate_shared(config, metrics)
+        extra_rows = opt_gap_rows(results)
+        extra_rows.update(stats_rows(collector, config.page_seq_count))
+        show_fault_table(results, access_n, extra_rows)
+        return
+
     Process_list = []
 
     # Create a list of process objects
@@ -123,29 +588,127 @@ def main():
     results = {algorithm: 0 for algorithm in algorithms}
     access_n = 0
 
+    # Each algorithm gets its own TLBs, one per simulated TLB page size
+    alg_tlbs = {algorithm: [] for algorithm in algorithms}
+    if config.tlb_entries > 0:
+        for algorithm in algorithms:
+            alg_tlbs[algorithm] = [TLB(config.tlb_entries, config.tlb_ways, size * 1024, config.page_size)
+                                   for size in config.tlb_page_size]
+    # Each algorithm gets its own swap device
+    alg_swaps = {algorithm: None for algorithm in algorithms}
+    if config.swap:
+        for algorithm in algorithms:
+            alg_swaps[algorithm] = SwapDevice(config.page_size, config.swap_cluster, config.io_latency_ns,
+                                              config.io_page_ns)
+    # A compressed tier sits between the frames and each algorithm's swap device
+    alg_tiers = {algorithm: None for algorithm in algorithms}
+    if config.compressed_kb > 0:
+        for algorithm in algorithms:
+            alg_swaps[algorithm] = alg_swaps[algorithm] or SwapDevice(config.page_size, config.swap_cluster,
+                                                                      config.io_latency_ns, config.io_page_ns)
+            pool = CompressedPool(config.compressed_kb * 1024, config.page_size, config.compression_ratio,
+                                  config.compression_spread, compress_ns = config.compress_ns,
+                                  decompress_ns = config.decompress_ns)
+            alg_tiers[algorithm] = TierChain(pool, alg_swaps[algorithm])
+    # Each algorithm gets its own prefetcher
+    alg_prefetchers = {algorithm: None for algorithm in algorithms}
+    if config.prefetch is not None:
+        for algorithm in algorithms:
+            alg_prefetchers[algorithm] = PREFETCHERS[config.prefetch](config.prefetch_window)
+    # Policy switches of every adaptive column
+    alg_switches = {algorithm: 0 for algorithm in algorithms if algorithm.startswith('ADAPTIVE')}
+    # Each algorithm gets its own NUMA latency account
+    alg_numa = {algorithm: None if numa is None else NumaCost(numa) for algorithm in algorithms}
+
+    # One timeline per process and algorithm when recording
+    recorders = {}
+    if config.record is not None:
+        from recorder import TimelineRecorder
+
+        for tmp_process in Process_list:
+            for algorithm in algorithms:
+                path = os.path.join(config.record, f"pid{tmp_process.pid}_{algorithm}")
+                recorders[(tmp_process.pid, algorithm)] = TimelineRecorder(path, tmp_process, algorithm)
+
+    # One trace analyzer per process; each sequence restarts the process cold
+    analyzers = {}
+    if config.analyze is not None:
+        analyzers = {p.pid: TraceAnalyzer(config.ws_window, config.analyze_sample) for p in Process_list}
+
+    # Running fault-rate statistics per algorithm, process and frame count
+    collector = StatsCollector(config.ci_level)
+    seq_limit = config.page_seq_count if config.ci_target is None else config.max_seq_count
+    seq_n = 0
+    sequences = sweep_sequences(config)
+
     # Simulate multiple page sequences
-    for _ in range(config.page_seq_count):
+    for seq_n in range(1, seq_limit + 1):
         for tmp_process in Process_list:
-            # Generate access sequences
-            length = random.randint(config.min_sequence_length, config.max_sequence_length)
-            tmp_access_pages = generate_access_sequence(config.max_pages, length)
-            page_access = tmp_access_pages['access']
-            page_modify = tmp_access_pages['modify']
+            # Take the process's next access sequence
+            _, page_access, page_modify = next(sequences)
+            length = len(page_access)
 
             access_n += length
+            if analyzers:
+                analyzers[tmp_process.pid].restart()
+                analyzers[tmp_process.pid].feed(page_access, page_modify)
 
             for algorithm in algorithms:
                 # Reset process and use specified algorithm
                 tmp_process.reset()
-                alg_fun = eval(algorithm)(tmp_process.frame_size)
+                alg_fun = make_algorithm(algorithm)(tmp_process.frame_size)
+                if numa is not None and hasattr(alg_fun, 'set_remote'):
+                    # Node-aware policies learn which of the process's frames are remote
+                    alg_fun.set_remote(numa.is_remote(tmp_process.pid, frame) for frame in tmp_process.frame_list)
+                for tlb in alg_tlbs[algorithm]:
+                    tlb.flush()  # A new address space starts with a cold TLB
+                if alg_prefetchers[algorithm] is not None:
+                    alg_prefetchers[algorithm].flush()
+                recorder = recorders.get((tmp_process.pid, algorithm))
+                if recorder is not None:
+                    recorder.new_sequence()
 
                 # Simulate each page access
+                seq_faults = 0
+                T0 = time.perf_counter()
                 for alg_pages in enumerate(zip(page_access, page_modify)):
-                    fault = process_page_step(tmp_process, alg_pages, alg_fun, page_access)
-                    results[algorithm] += fault
+                    fault = process_page_step(tmp_process, alg_pages, alg_fun, page_access, alg_tlbs[algorithm],
+                                              alg_tiers[algorithm] or alg_swaps[algorithm],
+                                              alg_prefetchers[algorithm], recorder)
+                    seq_faults += fault
+                    if alg_numa[algorithm] is not None:
+                        alg_numa[algorithm].access(tmp_process.pid, tmp_process.page_table[alg_pages[1][0]][1])
+                results[algorithm] += seq_faults
+                if isinstance(alg_fun, ADAPTIVE):
+                    alg_switches[algorithm] += len(alg_fun.switches)
+                if metrics is not None:
+                    metrics.record(algorithm, length, seq_faults, time.perf_counter() - T0)
+                collector.push(algorithm, tmp_process.pid, tmp_process.frame_size, seq_faults / length)
+                if alg_swaps[algorithm] is not None:
+                    (alg_tiers[algorithm] or alg_swaps[algorithm]).release(tmp_process.pid)  # The next sequence starts a fresh address space
+
+        # Stop once every algorithm's fault rate is known precisely enough
+        if config.ci_target is not None and seq_n >= config.min_seq_count and collector.converged(config.ci_target):
+            break
+
+    for recorder in recorders.values():
+        recorder.close()
 
     # Display results
-    show_fault_table(results, access_n)
+    extra_rows = tlb_rows(config, alg_tlbs, results, access_n)
+    extra_rows.update(swap_rows(alg_swaps))
+    extra_rows.update(tier_rows(config, alg_tiers, results, access_n))
+    extra_rows.update(prefetch_rows(alg_prefetchers, results))
+    extra_rows.update(numa_rows(config, alg_numa, results, access_n))
+    extra_rows.update(opt_gap_rows(results))
+    extra_rows.update(adaptive_rows(results, alg_switches))
+    extra_rows.update(stats_rows(collector, seq_n))
+    show_fault_table(results, access_n, extra_rows)
+    if config.ci_target is not None:
+        show_stats_table(collector)
+    if analyzers:
+        write_report({f'pid{pid}': {'frames': Process_list[pid].frame_size, **analyzer.report()}
+                      for pid, analyzer in analyzers.items()}, config.analyze)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+import os
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Resident set size of the calling process in bytes (peak RSS where /proc is unavailable)
+def current_rss():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class SweepMetrics:
+    """
+    Progress counters of a running sweep. The simulation updates them once per simulated
+    sequence (never per access), and the metrics endpoint renders them on request.
+    """
+
+    def __init__(self, algorithms, jobs_total = 0):
+        """
+        :param algorithms: Algorithm names being compared
+        :param jobs_total: Number of (sequence, algorithm) jobs planned
+        """
+        self.start = time.time()
+        self.jobs_total = jobs_total
+        self.jobs_done = 0
+        self.accesses = {algorithm: 0 for algorithm in algorithms}
+        self.faults = {algorithm: 0 for algorithm in algorithms}
+        self.seconds = {algorithm: 0.0 for algorithm in algorithms}
+        self.worker_rss = {}  # worker pid -> resident bytes at its last report
+
+    def record(self, algorithm, accesses, faults, seconds, pid = None, rss = None):
+        """
+        Adds one finished job.
+
+        :param algorithm: Algorithm name
+        :param accesses: Accesses simulated by the job
+        :param faults: Faults taken
+        :param seconds: Time the job took
+        :param pid: Process that ran the job (this process if None)
+        :param rss: Resident bytes of that process, if it reported them
+        """
+        self.accesses[algorithm] += accesses
+        self.faults[algorithm] += faults
+        self.seconds[algorithm] += seconds
+        self.jobs_done += 1
+        if rss is not None:
+            self.worker_rss[pid if pid is not None else os.getpid()] = rss
+
+    def render(self):
+        """
+        :return: The metrics in the Prometheus text exposition format
+        """
+        accesses, faults, seconds = dict(self.accesses), dict(self.faults), dict(self.seconds)
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ','.join(f'{key}="{val}"' for key, val in labels.items())
+                lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+
+        metric('pagesim_elapsed_seconds', 'gauge', 'Wall time since the sweep started.',
+               [({}, f"{time.time() - self.start:.3f}")])
+        metric('pagesim_jobs_completed', 'counter', 'Simulated (sequence, algorithm) jobs finished.',
+               [({}, self.jobs_done)])
+        metric('pagesim_jobs_remaining', 'gauge', 'Planned jobs not yet finished.',
+               [({}, max(self.jobs_total - self.jobs_done, 0))])
+        metric('pagesim_accesses_total', 'counter', 'Page accesses simulated.',
+               [({'algorithm': alg}, n) for alg, n in accesses.items()])
+        metric('pagesim_faults_total', 'counter', 'Page faults taken.',
+               [({'algorithm': alg}, n) for alg, n in faults.items()])
+        metric('pagesim_fault_rate', 'gauge', 'Faults per access so far.',
+               [({'algorithm': alg}, f"{faults[alg] / n:.6f}" if n else 0) for alg, n in accesses.items()])
+        metric('pagesim_accesses_per_second', 'gauge', 'Simulation speed while running each algorithm.',
+               [({'algorithm': alg}, f"{accesses[alg] / s:.1f}" if s else 0) for alg, s in seconds.items()])
+        rss = dict(self.worker_rss)
+        rss[os.getpid()] = current_rss()
+        metric('pagesim_worker_resident_bytes', 'gauge', 'Resident memory of each simulating process.',
+               [({'pid': pid}, value) for pid, value in sorted(rss.items())])
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsServer:
+    """
+    Serves SweepMetrics at http://host:port/metrics from a daemon thread.
+    It binds to localhost by default and needs no network access.
+    """
+
+    def __init__(self, metrics, port = 9100, host = '127.0.0.1'):
+        """
+        :param metrics: SweepMetrics to expose
+        :param port: TCP port (0 picks a free one)
+        :param host: Interface to bind
+        """
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep the simulation output clean
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target = self.httpd.serve_forever, daemon = True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+if __name__ == '__main__':
+    from urllib.request import urlopen
+
+    metrics = SweepMetrics(['FIFO', 'LRU'], jobs_total = 4)
+    metrics.record('FIFO', 1000, 420, 0.01, rss = current_rss())
+    metrics.record('LRU', 1000, 390, 0.02, rss = current_rss())
+    server = MetricsServer(metrics, port = 0).start()
+    print(urlopen(server.url).read().decode())
+    server.stop()
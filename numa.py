@@ -0,0 +1,140 @@
+import random
+
+
+# Frame allocation policies of NumaTopology.allocate
+NUMA_POLICIES = ['random', 'local', 'interleave']
+
+
+class NumaTopology:
+    """
+    Multi-socket memory model: physical frames are split into contiguous nodes, every
+    process runs on a home node (pid modulo the node count), and an access costs the
+    local latency on the home node and the remote latency (or a distance-matrix entry)
+    anywhere else.
+    """
+
+    def __init__(self, total_frames, nodes = 2, local_ns = 100, remote_ns = 160, distances = None):
+        """
+        :param total_frames: Number of physical frames
+        :param nodes: Number of NUMA nodes
+        :param local_ns: Latency of an access to the home node
+        :param remote_ns: Latency of an access to any other node
+        :param distances: Optional nodes x nodes latency matrix overriding local_ns/remote_ns
+        """
+        if nodes < 1 or nodes > total_frames:
+            raise ValueError('nodes must be between 1 and the number of frames')
+        self.total_frames = total_frames
+        self.nodes = nodes
+        if distances is None:
+            distances = [[local_ns if i == j else remote_ns for j in range(nodes)] for i in range(nodes)]
+        self.distances = distances
+
+    def node_of(self, frame):
+        """
+        :return: Node holding a physical frame
+        """
+        return frame * self.nodes // self.total_frames
+
+    def home_node(self, pid):
+        """
+        :return: Node whose CPUs run the process
+        """
+        return pid % self.nodes
+
+    def latency(self, pid, frame):
+        """
+        :return: Latency of an access by the process to the frame
+        """
+        return self.distances[self.home_node(pid)][self.node_of(frame)]
+
+    def is_remote(self, pid, frame):
+        return self.node_of(frame) != self.home_node(pid)
+
+    def allocate(self, num_processes, frames_per_process, policy = 'random'):
+        """
+        Gives every process its frames. All policies draw the same shuffle from `random`,
+        so 'random' matches the topology-unaware allocation exactly.
+
+        :param num_processes: Number of processes
+        :param frames_per_process: Frames per process
+        :param policy: 'random' (ignore topology), 'local' (home node first, then the
+                       nearest nodes) or 'interleave' (round-robin over nodes from home)
+        :return: Dictionary of pid -> list of frames
+        """
+        if policy not in NUMA_POLICIES:
+            raise ValueError(f"Unknown NUMA policy {policy}; choose from {', '.join(NUMA_POLICIES)}")
+        all_frames = list(range(self.total_frames))
+        random.shuffle(all_frames)
+        if policy == 'random':
+            return {pid: all_frames[pid * frames_per_process:(pid + 1) * frames_per_process]
+                    for pid in range(num_processes)}
+
+        free = [[] for _ in range(self.nodes)]
+        for frame in all_frames:
+            free[self.node_of(frame)].append(frame)
+        allocations = {}
+        for pid in range(num_processes):
+            home = self.home_node(pid)
+            if policy == 'local':
+                order = sorted(range(self.nodes), key = lambda node: self.distances[home][node])
+            else:
+                order = [(home + i) % self.nodes for i in range(self.nodes)]
+            frames = []
+            while len(frames) < frames_per_process:
+                available = [node for node in order if free[node]]
+                if not available:
+                    raise ValueError('Not enough frames for every process')
+                if policy == 'local':
+                    frames.append(free[available[0]].pop(0))
+                else:
+                    # One frame per node per round, keeping the round-robin position
+                    node = order[len(frames) % self.nodes]
+                    frames.append(free[node if free[node] else available[0]].pop(0))
+            allocations[pid] = frames
+        return allocations
+
+
+class NumaCost:
+    """
+    Per-access memory latency accounting of one algorithm under a NUMA topology.
+    """
+
+    def __init__(self, topology):
+        """
+        :param topology: NumaTopology the frames belong to
+        """
+        self.topology = topology
+        self.local = 0
+        self.remote = 0
+        self.latency_ns = 0
+
+    def access(self, pid, frame):
+        """
+        Charges one access by a process to the frame holding its page.
+
+        :param pid: Process ID
+        :param frame: Physical frame number
+        """
+        self.latency_ns += self.topology.latency(pid, frame)
+        if self.topology.is_remote(pid, frame):
+            self.remote += 1
+        else:
+            self.local += 1
+
+    def accesses(self):
+        return self.local + self.remote
+
+    def mean_latency(self):
+        """
+        :return: Mean memory latency per access in nanoseconds
+        """
+        return self.latency_ns / self.accesses() if self.accesses() else 0.0
+
+
+if __name__ == '__main__':
+    random.seed(42)
+    topology = NumaTopology(32, nodes = 4)
+    for policy in NUMA_POLICIES:
+        allocations = topology.allocate(4, 6, policy)
+        remote = sum(topology.is_remote(pid, frame) for pid, frames in allocations.items() for frame in frames)
+        print(f"{policy:>10}: {remote}/24 remote frames, pid 0 nodes {[topology.node_of(f) for f in allocations[0]]}")
@@ -0,0 +1,134 @@
+import math
+
+
+class PageTable:
+    """
+    Hierarchical page table, radix-tree style: the page number is split into `levels`
+    index fields, and each level's table is only allocated when a page under it is
+    touched. Memory therefore follows the touched footprint, so even a 48-bit address
+    space costs nothing until it is used.
+
+    Rows keep the flat table's layout, [page, frame, P, A, M, swap address], and
+    `page_table[page]` creates a row on first use; `unmap` removes it and reclaims the
+    tables it leaves empty. Iterating yields the populated rows in page order, which is
+    what the page table views display.
+    """
+
+    __slots__ = ('total_pages', 'levels', 'bits', 'fanout', 'mask', 'shifts', 'root', 'tables', 'populated')
+
+    def __init__(self, total_pages, levels = 4):
+        """
+        :param total_pages: Number of pages in the logical address space
+        :param levels: Number of table levels
+        """
+        self.total_pages = total_pages
+        page_bits = max(1, (total_pages - 1).bit_length())
+        self.levels = max(1, min(levels, page_bits))
+        self.bits = math.ceil(page_bits / self.levels)  # Index bits per level
+        self.fanout = 1 << self.bits
+        self.mask = self.fanout - 1
+        self.shifts = [self.bits * (self.levels - 1 - level) for level in range(self.levels)]
+        self.root = [None] * self.fanout
+        self.tables = 1  # Allocated tables, the root included
+        self.populated = 0
+
+    @staticmethod
+    def new_row(page):
+        return [str(page), -1, 0, 0, -1, "-"]
+
+    def __check(self, page):
+        if not 0 <= page < self.total_pages:
+            raise IndexError(f"Page {page} out of range [0, {self.total_pages})")
+
+    def __leaf(self, page, create):
+        # Walks down to the last-level table holding `page`, allocating missing tables if asked
+        table = self.root
+        for shift in self.shifts[:-1]:
+            index = (page >> shift) & self.mask
+            child = table[index]
+            if child is None:
+                if not create:
+                    return None
+                child = table[index] = [None] * self.fanout
+                self.tables += 1
+            table = child
+        return table
+
+    def __getitem__(self, page):
+        self.__check(page)
+        leaf = self.__leaf(page, True)
+        index = page & self.mask
+        row = leaf[index]
+        if row is None:
+            row = leaf[index] = self.new_row(page)
+            self.populated += 1
+        return row
+
+    def get(self, page):
+        """
+        :param page: Page number
+        :return: The page's row, or None if it was never touched (no row is created)
+        """
+        if not 0 <= page < self.total_pages:
+            return None
+        leaf = self.__leaf(page, False)
+        return None if leaf is None else leaf[page & self.mask]
+
+    def unmap(self, page):
+        """
+        Removes a page's row and frees the tables left empty on its path (the root stays).
+
+        :param page: Page number
+        :return: The removed row, or None if the page had none
+        """
+        if not 0 <= page < self.total_pages:
+            return None
+        path = []
+        table = self.root
+        for shift in self.shifts[:-1]:
+            index = (page >> shift) & self.mask
+            if table[index] is None:
+                return None
+            path.append((table, index))
+            table = table[index]
+        row = table[page & self.mask]
+        if row is None:
+            return None
+        table[page & self.mask] = None
+        self.populated -= 1
+        while path and not any(table):
+            table, index = path.pop()
+            table[index] = None
+            self.tables -= 1
+        return row
+
+    def __contains__(self, page):
+        return self.get(page) is not None
+
+    def __len__(self):
+        return self.populated
+
+    def __iter__(self):
+        # Depth-first over the allocated tables, so rows come out in page order
+        stack = [(self.root, 0)]
+        while stack:
+            table, depth = stack.pop()
+            if depth == self.levels - 1:
+                yield from (row for row in table if row is not None)
+            else:
+                stack.extend((child, depth + 1) for child in reversed(table) if child is not None)
+
+    def memory_entries(self):
+        """
+        :return: Number of table slots allocated over all levels
+        """
+        return self.tables * self.fanout
+
+
+if __name__ == '__main__':
+    table = PageTable(1 << 36)  # 48-bit address space with 4 KB pages
+    for page in [0, 1, 511, 512, 1 << 35, (1 << 36) - 1]:
+        table[page][2] = 1
+    print(f"levels {table.levels} x {table.bits} bits, {len(table)} rows, {table.tables} tables, "
+          f"{table.memory_entries()} slots")
+    print([row[0] for row in table])
@@ -0,0 +1,165 @@
+class BasicPrefetcher:
+    """
+    A base class for prefetchers invoked on page faults.
+    Subclasses only decide which pages to read ahead; this class tracks which prefetched
+    pages were referenced before being evicted (useful) or evicted untouched (wasted).
+    """
+
+    def __init__(self, max_window = 8):
+        """
+        :param max_window: Maximum number of pages prefetched on one fault
+        """
+        self.max_window = max_window
+        self.outstanding = set()  # Prefetched pages not referenced yet
+
+        self.issued = 0
+        self.useful = 0
+        self.wasted = 0
+
+    def flush(self):
+        """
+        Forgets the outstanding pages (e.g. when the process restarts); counters are kept.
+        """
+        self.outstanding = set()
+
+    def predict(self, page, page_index):
+        """
+        Chooses pages to read ahead after a fault. Must be implemented by subclasses.
+
+        :param page: Page that faulted
+        :param page_index: Position of the access in the reference string
+        :return: List of pages to prefetch, most urgent first
+        """
+        raise NotImplementedError("The 'predict' method must be implemented by subclasses.")
+
+    def feedback(self, useful):
+        """
+        Lets adaptive prefetchers react to the fate of a prefetched page.
+
+        :param useful: True if the page was referenced, False if it was evicted untouched
+        """
+        pass
+
+    def observe(self, page, page_index):
+        """
+        Sees every access, before the page table is consulted.
+
+        :param page: Page being accessed
+        :param page_index: Position of the access in the reference string
+        """
+        if page in self.outstanding:
+            self.outstanding.discard(page)
+            self.useful += 1
+            self.feedback(True)
+
+    def on_fault(self, page, page_index):
+        """
+        :param page: Page that faulted
+        :param page_index: Position of the access in the reference string
+        :return: Pages to prefetch
+        """
+        return self.predict(page, page_index)[:self.max_window]
+
+    def admitted(self, page):
+        """
+        Records a page that was actually loaded by prefetching.
+
+        :param page: Prefetched page
+        """
+        self.outstanding.add(page)
+        self.issued += 1
+
+    def evicted(self, page):
+        """
+        Records an eviction; a prefetched page that was never referenced is wasted.
+
+        :param page: Evicted page
+        """
+        if page in self.outstanding:
+            self.outstanding.discard(page)
+            self.wasted += 1
+            self.feedback(False)
+
+    def accuracy(self):
+        """
+        :return: Fraction of prefetched pages that were referenced
+        """
+        return self.useful / self.issued if self.issued else 0.0
+
+    def coverage(self, faults):
+        """
+        :param faults: Demand faults that remained with prefetching enabled
+        :return: Fraction of the would-be faults that prefetching avoided
+        """
+        return self.useful / (self.useful + faults) if self.useful + faults else 0.0
+
+
+class SequentialPrefetcher(BasicPrefetcher):
+    """
+    Sequential read-ahead with an adaptive window.
+    The window doubles while faults keep following the previous access and falls back to
+    one page on a random fault; prefetched pages evicted unused halve it.
+    """
+
+    def __init__(self, max_window = 8):
+        super().__init__(max_window)
+        self.window = 1
+        self.last_page = None
+        self.sequential = False
+
+    def flush(self):
+        super().flush()
+        self.window = 1
+        self.last_page = None
+        self.sequential = False
+
+    def observe(self, page, page_index):
+        super().observe(page, page_index)
+        self.sequential = self.last_page is not None and page == self.last_page + 1
+        self.last_page = page
+
+    def predict(self, page, page_index):
+        self.window = min(self.window * 2, self.max_window) if self.sequential else 1
+        return [page + i for i in range(1, self.window + 1)]
+
+    def feedback(self, useful):
+        if not useful:
+            self.window = max(1, self.window // 2)
+
+
+class StridePrefetcher(BasicPrefetcher):
+    """
+    Stride prefetcher: once two consecutive accesses repeat the same page distance,
+    faults prefetch the next pages along that stride.
+    """
+
+    def __init__(self, max_window = 4):
+        super().__init__(max_window)
+        self.last_page = None
+        self.stride = 0
+        self.confident = False
+
+    def flush(self):
+        super().flush()
+        self.last_page = None
+        self.stride = 0
+        self.confident = False
+
+    def observe(self, page, page_index):
+        super().observe(page, page_index)
+        if self.last_page is not None:
+            stride = page - self.last_page
+            self.confident = stride != 0 and stride == self.stride
+            self.stride = stride
+        self.last_page = page
+
+    def predict(self, page, page_index):
+        if not self.confident:
+            return []
+        return [page + self.stride * i for i in range(1, self.max_window + 1)]
+
+
+PREFETCHERS = {
+    'sequential': SequentialPrefetcher,
+    'stride': StridePrefetcher,
+}
@@ -1,12 +1,17 @@
 import time
 import os
+from array import array
 from tabulate import tabulate
 from utils import *
 from colorama import Fore, init, Back, Style
+from page_table import PageTable
 
 
 class Process:
-    def __init__(self, pid, frame_list, logic_size, page_size, access_window = 3):
+    __slots__ = ('pid', 'frame_list', 'frame_size', 'logic_size', 'page_size', 'total_pages', 'levels',
+                 'access_window', 'access_history', 'history_pos', 'page_table', 'frame', '_headers', '_table')
+
+    def __init__(self, pid, frame_list, logic_size, page_size, access_window = 3, levels = 4):
         """
         Initializes a Process instance.
 
@@ -15,21 +20,24 @@ class Process:
         :param logic_size: Logical address space size in bytes
         :param page_size: Page size in bytes
         :param access_window: Size of the access history window for tracking recent accesses
+        :param levels: Number of levels of the page table
         """
         self.pid = pid
         self.frame_list = frame_list
         self.frame_size = len(frame_list)
         self.logic_size = logic_size
         self.page_size = page_size
-        self.total_pages = int(self.logic_size / self.page_size)
+        self.total_pages = self.logic_size // self.page_size
+        self.levels = levels
 
         self.access_window = access_window
-        self.access_history = []
+        self.access_history = array('q', [-1]) * access_window  # Ring buffer of the last accesses
+        self.history_pos = 0
 
         self.page_table = self.__build_page_table()
-        self.frame = [-1] * self.frame_size
+        self.frame = array('q', [-1]) * self.frame_size
 
-        self.headers, self.table = self.__build_table()
+        self._headers, self._table = None, None  # Frame table, built on first use
 
     def __str__(self):
         """
@@ -46,15 +54,11 @@ class Process:
 
     def __build_page_table(self):
         """
-        Creates and initializes the page table with default values.
+        Creates an empty page table; rows are allocated when their page is first touched.
 
         :return: Initialized page table
         """
-        header = ["Page", "Frame", "Status Bit(P)", "Access Field(A)", "Modified Bit(M)", "Swap Address"]
-        page_table = []
-        for page in range(self.total_pages):
-            page_table.append([str(page), -1, 0, 0, -1, "-"])
-        return page_table
+        return PageTable(self.total_pages, self.levels)
 
     def __build_table(self):
         """
@@ -67,28 +71,44 @@ class Process:
         table.append(["Page missing"])  # Adds a row for page faults
         return header, table
 
+    @property
+    def headers(self):
+        if self._headers is None:
+            self._headers, self._table = self.__build_table()
+        return self._headers
+
+    @property
+    def table(self):
+        if self._table is None:
+            self._headers, self._table = self.__build_table()
+        return self._table
+
     def __update_access_history(self, page):
         """
         Updates the access history for a page and adjusts the access field.
 
         :param page: Page number to update
         """
-        self.access_history.append(page)
-        if len(self.access_history) > self.access_window:
-            removed_page = self.access_history.pop(0)
+        if not self.access_window:
+            return
+        removed_page = self.access_history[self.history_pos]
+        if removed_page > -1:
             self.page_table[removed_page][3] -= 1
+        self.access_history[self.history_pos] = page
+        self.history_pos = (self.history_pos + 1) % self.access_window
         self.page_table[page][3] += 1
 
     def reset(self):
         """
         Resets the process to its initial state.
         """
-        self.access_history = []
+        self.access_history[:] = array('q', [-1]) * self.access_window
+        self.history_pos = 0
 
         self.page_table = self.__build_page_table()
-        self.frame = [-1] * self.frame_size
+        self.frame[:] = array('q', [-1]) * self.frame_size
 
-        self.headers, self.table = self.__build_table()
+        self._headers, self._table = None, None
 
     def welcome(self, algoirthm_name):
         """
@@ -139,13 +159,14 @@ class Process:
         """
         print(self.frame)
 
-    def update_page_table(self, pages, frame_id, old_page):
+    def update_page_table(self, pages, frame_id, old_page, accessed = True):
         """
         Updates the page table based on the current operation.
 
         :param pages: Tuple containing page number and read/write flag
         :param frame_id: Frame index being updated
         :param old_page: Page being replaced in memory
+        :param accessed: False when the page is only loaded (e.g. prefetched), not referenced
         """
         page, rw = pages
 
@@ -154,7 +175,8 @@ class Process:
             self.page_table[old_page][1] = -1
             self.page_table[old_page][2] = 0
             self.page_table[old_page][4] = -1
-            self.page_table[old_page][-1] = str('-')
+            # Drop the colour reset of the resident row, keeping the swap address
+            self.page_table[old_page][-1] = self.page_table[old_page][-1].replace(Fore.RESET, '')
 
             self.table[frame_id][-1] = Fore.GREEN + self.table[frame_id][-1] + Fore.RESET
 
@@ -163,8 +185,44 @@ class Process:
         self.page_table[page][2] = 1
         self.page_table[page][4] = rw
         self.page_table[page][-1] = self.page_table[page][-1] + Fore.RESET
+        if accessed:
+            self.__update_access_history(page)
+
+    def map_page(self, page, frame, rw):
+        """
+        Maps a page onto a physical frame directly, for variable allocation where
+        `frame_list` changes at runtime.
+
+        :param page: Page number
+        :param frame: Physical frame number
+        :param rw: Read/write bit of the access
+        """
+        self.page_table[page][1] = frame
+        self.page_table[page][2] = 1
+        self.page_table[page][4] = rw
         self.__update_access_history(page)
 
+    def unmap_page(self, page):
+        """
+        Marks a page as no longer in memory.
+
+        :param page: Page number
+        """
+        self.page_table[page][1] = -1
+        self.page_table[page][2] = 0
+        self.page_table[page][4] = -1
+
+    def set_swap_address(self, page, slot):
+        """
+        Records the swap slot that holds a page.
+
+        :param page: Page number
+        :param slot: Swap slot, or None if the page has no copy in swap
+        """
+        if slot is not None:
+            # A resident row is coloured up to its last cell, which must close the colour
+            self.page_table[page][-1] = str(slot) + Fore.RESET if self.page_table[page][2] else str(slot)
+
     def update_table(self, pages, out):
         """
         Updates the frame table for display.
@@ -1,12 +1,89 @@
 import time
 import os
+import sys
+import random
+import argparse
+from tabulate import tabulate
 from process import Process
-from algorithms import FIFO, OPT, LRU, S_CLOCK, E_CLOCK
+from engine import make_algorithm
 from utils import *
 from colorama import Fore, init, Back, Style
 
 
-def process_page_step(process, pages, function, page_list = None):
+class FastForward:
+    """
+    Runs the simulation at full speed and only renders the steps that matter:
+    every Nth step, every fault, or steps matching a breakpoint (a watched page being
+    evicted, or an E_CLOCK fault that had to clear every use bit). Each rendered step
+    pauses for inspection.
+    """
+
+    def __init__(self, every = 0, faults = False, evict_pages = None, full_reset = False, history = 12, pause = True):
+        """
+        :param every: Render every Nth step (0 disables)
+        :param faults: Render every page fault
+        :param evict_pages: Pages whose eviction is a breakpoint
+        :param full_reset: Break when E_CLOCK clears every use bit
+        :param history: Number of steps shown in the frame table
+        :param pause: Wait for the user after each rendered step (only on a terminal)
+        """
+        self.every = every
+        self.faults = faults
+        self.evict_pages = set(evict_pages or [])
+        self.full_reset = full_reset
+        self.history = history
+        self.pause = pause and sys.stdin.isatty()
+        self.rendering = True
+        self.full_resets = 0
+
+    def start(self, function):
+        """
+        Prepares for a new algorithm run.
+
+        :param function: Page replacement strategy object about to be simulated
+        """
+        self.full_resets = getattr(function, 'full_resets', 0)
+
+    def check(self, page_id, fault, old_page, function):
+        """
+        :return: The reason to render this step, or None to skip it
+        """
+        reasons = []
+        if old_page is not None and old_page in self.evict_pages:
+            reasons.append(f"page {old_page} evicted")
+        full_resets = getattr(function, 'full_resets', 0)
+        if self.full_reset and full_resets > self.full_resets:
+            reasons.append("E_CLOCK cleared every use bit")
+        self.full_resets = full_resets
+        if self.faults and fault:
+            reasons.append("page fault")
+        if self.every and (page_id + 1) % self.every == 0:
+            reasons.append(f"every {self.every} steps")
+        return ", ".join(reasons) if reasons and self.rendering else None
+
+    def render(self, process, algorithm, page_id, pages, fault, old_page, reason):
+        """
+        Shows the page table and the latest frame table columns, then pauses.
+        """
+        page, rw = pages
+        action = "page fault" if fault else "hit"
+        evicted = f", evicted page {old_page}" if old_page is not None else ""
+        print(Fore.YELLOW + f"[{reason}] step {page_id}: page {page} "
+              f"({'write' if rw else 'read'}), {action}{evicted}" + Fore.RESET)
+        process.show_page_table(algorithm)
+        columns = slice(max(1, len(process.headers) - self.history), len(process.headers))
+        headers = process.headers[:1] + process.headers[columns]
+        table = [row[:1] + row[columns] for row in process.table]
+        print(tabulate(table, headers = headers, tablefmt = 'presto', stralign = 'center'))
+        if self.pause:
+            command = input("Enter: next, c: run without pausing, q: stop rendering > ").strip().lower()
+            if command == 'c':
+                self.pause = False
+            elif command == 'q':
+                self.rendering = False
+
+
+def process_page_step(process, pages, function, page_list = None, viewer = None, algorithm = None):
     """
     Simulates a single step in the page access process for a given process.
 
@@ -15,6 +92,8 @@ def process_page_step(process, pages, function, page_list = None):
         pages: Tuple containing page ID and access type (read/write).
         function: Page replacement strategy object with step and update methods.
         page_list: Optional list of pages for certain strategies like OPT.
+        viewer: Optional FastForward; steps are then rendered only when it asks for them.
+        algorithm: Name of the algorithm, shown by the viewer.
 
     Returns:
         int: 1 if a page fault occurs, otherwise 0.
@@ -35,7 +114,8 @@ def process_page_step(process, pages, function, page_list = None):
     # Check if the page exists in memory or a page fault occurs
     if page_data is None or page_data[2] == 0:
         # Page fault: The requested page is not in memory
-        process.display_page_table((page, rw), flag = 0)
+        if viewer is None:
+            process.display_page_table((page, rw), flag = 0)
         # Perform the page replacement step
         frame_id, old_page = function.step((page, rw), page_id, page_list)
         # Update the frame with the new page
@@ -43,7 +123,8 @@ def process_page_step(process, pages, function, page_list = None):
         page_fault = 1
     else:
         # Page is already in memory; no page fault
-        process.display_page_table((page, rw), flag = 1)
+        if viewer is None:
+            process.display_page_table((page, rw), flag = 1)
         frame_id = process.frame_list.index(frame)
         page_fault = 0
 
@@ -52,10 +133,29 @@ def process_page_step(process, pages, function, page_list = None):
     function.update((page, rw), page_id)
     # Update the memory table for visualization
     process.update_table((page, rw), page_fault)
+    if viewer is not None:
+        reason = viewer.check(page_id, page_fault, old_page, function)
+        if reason is not None:
+            viewer.render(process, algorithm, page_id, (page, rw), page_fault, old_page, reason)
     return page_fault
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Step through the page replacement algorithms.')
+    parser.add_argument('--length', type = int, default = None,
+                        help = 'Simulate a random sequence of this length instead of the built-in example.')
+    parser.add_argument('--seed', type = int, default = 42)
+    # Fast-forward: simulate at full speed and only render selected steps
+    parser.add_argument('--every', type = int, default = 0, help = 'Render every Nth step.')
+    parser.add_argument('--faults', action = 'store_true', help = 'Render every page fault.')
+    parser.add_argument('--break_evict', type = int, nargs = '+', default = None,
+                        help = 'Render and pause when one of these pages is evicted.')
+    parser.add_argument('--break_reset', action = 'store_true',
+                        help = 'Render and pause when E_CLOCK finds no (U=0) page and clears every use bit.')
+    parser.add_argument('--history', type = int, default = 12, help = 'Steps shown in the fast-forward frame table.')
+    parser.add_argument('--no_pause', action = 'store_true', help = 'Render breakpoints without waiting for input.')
+    args = parser.parse_args()
+
     pid = 1
     page_size = 4096  # 4KB
     frame_list = [3, 5, 8, 10]
@@ -66,8 +166,19 @@ if __name__ == '__main__':
         'access': [0, 1, 2, 3, 1, 0, 4, 5, 1, 0, 1, 2, 6, 5, 2, 1, 0, 1, 2, 5],
         'modify': [0, 1, 0, 1, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 0, 1, 1, 1]
     }
+    if args.length is not None:
+        random.seed(args.seed)
+        e_clock_pages = {
+            'access': [random.randrange(A.total_pages) for _ in range(args.length)],
+            'modify': [random.randint(0, 1) for _ in range(args.length)]
+        }
     page_access = e_clock_pages['access']
     page_modify = e_clock_pages['modify']
+
+    viewer = None
+    if args.every or args.faults or args.break_evict or args.break_reset:
+        viewer = FastForward(args.every, args.faults, args.break_evict, args.break_reset, args.history,
+                             not args.no_pause)
     # fifo_fun = E_CLOCK(A.frame_size)
 
     algorithms = ['OPT', 'FIFO', 'LRU', 'S_CLOCK', "E_CLOCK"]
@@ -77,20 +188,24 @@ if __name__ == '__main__':
         alg_faults[algorithm] = 0
     for algorithm in algorithms:
         A.reset()
-        alg_fun = eval(algorithm)(A.frame_size)
+        alg_fun = make_algorithm(algorithm)(A.frame_size)
         # print(Fore.CYAN + f'--------------- PID {A.pid} Use {Style.BRIGHT}{algorithm}{Style.NORMAL}---------------' + Fore.RESET)
         A.welcome(algorithm)
+        if viewer is not None:
+            viewer.start(alg_fun)
         total_fault = 0
         for pages in enumerate(zip(page_access, page_modify)):
-            fault = process_page_step(A, pages, alg_fun, page_access)
+            fault = process_page_step(A, pages, alg_fun, page_access, viewer, algorithm)
             total_fault += fault
         alg_faults[algorithm] = total_fault
         # print(Fore.CYAN + f'--------------- {Style.BRIGHT}{algorithm}{Style.NORMAL} Page Table ---------------' + Fore.RESET)
-        A.show_page_table(algorithm)
+        if viewer is None:
+            A.show_page_table(algorithm)
         # print(Fore.CYAN + f'--------------- {Style.BRIGHT}{algorithm}{Style.NORMAL} Frame Table ---------------' + Fore.RESET)
         # A.show_table(algorithm)
         algorithms_table[0] = A.headers if algorithms_table[0] is None else algorithms_table[0]
         algorithms_table.append(A.table)
         print('\n\n')
-    show_all_table(algorithms_table)
+    if viewer is None:
+        show_all_table(algorithms_table)
     show_fault_table(alg_faults, len(page_access))
@@ -0,0 +1,212 @@
+import os
+import json
+import argparse
+import numpy as np
+from process import Process
+from colorama import Fore
+
+
+# Per-step columns of a timeline: name -> (dtype, one value per frame slot)
+COLUMNS = {
+    'seq': ('<i4', False),  # Sequence number; the process restarts between sequences
+    'page': ('<i8', False),
+    'rw': ('u1', False),
+    'fault': ('u1', False),
+    'slot': ('<i4', False),  # Frame slot used by the access
+    'evicted': ('<i8', False),  # Page evicted by the access, -1 if none
+    'frame': ('<i8', True),  # Page held by each slot after the access, -1 if empty
+    'use': ('u1', True),  # Use bit of each slot (algorithms without one record 0)
+    'modify': ('u1', True),  # Modified bit of the page held by each slot
+}
+
+
+class TimelineRecorder:
+    """
+    Records every simulation step of one process and algorithm into a directory of
+    column files (one raw NumPy file per column plus `meta.json`), written in blocks
+    so arbitrarily long runs can be recorded headlessly.
+    """
+
+    def __init__(self, path, process, algorithm_name, block = 4096):
+        """
+        :param path: Directory to create for the timeline
+        :param process: Process being simulated
+        :param algorithm_name: Name of the replacement algorithm
+        :param block: Number of steps buffered before they are appended to the files
+        """
+        os.makedirs(path, exist_ok = True)
+        self.path = path
+        self.block = block
+        self.meta = {
+            'pid': process.pid,
+            'algorithm': algorithm_name,
+            'frame_list': list(process.frame_list),
+            'logic_size': process.logic_size,
+            'page_size': process.page_size,
+            'access_window': process.access_window,
+            'steps': 0,
+            'sequences': 0,
+        }
+        self.frame_size = process.frame_size
+        self.buffers = {name: [] for name in COLUMNS}
+        self.seq_starts = []
+        self.files = {name: open(os.path.join(path, f'{name}.bin'), 'wb') for name in COLUMNS}
+        self.files['seq_starts'] = open(os.path.join(path, 'seq_starts.bin'), 'wb')
+        self.seq = -1
+
+    def new_sequence(self):
+        """
+        Marks the start of a new sequence (the process and algorithm were reset).
+        """
+        self.seq += 1
+        self.seq_starts.append(self.meta['steps'])
+
+    def record(self, page, rw, fault, slot, evicted, process, function):
+        """
+        Appends one step.
+
+        :param page: Page accessed
+        :param rw: Read/write bit of the access
+        :param fault: 1 if the access faulted
+        :param slot: Frame slot used by the access
+        :param evicted: Page evicted by the access, or None
+        :param process: Process after the step
+        :param function: Replacement algorithm after the step
+        """
+        if self.seq < 0:
+            self.new_sequence()
+        frame = list(process.frame)
+        use_bit = getattr(function, 'use_bit', None)
+        self.buffers['seq'].append(self.seq)
+        self.buffers['page'].append(page)
+        self.buffers['rw'].append(rw)
+        self.buffers['fault'].append(fault)
+        self.buffers['slot'].append(slot)
+        self.buffers['evicted'].append(-1 if evicted is None else evicted)
+        self.buffers['frame'].append(frame)
+        self.buffers['use'].append(list(use_bit) if use_bit is not None else [0] * self.frame_size)
+        self.buffers['modify'].append([max(process.page_table[p][4], 0) if p > -1 else 0 for p in frame])
+        self.meta['steps'] += 1
+        if len(self.buffers['page']) >= self.block:
+            self.flush()
+
+    def flush(self):
+        """
+        Appends the buffered steps to the column files.
+        """
+        for name, (dtype, _) in COLUMNS.items():
+            if self.buffers[name]:
+                np.asarray(self.buffers[name], dtype = dtype).tofile(self.files[name])
+                self.buffers[name] = []
+        if self.seq_starts:
+            np.asarray(self.seq_starts, dtype = '<i8').tofile(self.files['seq_starts'])
+            self.meta['sequences'] += len(self.seq_starts)
+            self.seq_starts = []
+
+    def close(self):
+        """
+        Flushes the remaining steps and writes `meta.json`.
+        """
+        self.flush()
+        for f in self.files.values():
+            f.close()
+        with open(os.path.join(self.path, 'meta.json'), 'w') as f:
+            json.dump(self.meta, f)
+
+
+class TimelineReplay:
+    """
+    Memory-maps a recorded timeline; any step is reachable in O(1) without replaying
+    the simulation, and is rendered with the usual `Process` page and frame table views.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: Directory written by TimelineRecorder
+        """
+        with open(os.path.join(path, 'meta.json')) as f:
+            self.meta = json.load(f)
+        steps = self.meta['steps']
+        frame_size = len(self.meta['frame_list'])
+        self.columns = {}
+        for name, (dtype, per_slot) in COLUMNS.items():
+            shape = (steps, frame_size) if per_slot else (steps,)
+            self.columns[name] = np.memmap(os.path.join(path, f'{name}.bin'), dtype = dtype, mode = 'r', shape = shape)
+        self.seq_starts = np.memmap(os.path.join(path, 'seq_starts.bin'), dtype = '<i8', mode = 'r',
+                                    shape = (self.meta['sequences'],))
+
+    def __len__(self):
+        return self.meta['steps']
+
+    def __getitem__(self, step):
+        """
+        :param step: Step number
+        :return: Dictionary of column name -> value at that step
+        """
+        return {name: column[step] for name, column in self.columns.items()}
+
+    def process_at(self, step, history = 20):
+        """
+        Rebuilds a Process whose page table and frame table show the state after a step.
+
+        :param step: Step number
+        :param history: Number of steps shown in the frame table
+        :return: Process instance
+        """
+        meta = self.meta
+        process = Process(meta['pid'], meta['frame_list'], meta['logic_size'], meta['page_size'], meta['access_window'])
+        columns = self.columns
+        seq_start = int(self.seq_starts[columns['seq'][step]])
+
+        # Page table: resident pages and the access field over the last window of the sequence
+        for slot, page in enumerate(columns['frame'][step].tolist()):
+            if page > -1:
+                process.page_table[page][0] = Fore.GREEN + str(page)
+                process.page_table[page][1] = meta['frame_list'][slot]
+                process.page_table[page][2] = 1
+                process.page_table[page][4] = int(columns['modify'][step][slot])
+                process.page_table[page][-1] = process.page_table[page][-1] + Fore.RESET
+        window_start = max(seq_start, step - meta['access_window'] + 1)
+        for page in columns['page'][window_start:step + 1].tolist():
+            process.page_table[page][3] += 1
+        process.frame = columns['frame'][step].tolist()
+
+        # Frame table: the last `history` steps of the sequence
+        for j in range(max(seq_start, step - history + 1), step + 1):
+            process.frame = columns['frame'][j].tolist()
+            if columns['evicted'][j] > -1 and len(process.table[0]) > 1:
+                slot = int(columns['slot'][j])
+                process.table[slot][-1] = Fore.GREEN + process.table[slot][-1] + Fore.RESET
+            process.update_table((int(columns['page'][j]), int(columns['rw'][j])), int(columns['fault'][j]))
+        return process
+
+    def show(self, step, history = 20):
+        """
+        Renders the page table and frame table after a step.
+
+        :param step: Step number
+        :param history: Number of steps shown in the frame table
+        """
+        record = self[step]
+        process = self.process_at(step, history)
+        name = self.meta['algorithm']
+        process.welcome(name)
+        action = 'page fault' if record['fault'] else 'hit'
+        evicted = f", evicted page {record['evicted']}" if record['evicted'] > -1 else ''
+        print(f"Step {step}/{len(self) - 1}: page {record['page']} ({'write' if record['rw'] else 'read'}), "
+              f"{action} in slot {record['slot']}{evicted}")
+        process.show_page_table(name)
+        process.show_table(name, delay = 0)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Replay a recorded simulation timeline.')
+    parser.add_argument('path', help = 'Timeline directory written by TimelineRecorder (e.g. main.py --record).')
+    parser.add_argument('--step', type = int, nargs = '+', default = [-1],
+                        help = 'Steps to render; negative values count from the end.')
+    parser.add_argument('--history', type = int, default = 20, help = 'Number of steps shown in the frame table.')
+    args = parser.parse_args()
+
+    replay = TimelineReplay(args.path)
+    for step in args.step:
+        replay.show(step % len(replay), args.history)
@@ -0,0 +1,235 @@
+import heapq
+import time
+from bisect import bisect_left
+from collections import deque
+from engine import Pager, make_algorithm
+
+
+class CyclicTrace:
+    """
+    A process's reference string repeated forever, addressed by absolute index, so
+    look-ahead algorithms (OPT, LA_OPT) see the future of a program that keeps looping.
+    """
+
+    def __init__(self, pages):
+        """
+        :param pages: One pass of the reference string
+        """
+        self.pages = list(pages)
+        self.positions = {}  # page -> sorted positions within one pass
+        for position, page in enumerate(self.pages):
+            self.positions.setdefault(page, []).append(position)
+
+    def __getitem__(self, item):
+        n = len(self.pages)
+        if not isinstance(item, slice):
+            return self.pages[item % n]
+        return [self.pages[i % n] for i in range(item.start or 0, item.stop)]
+
+    def index(self, value, start = 0):
+        """
+        :return: Absolute position of the first `value` at or after `start`
+        :raises ValueError: If the value is not in the reference string
+        """
+        positions = self.positions.get(value)
+        if positions is None:
+            raise ValueError(f"{value} is not in the reference string")
+        n = len(self.pages)
+        base, offset = divmod(start, n)
+        i = bisect_left(positions, offset)
+        if i == len(positions):
+            return (base + 1) * n + positions[0]
+        return base * n + positions[i]
+
+
+class SimProcess:
+    """
+    Scheduling state of one simulated process: a cyclic reference string and a pager
+    with the process's share of the frames.
+    """
+
+    def __init__(self, pid, access, modify, function):
+        self.pid = pid
+        self.modify = list(modify)
+        self.trace = CyclicTrace(access)
+        self.pager = Pager(function)
+        self.clock = 0  # References executed (virtual time)
+        self.faults = 0
+        self.waiting_on = None  # Sequence number of the fault the process is blocked on
+
+    @property
+    def jobs(self):
+        """
+        :return: Completed passes over the reference string
+        """
+        return self.clock // len(self.modify)
+
+
+class Scheduler:
+    """
+    Discrete-event simulation of multiprogramming on one CPU and one paging device.
+    Ready processes share the CPU round-robin; a page fault blocks the process for the
+    fault-service time on the paging device, which serves faults in FIFO order. Events
+    (fault-service completions) are kept in a heap, so the cost grows with the number of
+    references and faults, not with the number of processes.
+
+    Memory is never overcommitted: at most one process per frame is resident. The rest
+    are suspended (swapped out) in FIFO order, and whenever a resident process completes
+    a pass over its reference string it is swapped out (even while blocked on a fault,
+    which is then abandoned) and the longest-suspended process takes over its frames,
+    starting cold.
+    """
+
+    def __init__(self, algorithm, traces, total_frames, quantum = 10, ref_time = 1, fault_time = 100,
+                 switch_time = 0):
+        """
+        :param algorithm: Algorithm name understood by engine.make_algorithm
+        :param traces: List of (access, modify) pairs, one per process
+        :param total_frames: Physical frames, shared out equally among the resident processes
+        :param quantum: References a process may execute per CPU turn
+        :param ref_time: CPU time of one reference
+        :param fault_time: Paging-device time to service one fault
+        :param switch_time: CPU time of a context switch
+        """
+        self.quantum = quantum
+        self.ref_time = ref_time
+        self.fault_time = fault_time
+        self.switch_time = switch_time
+        self.resident = min(len(traces), total_frames)
+        self.frames_per_process = total_frames // self.resident
+        factory = make_algorithm(algorithm)
+        self.processes = [SimProcess(pid, access, modify, factory(self.frames_per_process))
+                          for pid, (access, modify) in enumerate(traces)]
+
+    def run(self, horizon):
+        """
+        Simulates until `horizon` time units have elapsed.
+
+        :param horizon: Simulated time to run for
+        :return: Dictionary of measurements
+        """
+        now = 0
+        cpu_busy = 0
+        device_free = 0  # Time at which the paging device finishes its queue
+        device_busy = 0
+        waiting = 0  # Total time processes spent blocked on faults
+        events = []  # (completion time, sequence number, pid)
+        sequence = 0
+        ready = deque(self.processes[:self.resident])
+        suspended = deque(self.processes[self.resident:])
+        swaps = 0
+
+        while now < horizon:
+            while events and events[0][0] <= now:
+                _, number, pid = heapq.heappop(events)
+                if self.processes[pid].waiting_on == number:  # Not swapped out meanwhile
+                    self.processes[pid].waiting_on = None
+                    ready.append(self.processes[pid])
+            if not ready:
+                now = events[0][0]  # CPU idles until the next fault is serviced
+                continue
+
+            process = ready.popleft()
+            trace, modify, n = process.trace, process.modify, len(process.modify)
+            jobs = process.jobs
+            blocked = False
+            for _ in range(self.quantum):
+                page_index = process.clock
+                fault = process.pager.access(trace.pages[page_index % n], modify[page_index % n], page_index, trace)[0]
+                process.clock += 1
+                now += self.ref_time
+                cpu_busy += self.ref_time
+                if fault:
+                    process.faults += 1
+                    start = max(now, device_free)
+                    device_free = start + self.fault_time
+                    device_busy += self.fault_time
+                    waiting += device_free - now
+                    heapq.heappush(events, (device_free, sequence, process.pid))
+                    process.waiting_on = sequence
+                    sequence += 1
+                    blocked = True
+                    break
+            if suspended and process.jobs > jobs:
+                # Swap the process out; its frames go to the longest-suspended one
+                process.pager.reset()
+                process.waiting_on = None
+                suspended.append(process)
+                ready.append(suspended.popleft())
+                swaps += 1
+            elif not blocked:
+                ready.append(process)
+            now += self.switch_time
+
+        references = sum(p.clock for p in self.processes)
+        faults = sum(p.faults for p in self.processes)
+        return {
+            'processes': len(self.processes),
+            'resident': self.resident,
+            'frames': self.frames_per_process,
+            'swaps': swaps,
+            'time': now,
+            'references': references,
+            'faults': faults,
+            'fault_rate': faults / references if references else 0.0,
+            'cpu_utilization': cpu_busy / now if now else 0.0,
+            'device_utilization': min(device_busy, now) / now if now else 0.0,
+            'throughput': references / now if now else 0.0,
+            'jobs': sum(p.jobs for p in self.processes),
+            'mean_fault_wait': waiting / faults if faults else 0.0,
+        }
+
+
+def sweep_multiprogramming(algorithm, traces, total_frames, degrees, horizon, **kwargs):
+    """
+    Runs the scheduler with a rising number of processes over the same physical memory.
+
+    :param algorithm: Algorithm name understood by engine.make_algorithm
+    :param traces: Reference strings; degree d runs the first d of them
+    :param total_frames: Physical frames shared out among the processes
+    :param degrees: Degrees of multiprogramming to simulate
+    :param horizon: Simulated time per run
+    :param kwargs: Further Scheduler parameters
+    :return: List of measurement dictionaries, one per degree
+    """
+    return [Scheduler(algorithm, traces[:degree], total_frames, **kwargs).run(horizon) for degree in degrees]
+
+
+def detect_thrashing(points, drop = 0.2):
+    """
+    Finds the onset of thrashing: the first degree of multiprogramming past the CPU
+    utilization peak at which utilization has fallen by more than `drop` of the peak
+    while the paging device is the busier resource.
+
+    :param points: Measurements from sweep_multiprogramming, in increasing degree
+    :param drop: Fraction of the peak utilization that counts as a collapse
+    :return: The degree at which thrashing sets in, or None
+    """
+    if not points:
+        return None
+    peak = max(range(len(points)), key = lambda i: points[i]['cpu_utilization'])
+    limit = points[peak]['cpu_utilization'] * (1 - drop)
+    for point in points[peak + 1:]:
+        if point['cpu_utilization'] < limit and point['device_utilization'] > point['cpu_utilization']:
+            return point['processes']
+    return None
+
+
+if __name__ == '__main__':
+    import random
+
+    random.seed(42)
+    # Each process loops over a working set of 8 of its 32 pages, with occasional stray references
+    traces = []
+    for _ in range(4096):
+        hot = random.sample(range(32), 8)
+        access = [random.choice(hot) if random.random() < 0.95 else random.randrange(32) for _ in range(200)]
+        traces.append((access, [random.randint(0, 1) for _ in access]))
+
+    T0 = time.perf_counter()
+    points = sweep_multiprogramming('LRU', traces, 256, [1, 2, 4, 8, 16, 32, 64, 128, 4096], 200000)
+    T1 = time.perf_counter()
+    for point in points:
+        print(f"{point['processes']:5d} processes ({point['resident']:3d} resident), {point['frames']:3d} frames: "
+              f"CPU {point['cpu_utilization'] * 100:6.2f}%, fault rate {point['fault_rate'] * 100:6.2f}%")
+    print(f"Thrashing from {detect_thrashing(points)} processes ({T1 - T0:.2f}s)")
@@ -0,0 +1,156 @@
+import os
+import time
+import numpy as np
+from multiprocessing import Pool, shared_memory
+from engine import run_trace, make_algorithm
+from metrics import current_rss
+
+
+class SharedTraceStore:
+    """
+    Page traces packed into one `multiprocessing.shared_memory` block.
+    Workers attach by name and read the traces through NumPy views, so however many
+    workers run, only one physical copy of the traces exists.
+
+    Block layout: [trace count][trace offsets (count + 1)][pages (int64)][rw bits (uint8)]
+    """
+
+    def __init__(self, shm, owner):
+        """
+        Use `create` or `attach` instead of calling this directly.
+
+        :param shm: SharedMemory block holding the traces
+        :param owner: True if this process created the block and must unlink it
+        """
+        self.shm = shm
+        self.owner = owner
+        header = np.ndarray((1,), dtype = np.int64, buffer = shm.buf)
+        count = int(header[0])
+        self.offsets = np.ndarray((count + 1,), dtype = np.int64, buffer = shm.buf, offset = 8)
+        total = int(self.offsets[-1])
+        pages_at = 8 * (count + 2)
+        self.pages = np.ndarray((total,), dtype = np.int64, buffer = shm.buf, offset = pages_at)
+        self.rw = np.ndarray((total,), dtype = np.uint8, buffer = shm.buf, offset = pages_at + 8 * total)
+
+    @classmethod
+    def create(cls, traces):
+        """
+        Copies traces into a new shared-memory block.
+
+        :param traces: List of (access, modify) pairs of sequences
+        :return: SharedTraceStore owning the block
+        """
+        lengths = [len(access) for access, _ in traces]
+        total = sum(lengths)
+        size = 8 * (len(traces) + 2) + 9 * total
+        shm = shared_memory.SharedMemory(create = True, size = max(size, 1))
+
+        np.ndarray((1,), dtype = np.int64, buffer = shm.buf)[0] = len(traces)
+        offsets = np.ndarray((len(traces) + 1,), dtype = np.int64, buffer = shm.buf, offset = 8)
+        offsets[0] = 0
+        offsets[1:] = np.cumsum(lengths)
+        store = cls(shm, owner = True)
+        for i, (access, modify) in enumerate(traces):
+            store.pages[offsets[i]:offsets[i + 1]] = access
+            store.rw[offsets[i]:offsets[i + 1]] = modify
+        return store
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attaches to a block created by another process, without copying it.
+
+        :param name: Name of the shared-memory block
+        :return: SharedTraceStore that does not own the block
+        """
+        try:
+            shm = shared_memory.SharedMemory(name = name, track = False)
+        except TypeError:
+            # Before Python 3.13 attaching always registers the block; pool workers share
+            # the creator's resource tracker, where the registration is a no-op
+            shm = shared_memory.SharedMemory(name = name)
+        return cls(shm, owner = False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def trace(self, index):
+        """
+        :param index: Trace number
+        :return: Tuple of (pages, rw) views into shared memory
+        """
+        begin, end = int(self.offsets[index]), int(self.offsets[index + 1])
+        return self.pages[begin:end], self.rw[begin:end]
+
+    def close(self):
+        """
+        Detaches from the block, and frees it if this process created it.
+        """
+        # Views must be dropped before the buffer can be released
+        self.offsets = self.pages = self.rw = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+# Store attached once per worker process by the pool initializer
+_worker_store = None
+
+
+def _attach_worker(name):
+    global _worker_store
+    _worker_store = SharedTraceStore.attach(name)
+
+
+def _run_job(job):
+    index, algorithm, frame_size = job
+    access, modify = _worker_store.trace(index)
+    T0 = time.perf_counter()
+    faults = run_trace(make_algorithm(algorithm), access, modify, frame_size)
+    return faults, time.perf_counter() - T0, os.getpid(), current_rss()
+
+
+def run_shared_sweep(store, algorithm_names, frame_size, workers = os.cpu_count(), metrics = None):
+    """
+    Evaluates every algorithm on every trace of a store with a pool of worker processes.
+    Jobs only carry (trace number, algorithm name, frame count); traces stay in shared memory.
+
+    :param store: SharedTraceStore created by this process
+    :param algorithm_names: Algorithm names understood by engine.make_algorithm
+    :param frame_size: Number of frames per trace
+    :param workers: Number of worker processes
+    :param metrics: Optional metrics.SweepMetrics updated as jobs finish
+    :return: Dictionary of algorithm name -> list of faults per trace
+    """
+    jobs = [(index, algorithm, frame_size) for algorithm in algorithm_names for index in range(len(store))]
+    results = {}
+    with Pool(workers, initializer = _attach_worker, initargs = (store.name,)) as pool:
+        done = pool.imap(_run_job, jobs, chunksize = max(1, len(jobs) // (workers * 4)))
+        for (index, algorithm, _), (fault, seconds, pid, rss) in zip(jobs, done):
+            results.setdefault(algorithm, []).append(fault)
+            if metrics is not None:
+                begin, end = int(store.offsets[index]), int(store.offsets[index + 1])
+                metrics.record(algorithm, end - begin, fault, seconds, pid, rss)
+    return results
+
+
+if __name__ == '__main__':
+    import random
+
+    random.seed(42)
+    traces = [([random.randint(0, 63) for _ in range(50000)], [random.randint(0, 1) for _ in range(50000)])
+              for _ in range(8)]
+    store = SharedTraceStore.create(traces)
+    try:
+        T0 = time.perf_counter()
+        results = run_shared_sweep(store, ['FIFO', 'LRU', 'S_CLOCK', 'E_CLOCK'], 16, workers = 4)
+        T1 = time.perf_counter()
+        for algorithm, faults in results.items():
+            print(f"{algorithm}: {sum(faults)} faults")
+        print(f"{sum(len(a) for a, _ in traces) * len(results) / (T1 - T0) / 1e6:.2f} M accesses/s")
+    finally:
+        store.close()
@@ -0,0 +1,125 @@
+from engine import Pager, make_algorithm
+
+
+class CowMapper:
+    """
+    Page mappings of a group of processes forked from one parent.
+    The first `shared_pages` pages of every address space start out shared with the
+    parent (one physical page each, with a reference count of mapping processes); the
+    rest are private. The first write by a process to a shared page gives it a private
+    copy (copy-on-write), unless it is the last process mapping the page, which then
+    simply keeps it.
+
+    Physical pages are numbered so they can be fed to any replacement algorithm: shared
+    page p is p, and private page p of process pid is (pid + 1) * total_pages + p.
+    """
+
+    def __init__(self, num_processes, total_pages, shared_pages):
+        """
+        :param num_processes: Number of processes in the group
+        :param total_pages: Pages in each address space
+        :param shared_pages: Leading pages inherited copy-on-write from the parent
+        """
+        self.total_pages = total_pages
+        self.shared_pages = min(shared_pages, total_pages) if num_processes > 1 else 0
+        self.refcount = {page: num_processes for page in range(self.shared_pages)}
+        self.copied = [set() for _ in range(num_processes)]  # Shared pages each process has copied
+
+    def is_shared(self, key):
+        return key < self.shared_pages
+
+    def key(self, pid, page):
+        """
+        :return: Physical page a process's page is mapped to
+        """
+        if page < self.shared_pages and page not in self.copied[pid]:
+            return page
+        return (pid + 1) * self.total_pages + page
+
+    def write(self, pid, page):
+        """
+        Applies copy-on-write to a write by a process.
+
+        :return: True if the write broke sharing and needs a private copy
+        """
+        if page >= self.shared_pages or page in self.copied[pid] or self.refcount[page] == 1:
+            return False
+        self.refcount[page] -= 1
+        self.copied[pid].add(page)
+        return True
+
+
+def simulate_sharing(algorithm, traces, frames, total_pages, shared_pages):
+    """
+    Runs a forked process group round-robin (one reference per process per turn) over a
+    global frame table managed by one replacement algorithm. A shared page occupies one
+    frame whichever processes use it, so evicting it unmaps it from all of them and a
+    fault by any of them brings it back for all. Copy-on-write breaks are known from the
+    trace alone, so the physical reference string is built first and look-ahead
+    algorithms see the copies they will need.
+
+    :param algorithm: Algorithm name understood by engine.make_algorithm
+    :param traces: One (access, modify) pair of sequences per process
+    :param frames: Physical frames of the whole machine
+    :param total_pages: Pages in each address space
+    :param shared_pages: Leading pages shared copy-on-write (0 duplicates everything)
+    :return: Dictionary of measurements. Duplicates avoided count, over the resident
+             shared pages, the private copies the other mappers would otherwise hold
+             (reference count - 1 each). They are page copies, not frames freed on this
+             machine: without sharing they would compete for the same frames.
+    """
+    mapper = CowMapper(len(traces), total_pages, shared_pages)
+    keys, rws, cows = [], [], []  # Physical reference string; cows holds the broken shared page or -1
+    longest = max(len(access) for access, _ in traces)
+    for turn in range(longest):
+        for pid, (access, modify) in enumerate(traces):
+            if turn < len(access):
+                page, rw = access[turn], modify[turn]
+                cows.append(page if rw and mapper.write(pid, page) else -1)
+                keys.append(mapper.key(pid, page))
+                rws.append(rw)
+
+    # Replay with the reference counts starting over, tracking duplicate copies avoided by sharing
+    refcount = {page: len(traces) for page in range(mapper.shared_pages)}
+    pager = Pager(make_algorithm(algorithm)(frames))
+    faults = cow_faults = 0
+    avoided = avoided_total = avoided_peak = 0
+    for page_index, (key, rw, source) in enumerate(zip(keys, rws, cows)):
+        if source >= 0:
+            cow_faults += 1
+            refcount[source] -= 1
+            if source in pager.resident:
+                avoided -= 1
+        fault, _, old_page = pager.access(key, rw, page_index, keys)
+        if old_page is not None and mapper.is_shared(old_page):
+            avoided -= refcount[old_page] - 1
+        if fault:
+            faults += 1
+            if mapper.is_shared(key):
+                avoided += refcount[key] - 1
+        avoided_total += avoided
+        avoided_peak = max(avoided_peak, avoided)
+
+    return {
+        'references': len(keys),
+        'faults': faults,
+        'cow_faults': cow_faults,
+        'mean_duplicates_avoided': avoided_total / len(keys) if keys else 0.0,
+        'peak_duplicates_avoided': avoided_peak,
+    }
+
+
+if __name__ == '__main__':
+    import random
+
+    random.seed(42)
+    # A pre-forking server: eight workers read a large inherited region and write rarely
+    traces = []
+    for _ in range(8):
+        access = [random.randrange(48) if random.random() < 0.7 else random.randrange(48, 64) for _ in range(5000)]
+        traces.append((access, [int(random.random() < 0.05) for _ in access]))
+    for shared in [0, 48]:
+        result = simulate_sharing('LRU', traces, 128, 64, shared)
+        print(f"{shared:2d} shared pages: {result['faults']} faults ({result['cow_faults']} COW), "
+              f"{result['mean_duplicates_avoided']:.1f} duplicate pages avoided on average, "
+              f"{result['peak_duplicates_avoided']} at peak")
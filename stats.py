@@ -0,0 +1,151 @@
+import math
+from statistics import NormalDist
+
+
+# Two-sided Student-t critical values for 1 to 30 degrees of freedom at the usual levels
+T_TABLE = {
+    0.90: (6.314, 2.920, 2.353, 2.132, 2.015, 1.943, 1.895, 1.860, 1.833, 1.812, 1.796, 1.782, 1.771, 1.761, 1.753,
+           1.746, 1.740, 1.734, 1.729, 1.725, 1.721, 1.717, 1.714, 1.711, 1.708, 1.706, 1.703, 1.701, 1.699, 1.697),
+    0.95: (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228, 2.201, 2.179, 2.160, 2.145, 2.131,
+           2.120, 2.110, 2.101, 2.093, 2.086, 2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042),
+    0.99: (63.657, 9.925, 5.841, 4.604, 4.032, 3.707, 3.499, 3.355, 3.250, 3.169, 3.106, 3.055, 3.012, 2.977, 2.947,
+           2.921, 2.898, 2.878, 2.861, 2.845, 2.831, 2.819, 2.807, 2.797, 2.787, 2.779, 2.771, 2.763, 2.756, 2.750),
+}
+
+
+# Two-sided Student-t critical value. Small samples, where adaptive stopping is decided, read
+# the table (or the closed forms for 1 and 2 degrees of freedom at other levels); otherwise the
+# Cornish-Fisher expansion of the normal quantile, within 1% of the exact value from 3 degrees
+# of freedom and within 0.1% past 30
+def t_critical(level, df):
+    if df < 1:
+        return float('inf')
+    table = T_TABLE.get(round(level, 6))
+    if table is not None and df <= len(table):
+        return table[df - 1]
+    p = 0.5 + level / 2
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = NormalDist().inv_cdf(p)
+    return (z + (z ** 3 + z) / (4 * df) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * df ** 3))
+
+
+class RunningStats:
+    """
+    Running mean and variance of a stream of observations (Welford's algorithm),
+    in constant memory and without the cancellation error of summing squares.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared distances from the mean
+
+    def push(self, x):
+        """
+        Adds one observation.
+
+        :param x: Observed value
+        """
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def merge(self, other):
+        """
+        Combines another RunningStats into this one (Chan et al. parallel update).
+
+        :param other: RunningStats over a disjoint set of observations
+        """
+        if other.n == 0:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta ** 2 * self.n * other.n / n
+        self.n = n
+
+    def variance(self):
+        """
+        :return: Sample variance, or 0.0 with fewer than two observations
+        """
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def stddev(self):
+        return math.sqrt(self.variance())
+
+    def half_width(self, level = 0.95):
+        """
+        :param level: Confidence level
+        :return: Half-width of the confidence interval of the mean (inf with fewer than two observations)
+        """
+        if self.n < 2:
+            return float('inf')
+        return t_critical(level, self.n - 1) * self.stddev() / math.sqrt(self.n)
+
+    def confidence_interval(self, level = 0.95):
+        """
+        :param level: Confidence level
+        :return: Tuple of (low, high) bounds of the mean
+        """
+        h = self.half_width(level)
+        return self.mean - h, self.mean + h
+
+
+class StatsCollector:
+    """
+    Running fault-rate statistics keyed by (algorithm, pid, frame count).
+    """
+
+    def __init__(self, level = 0.95):
+        """
+        :param level: Confidence level of the reported intervals
+        """
+        self.level = level
+        self.stats = {}
+
+    def push(self, algorithm, pid, frame_size, fault_rate):
+        """
+        Adds the fault rate of one simulated sequence.
+
+        :param algorithm: Algorithm name
+        :param pid: Process ID
+        :param frame_size: Number of frames the process had
+        :param fault_rate: Faults divided by accesses of the sequence
+        """
+        key = (algorithm, pid, frame_size)
+        if key not in self.stats:
+            self.stats[key] = RunningStats()
+        self.stats[key].push(fault_rate)
+
+    def by_algorithm(self):
+        """
+        :return: Dictionary of algorithm -> RunningStats pooled over processes and frame counts
+        """
+        pooled = {}
+        for (algorithm, _, _), stats in self.stats.items():
+            pooled.setdefault(algorithm, RunningStats()).merge(stats)
+        return pooled
+
+    def converged(self, target):
+        """
+        :param target: Largest acceptable confidence-interval half-width of the fault rate
+        :return: True once every algorithm's interval is narrower than the target
+        """
+        pooled = self.by_algorithm()
+        return bool(pooled) and all(stats.half_width(self.level) <= target for stats in pooled.values())
+
+
+if __name__ == '__main__':
+    import random
+
+    random.seed(42)
+    stats = RunningStats()
+    for _ in range(1000):
+        stats.push(random.gauss(0.5, 0.1))
+    low, high = stats.confidence_interval()
+    print(f"mean {stats.mean:.4f}, stddev {stats.stddev():.4f}, 95% CI [{low:.4f}, {high:.4f}]")
@@ -0,0 +1,145 @@
+import heapq
+
+
+class SwapDevice:
+    """
+    Simulated swap device for anonymous memory.
+    A page gets a swap slot the first time it is written back. Clean pages are dropped
+    on eviction for free, dirty pages are written back, and a fault on a page that has a
+    slot reads it back in; a page that was never written back is zero-filled without I/O.
+    Write-backs are queued and issued in clusters, so adjacent slots share one I/O.
+    """
+
+    def __init__(self, page_size = 4096, cluster_size = 1, io_latency_ns = 100000, io_page_ns = 10000):
+        """
+        :param page_size: Page size in bytes
+        :param cluster_size: Number of queued write-backs that triggers a batched flush
+        :param io_latency_ns: Fixed cost of one I/O request
+        :param io_page_ns: Transfer cost of one page
+        """
+        if cluster_size < 1:
+            raise ValueError('cluster_size must be greater than 0')
+        self.page_size = page_size
+        self.cluster_size = cluster_size
+        self.io_latency_ns = io_latency_ns
+        self.io_page_ns = io_page_ns
+
+        self.slots = {}  # (pid, page) -> swap slot
+        self.dirty = set()  # (pid, page) written since it was last loaded
+        self.free_slots = []  # Released slots, reused lowest first to keep clusters adjacent
+        self.next_slot = 0
+        self.pending = []  # Slots queued for write-back
+        self.queued = set()  # The slots of `pending`, for O(1) membership tests
+
+        self.page_ins = 0
+        self.cache_hits = 0
+        self.zero_fills = 0
+        self.write_backs = 0
+        self.read_ios = 0
+        self.write_ios = 0
+        self.io_time_ns = 0
+
+    def __allocate_slot(self):
+        if self.free_slots:
+            return heapq.heappop(self.free_slots)
+        self.next_slot += 1
+        return self.next_slot - 1
+
+    def access(self, pid, page, rw):
+        """
+        Records an access; a write makes the resident copy dirty.
+
+        :param pid: Process ID
+        :param page: Page number
+        :param rw: Read/write bit (0 for read, 1 for write)
+        """
+        if rw:
+            self.dirty.add((pid, page))
+
+    def page_in(self, pid, page):
+        """
+        Services a page fault.
+
+        :param pid: Process ID
+        :param page: Page number being loaded
+        :return: Swap slot read from, or None if the page was zero-filled
+        """
+        slot = self.slots.get((pid, page))
+        if slot is None:
+            self.zero_fills += 1
+            return None
+        if slot in self.queued:
+            # Still queued for write-back: served from the swap cache without I/O
+            self.cache_hits += 1
+            return slot
+        self.page_ins += 1
+        self.read_ios += 1
+        self.io_time_ns += self.io_latency_ns + self.io_page_ns
+        return slot
+
+    def evict(self, pid, page):
+        """
+        Evicts a page, writing it back if it is dirty.
+
+        :param pid: Process ID
+        :param page: Page number being evicted
+        :return: Swap slot holding the page, or None if it has never been swapped out
+        """
+        key = (pid, page)
+        if key not in self.dirty:
+            return self.slots.get(key)
+
+        self.dirty.discard(key)
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.__allocate_slot()
+            self.slots[key] = slot
+        if slot not in self.queued:
+            # A page dirtied again before its queued write-back is issued is written once
+            self.write_backs += 1
+            self.pending.append(slot)
+            self.queued.add(slot)
+        if len(self.pending) >= self.cluster_size:
+            self.flush()
+        return slot
+
+    def flush(self):
+        """
+        Issues the queued write-backs; each run of adjacent slots costs a single I/O.
+        """
+        if not self.pending:
+            return
+        slots = sorted(self.pending)
+        runs = 1 + sum(1 for a, b in zip(slots, slots[1:]) if b != a + 1)
+        self.write_ios += runs
+        self.io_time_ns += runs * self.io_latency_ns + len(slots) * self.io_page_ns
+        self.pending = []
+        self.queued.clear()
+
+    def release(self, pid):
+        """
+        Frees every slot of a process, e.g. when it exits or restarts.
+
+        :param pid: Process ID
+        """
+        self.flush()
+        for key in [key for key in self.slots if key[0] == pid]:
+            heapq.heappush(self.free_slots, self.slots.pop(key))
+        self.dirty = {key for key in self.dirty if key[0] != pid}
+
+    def io_bytes(self):
+        """
+        :return: Bytes transferred by page-ins and write-backs
+        """
+        return (self.page_ins + self.write_backs) * self.page_size
+
+
+if __name__ == '__main__':
+    for cluster_size in [1, 8]:
+        swap = SwapDevice(cluster_size = cluster_size)
+        for page in range(64):
+            swap.access(0, page, 1)
+            swap.evict(0, page)
+        swap.flush()
+        print(f"cluster {cluster_size}: {swap.write_backs} write-backs in {swap.write_ios} I/Os, "
+              f"{swap.io_time_ns / 1e6:.2f}ms")
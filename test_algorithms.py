@@ -0,0 +1,222 @@
+import random
+import tracemalloc
+from array import array
+import numpy as np
+import pytest
+from algorithms import OPT, LA_OPT, LRU, SAMPLED_LRU, LFU, NFU, AGING, ADAPTIVE, opt
+from engine import Pager, run_trace, run_stream, make_algorithm
+from fuzz import run_class, run_lfu_reference, run_nfu_reference
+from traces import TRACE_DTYPE
+
+
+def random_trace(seed, pages = 12, length = 300):
+    rng = random.Random(seed)
+    access = [rng.randrange(pages) for _ in range(length)]
+    return access, [rng.randint(0, 1) for _ in access]
+
+
+def chunked(access, modify, size):
+    records = np.empty(len(access), dtype = TRACE_DTYPE)
+    records['page'] = access
+    records['rw'] = modify
+    return [records[i:i + size] for i in range(0, len(records), size)]
+
+
+@pytest.mark.parametrize('fallback', ['LRU', 'FIFO'])
+@pytest.mark.parametrize('seed', range(5))
+def test_la_opt_with_a_full_window_is_opt(seed, fallback):
+    access, modify = random_trace(seed)
+    for frame_size in [1, 3, 6]:
+        full = run_trace(lambda f: LA_OPT(f, len(access), fallback), access, modify, frame_size)
+        assert full == run_trace(OPT, access, modify, frame_size) == opt(access, frame_size)
+
+
+def test_la_opt_never_beats_opt():
+    access, modify = random_trace(7, pages = 20, length = 2000)
+    best = run_trace(OPT, access, modify, 8)
+    for window in [1, 16, 256]:
+        assert run_trace(make_algorithm(f'LA_OPT({window})'), access, modify, 8) >= best
+
+
+def test_la_opt_streamed_matches_whole_trace():
+    access, modify = random_trace(3, length = 1000)
+    factory = make_algorithm('LA_OPT(32)')
+    faults, accesses = run_stream(factory, chunked(access, modify, 97), 5)
+    assert accesses == len(access)
+    assert faults == run_trace(factory, access, modify, 5)
+
+
+def test_opt_refuses_to_stream():
+    access, modify = random_trace(0, length = 10)
+    with pytest.raises(ValueError):
+        run_stream(OPT, chunked(access, modify, 4), 3)
+
+
+def evictions(algorithm, access):
+    pager = Pager(algorithm)
+    return [pager.access(page, 0, page_index, access)[2] for page_index, page in enumerate(access)]
+
+
+def test_lfu_evicts_the_least_frequent_page():
+    # 1 is referenced three times, 2 once: 3 replaces 2
+    assert evictions(LFU(2), [1, 1, 1, 2, 3])[-1] == 2
+
+
+def test_lfu_ties_go_to_the_least_recently_used_page():
+    # 1 and 2 both have two references; 1 was loaded first but used last
+    assert evictions(LFU(2), [1, 2, 2, 1, 3])[-1] == 2
+    assert evictions(LFU(2), [1, 2, 1, 2, 3])[-1] == 1
+
+
+def test_lfu_counts_restart_when_a_page_is_reloaded():
+    # 3 pushes out 1, 1 comes back with a single reference and is the next victim
+    assert evictions(LFU(2), [1, 1, 2, 2, 2, 3, 3, 3, 1, 4])[5:] == [1, None, None, 2, 1]
+
+
+def test_nfu_counters_add_referenced_bits_at_each_tick():
+    nfu = NFU(3, tick = 2)
+    pager = Pager(nfu)
+    for page_index, page in enumerate([0, 1, 0, 2, 0, 0]):
+        pager.access(page, 0, page_index)
+    # Ticks after references 2, 4 and 6: 0 was referenced in all three periods, 1 and 2 in one each;
+    # the eviction brings every slot up to date and the tie goes to the lower slot
+    assert pager.access(3, 0, 6)[2] == 1
+    assert nfu.counter[nfu.page_frame_idx[0]] == 3
+    assert nfu.counter[nfu.page_frame_idx[2]] == 1
+
+
+def test_aging_counters_shift_in_the_referenced_bit():
+    aging = AGING(2, tick = 1, bits = 4)
+    pager = Pager(aging)
+    for page_index, page in enumerate([0, 1, 1, 1]):
+        pager.access(page, 0, page_index)
+    pager.access(2, 0, 4)
+    # After four ticks: 0 was referenced in the first only (0b0001), 1 in the last three (0b1110)
+    assert 0 not in aging.page_frame_idx
+    assert aging.counter[aging.page_frame_idx[1]] == 0b1110
+
+
+@pytest.mark.parametrize('name, reference', [('LFU', run_lfu_reference), ('NFU', run_nfu_reference()),
+                                             ('NFU(3)', run_nfu_reference(3)),
+                                             ('AGING', run_nfu_reference(bits = 8)),
+                                             ('AGING(2,3)', run_nfu_reference(2, 3))])
+def test_frequency_policies_match_brute_force(name, reference):
+    for seed in range(20):
+        access, modify = random_trace(seed, pages = 8, length = 120)
+        for frame_size in [1, 2, 4, 7]:
+            assert run_class(name)(access, modify, frame_size) == reference(access, modify, frame_size)
+
+
+def switch_to(adaptive, policy, page_index):
+    adaptive._ADAPTIVE__switch(adaptive.names.index(policy), page_index)
+
+
+def test_adaptive_fifo_takeover_keeps_the_load_order():
+    adaptive = ADAPTIVE(3, epoch = 1000, policies = ['LRU', 'FIFO'])
+    pager = Pager(adaptive)
+    # LRU replaces 1 by 4 in slot 0, so the slot order 4, 2, 3 is not the load order 2, 3, 4
+    for page_index, page in enumerate([1, 2, 3, 2, 3, 4]):
+        pager.access(page, 0, page_index)
+    switch_to(adaptive, 'FIFO', 5)
+    assert [pager.access(page, 0, 6 + i)[1:] for i, page in enumerate([5, 6, 7])] == [(1, 2), (2, 3), (0, 4)]
+    assert list(adaptive.frame) == [7, 5, 6]
+
+
+def test_adaptive_lru_takeover_keeps_the_recency_order():
+    adaptive = ADAPTIVE(3, epoch = 1000, policies = ['FIFO', 'LRU'])
+    pager = Pager(adaptive)
+    for page_index, page in enumerate([1, 2, 3, 1]):
+        pager.access(page, 0, page_index)
+    switch_to(adaptive, 'LRU', 3)
+    assert pager.access(4, 0, 4)[1:] == (1, 2)
+    assert pager.access(5, 0, 5)[1:] == (2, 3)
+
+
+def test_adaptive_pages_keep_their_frame_across_switches():
+    access, modify = random_trace(0, pages = 10, length = 2000)
+    adaptive = ADAPTIVE(4, epoch = 8)
+    pager = Pager(adaptive)
+    for page_index, (page, rw) in enumerate(zip(access, modify)):
+        pager.access(page, rw, page_index)
+        assert {page: frame_id for frame_id, page in enumerate(adaptive.frame)} == pager.resident
+        assert sorted(adaptive.live.frame) == sorted(adaptive.frame)
+    assert adaptive.switches
+
+
+@pytest.mark.parametrize('pool_size', [0, 4])
+def test_sampled_lru_sampling_every_frame_is_lru(pool_size):
+    for seed in range(10):
+        access, _ = random_trace(seed, pages = 12, length = 400)
+        for frame_size in [1, 3, 8]:
+            assert evictions(SAMPLED_LRU(frame_size, frame_size, pool_size), access) == evictions(LRU(frame_size), access)
+
+
+def test_sampled_lru_bench_fault_counts():
+    from bench import zipf_trace, benchmark
+
+    access, modify = zipf_trace(20000, 5000, 1.1, np.random.default_rng(42))
+    names = ['LRU', 'SAMPLED_LRU(1)', 'SAMPLED_LRU(3)', 'SAMPLED_LRU(5)', 'SAMPLED_LRU(10)', 'SAMPLED_LRU(5,16)']
+    faults = {name: result[0] for name, result in benchmark(names, access, modify, 256).items()}
+    assert faults == {'LRU': 6536, 'SAMPLED_LRU(1)': 7439, 'SAMPLED_LRU(3)': 6758, 'SAMPLED_LRU(5)': 6671,
+                      'SAMPLED_LRU(10)': 6546, 'SAMPLED_LRU(5,16)': 6554}
+
+
+def test_sampled_lru_reset_replays_the_same_samples():
+    access, _ = random_trace(4, pages = 20, length = 500)
+    sampled = SAMPLED_LRU(6, 2, 3)
+    first = evictions(sampled, access)
+    sampled.reset()
+    assert evictions(sampled, access) == first
+
+
+# Fault counts of the classes converted to __slots__ and arrays, as the list-based classes
+# gave them before the conversion; SAMPLED_LRU's were re-pinned when it moved to sampling
+# distinct frames
+CONVERTED_FAULTS = {'OPT': [368, 264, 159], 'LA_OPT(8)': [370, 283, 208], 'FIFO': [496, 435, 300],
+                    'LRU': [498, 438, 296], 'SAMPLED_LRU(3)': [498, 430, 306], 'SAMPLED_LRU(3,4)': [498, 435, 303],
+                    'S_CLOCK': [497, 434, 304], 'E_CLOCK': [494, 424, 304]}
+
+
+@pytest.mark.parametrize('name', CONVERTED_FAULTS)
+def test_converted_classes_keep_their_fault_counts(name):
+    from main import process_page_step
+    from process import Process
+
+    rng = random.Random(2024)
+    access = [rng.randrange(16) for _ in range(600)]
+    modify = [rng.randint(0, 1) for _ in access]
+    faults = []
+    for frame_size in [3, 5, 8]:
+        process = Process(0, list(range(frame_size)), 16 * 1024, 1024)
+        function = make_algorithm(name)(frame_size)
+        faults.append(sum(process_page_step(process, step, function, access) for step in enumerate(zip(access, modify))))
+        assert faults[-1] == run_trace(make_algorithm(name), access, modify, frame_size)
+    assert faults == CONVERTED_FAULTS[name]
+
+
+def test_converted_instances_have_no_dict():
+    from process import Process
+
+    for name in CONVERTED_FAULTS:
+        function = make_algorithm(name)(4)
+        assert not hasattr(function, '__dict__'), name
+        assert isinstance(function.frame, array)
+    process = Process(0, [0, 1], 4096, 1024)
+    assert not hasattr(process, '__dict__')
+    assert isinstance(process.frame, array)
+
+
+@pytest.mark.parametrize('name, list_based_bytes', [('FIFO', 2720), ('S_CLOCK', 3296), ('E_CLOCK', 3888)])
+def test_converted_instances_take_less_memory(name, list_based_bytes):
+    # Footprint of one instance holding 64 resident pages, against the list-based classes
+    tracemalloc.start()
+    functions = []
+    for _ in range(100):
+        pager = Pager(make_algorithm(name)(64))
+        for page in range(64):
+            pager.access(page, page & 1, page)
+        functions.append(pager.function)
+        del pager
+    used = tracemalloc.get_traced_memory()[0] / len(functions)
+    tracemalloc.stop()
+    assert used < list_based_bytes / 2
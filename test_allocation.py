@@ -0,0 +1,105 @@
+import pytest
+from process import Process
+from allocation import (FramePool, ResidentSet, FixedAllocator, WorkingSetAllocator, PFFAllocator,
+                        simulate_allocation)
+
+
+def make_resident_sets(allocator, count):
+    resident_sets = [ResidentSet(Process(pid, [], 16 * 1024, 1024)) for pid in range(count)]
+    for rs in resident_sets:
+        allocator.register(rs)
+    return resident_sets
+
+
+def run(allocator, rs, pages):
+    return [allocator.access(rs, page, 0) for page in pages]
+
+
+def test_fixed_allocation_keeps_its_frames():
+    allocator = FixedAllocator(FramePool(range(4)), 2)
+    rs, = make_resident_sets(allocator, 1)
+    assert run(allocator, rs, [0, 1, 2, 0, 1]) == [1, 1, 1, 1, 1]
+    assert rs.process.frame_size == 2
+    assert len(allocator.pool) == 2
+
+
+def test_fixed_allocation_needs_enough_frames():
+    allocator = FixedAllocator(FramePool(range(3)), 2)
+    make_resident_sets(allocator, 1)
+    with pytest.raises(ValueError):
+        make_resident_sets(allocator, 1)
+
+
+def test_working_set_releases_pages_leaving_the_window():
+    pool = FramePool(range(8))
+    allocator = WorkingSetAllocator(pool, delta = 3)
+    rs, = make_resident_sets(allocator, 1)
+    run(allocator, rs, [0, 1, 2, 3])
+    assert list(rs.pages) == [1, 2, 3]
+    assert rs.process.frame_size == 3
+    assert len(pool) == 5
+
+
+def test_pff_grows_above_the_upper_threshold():
+    allocator = PFFAllocator(FramePool(range(8)), upper = 0.5, lower = 0.1)
+    rs, = make_resident_sets(allocator, 1)
+    run(allocator, rs, [0, 1, 2, 3])
+    assert rs.process.frame_size == 4
+
+
+def test_pff_replaces_locally_between_the_thresholds():
+    allocator = PFFAllocator(FramePool(range(8)), upper = 0.5, lower = 0.1)
+    rs, = make_resident_sets(allocator, 1)
+    # The fault on 2 comes 3 references after the previous one: rate 1/3
+    run(allocator, rs, [0, 1, 0, 0, 2])
+    assert rs.process.frame_size == 2
+    assert list(rs.pages) == [0, 2]
+
+
+def test_pff_shrinks_below_the_lower_threshold():
+    pool = FramePool(range(8))
+    allocator = PFFAllocator(pool, upper = 0.5, lower = 0.1)
+    rs, = make_resident_sets(allocator, 1)
+    # The fault on 3 comes 12 references after the fault on 2: 1 was not referenced since
+    run(allocator, rs, [0, 1, 2] + [0] * 11 + [3])
+    assert sorted(rs.pages) == [0, 2, 3]
+    assert rs.process.frame_size == 3
+    assert len(pool) == 5
+
+
+def test_grow_steals_from_another_process_not_the_requester():
+    allocator = PFFAllocator(FramePool(range(3)))
+    a, b = make_resident_sets(allocator, 2)
+    run(allocator, a, [0, 1])
+    run(allocator, b, [5])
+    # The pool is empty and `a` is the largest process, yet the frame comes from `b`
+    run(allocator, a, [2])
+    assert (a.process.frame_size, b.process.frame_size) == (3, 0)
+    assert list(a.pages) == [0, 1, 2]
+    run(allocator, b, [6])
+    assert (a.process.frame_size, b.process.frame_size) == (2, 1)
+    assert list(a.pages) == [1, 2]
+
+
+def test_grow_falls_back_to_local_replacement():
+    allocator = PFFAllocator(FramePool(range(1)))
+    rs, = make_resident_sets(allocator, 1)
+    assert run(allocator, rs, [0, 1, 2]) == [1, 1, 1]
+    assert list(rs.pages) == [2]
+
+
+def test_grow_without_any_frame_raises():
+    allocator = WorkingSetAllocator(FramePool([]))
+    rs, = make_resident_sets(allocator, 1)
+    with pytest.raises(ValueError):
+        allocator.access(rs, 0, 0)
+
+
+def test_simulate_allocation_conserves_frames():
+    pool = FramePool(range(6))
+    traces = [([0, 1, 2, 3] * 5, [0] * 20), ([4, 5, 4, 5] * 5, [1] * 20)]
+    processes = [Process(pid, [], 16 * 1024, 1024) for pid in range(2)]
+    faults, history = simulate_allocation(PFFAllocator(pool), processes, traces, sample_every = 5)
+    assert len(faults) == 2
+    assert history[-1][0] == 19
+    assert sum(history[-1][1]) + len(pool) == 6
@@ -0,0 +1,50 @@
+import random
+from algorithms import lru
+from analysis import TraceAnalyzer
+
+
+def test_reuse_distances_and_counts():
+    analyzer = TraceAnalyzer(window = 2)
+    analyzer.feed([0, 1, 2, 0, 0, 1], [0, 1, 0, 1, 0, 0])
+    assert analyzer.compulsory == 3
+    assert (analyzer.reads, analyzer.writes) == (4, 2)
+    # 0 after {1, 2}, 0 right after 0, 1 after {2, 0}
+    assert dict(analyzer.histogram) == {2: 2, 0: 1}
+    assert analyzer.ws_max == 2
+
+
+def test_lru_fault_curve_matches_lru():
+    rng = random.Random(1)
+    access = [rng.randrange(40) for _ in range(3000)]
+    analyzer = TraceAnalyzer()
+    analyzer.feed(access, [0] * len(access))
+    curve = analyzer.lru_fault_curve(range(0, 45))
+    for frame_size in range(1, 45):
+        assert curve[frame_size] == lru(access, frame_size) == analyzer.lru_faults(frame_size)
+    assert curve[0] == len(access)
+
+
+def test_compaction_keeps_distances():
+    # A footprint far below the tree size forces many renumberings
+    access = [i % 7 for i in range(5000)]
+    analyzer = TraceAnalyzer()
+    analyzer.feed(access, [0] * len(access))
+    assert dict(analyzer.histogram) == {6: len(access) - 7}
+
+
+def test_restart_makes_the_next_accesses_compulsory():
+    analyzer = TraceAnalyzer()
+    analyzer.feed([0, 1, 0], [0, 0, 0])
+    analyzer.restart()
+    analyzer.feed([0, 1], [0, 0])
+    assert analyzer.compulsory == 4
+    assert analyzer.accesses == 5
+
+
+def test_report_defaults_to_powers_of_two_and_samples_sparsely():
+    analyzer = TraceAnalyzer(sample_every = 100)
+    analyzer.feed([i % 20 for i in range(1000)], [0] * 1000)
+    report = analyzer.report()
+    assert list(report['lru_faults']) == ['1', '2', '4', '8', '16', '20']
+    assert len(report['working_set']['samples']) == 10
+    assert list(analyzer.report([3])['lru_faults']) == ['3']
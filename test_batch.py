@@ -0,0 +1,34 @@
+import random
+import numpy as np
+import pytest
+from batch import BATCH_ALGORITHMS, pad_batch, random_batch, simulate_batch
+from engine import run_trace, make_algorithm
+
+
+def test_pad_batch_pads_with_minus_one():
+    pages, lengths = pad_batch([[1, 2, 3], [4], []])
+    assert pages.tolist() == [[1, 2, 3], [4, -1, -1], [-1, -1, -1]]
+    assert lengths.tolist() == [3, 1, 0]
+
+
+@pytest.mark.parametrize('algorithm', BATCH_ALGORITHMS)
+def test_batch_matches_the_classes(algorithm):
+    rng = random.Random(0)
+    sequences = [[rng.randrange(10) for _ in range(rng.randint(1, 60))] for _ in range(200)]
+    pages, _ = pad_batch(sequences)
+    for frame_size in [1, 3, 5]:
+        faults = simulate_batch(algorithm, pages, frame_size)
+        expected = [run_trace(make_algorithm(algorithm), s, [0] * len(s), frame_size) for s in sequences]
+        assert faults.tolist() == expected
+
+
+def test_random_batch_respects_the_lengths():
+    pages, modify, lengths = random_batch(50, 8, 3, 9, np.random.default_rng(0))
+    assert pages.shape == (50, 9)
+    assert ((pages >= 0).sum(axis = 1) == lengths).all()
+    assert (modify[pages < 0] == 0).all()
+
+
+def test_unsupported_algorithm_is_rejected():
+    with pytest.raises(ValueError):
+        simulate_batch('OPT', np.zeros((1, 1), dtype = np.int64), 1)
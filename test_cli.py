@@ -0,0 +1,40 @@
+import json
+import pytest
+import cli
+import main
+
+
+def run_json(capsys, argv):
+    cli.run(argv)
+    return json.loads(capsys.readouterr().out)
+
+
+def test_simulate_matches_main(capsys):
+    result = run_json(capsys, ['simulate', '--json', '--algorithm', 'FIFO', 'LRU', 'S_CLOCK'])
+    config = main.get_config(['--batch'])
+    faults, accesses = main.simulate_batched(config)
+    assert result == {'accesses': accesses, 'faults': faults}
+
+
+def test_sweep_prints_one_row_per_algorithm_and_frame_count(capsys):
+    cli.run(['sweep', '--frames', '1', '3', '--algorithm', 'OPT', 'LA_OPT(4)'])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == 'algorithm,frames,faults,accesses,fault_rate'
+    rows = [line.split(',') for line in lines[1:]]
+    assert [(row[0], row[1]) for row in rows] == [('OPT', '1'), ('LA_OPT(4)', '1'), ('OPT', '3'), ('LA_OPT(4)', '3')]
+    # With one frame every reference that differs from the previous one faults, whatever the policy
+    assert rows[0][2] == rows[1][2]
+
+
+def test_analyze_reports_every_process(capsys):
+    report = run_json(capsys, ['analyze', '--pid_num', '2', '--frames', '2', '4'])
+    assert list(report) == ['pid0', 'pid1']
+    assert list(report['pid0']['lru_faults']) == ['2', '4']
+
+
+@pytest.mark.parametrize('name', ['NOPE', 'LA_OPT(x)'])
+def test_unknown_algorithm_is_a_usage_error(capsys, name):
+    with pytest.raises(SystemExit) as error:
+        cli.run(['simulate', '--algorithm', name])
+    assert error.value.code == 2
+    assert 'argument --algorithm' in capsys.readouterr().err
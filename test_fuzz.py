@@ -0,0 +1,52 @@
+import subprocess
+import sys
+from pathlib import Path
+import algorithms
+import fuzz
+from fuzz import ENGINES, compare, run_class, run_reference
+
+
+def planted(monkeypatch):
+    # LRU posing as a FIFO engine
+    engines = {'fifo()': run_reference(algorithms.fifo), 'FIFO': run_class('FIFO'), 'broken FIFO': run_class('LRU')}
+    monkeypatch.setitem(ENGINES, 'BROKEN', engines)
+    return engines
+
+
+def test_planted_bug_is_found_and_minimized(monkeypatch):
+    engines = planted(monkeypatch)
+    failures = fuzz.fuzz(['BROKEN', 'FIFO'], 200)
+    assert list(failures) == ['BROKEN']
+    access, modify, frame_size, reason = failures['BROKEN']
+    assert reason == compare(engines, access, modify, frame_size) is not None
+    # The smallest disagreement: two frames, a re-reference, then a third page
+    assert frame_size == 2 and len(access) == 4 and not any(modify)
+    for i in range(len(access)):
+        assert compare(engines, access[:i] + access[i + 1:], modify[:i] + modify[i + 1:], frame_size) is None
+    assert compare(engines, access, modify, 1) is None
+
+
+def test_main_reports_the_counterexample_and_exits_1(monkeypatch, capsys):
+    planted(monkeypatch)
+    assert fuzz.main(['--policy', 'BROKEN', 'LRU', '--cases', '100']) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith('BROKEN: MISMATCH, at step 3')
+    assert lines[1].startswith('    frames 2, access [')
+    assert lines[2] == 'LRU: lru(), LRU, batch LRU, stack distance, NUMA_LRU(4) agree on 100 traces'
+
+
+def test_agreeing_engines_exit_0():
+    result = subprocess.run([sys.executable, 'fuzz.py', '--policy', 'FIFO', 'LFU', '--cases', '50'],
+                            cwd = Path(__file__).parent, capture_output = True, text = True, timeout = 120)
+    assert result.returncode == 0, result.stdout
+    assert 'MISMATCH' not in result.stdout
+
+
+def test_planted_bug_exits_1_from_the_command_line():
+    script = ('import sys, fuzz\n'
+              "fuzz.ENGINES['BROKEN'] = {'FIFO': fuzz.run_class('FIFO'), 'broken FIFO': fuzz.run_class('LRU')}\n"
+              "sys.exit(fuzz.main(['--policy', 'BROKEN', '--cases', '100']))\n")
+    result = subprocess.run([sys.executable, '-c', script], cwd = Path(__file__).parent, capture_output = True,
+                            text = True, timeout = 120)
+    assert result.returncode == 1
+    assert 'BROKEN: MISMATCH' in result.stdout
@@ -0,0 +1,59 @@
+import re
+import pytest
+from urllib.error import HTTPError
+from urllib.request import urlopen
+from metrics import SweepMetrics, MetricsServer
+
+SAMPLE = re.compile(r'^(pagesim_\w+)(\{\w+="[^"]*"(,\w+="[^"]*")*\})? [-+0-9.e]+$')
+
+
+def scrape(url):
+    with urlopen(url, timeout = 5) as response:
+        assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+        text = response.read().decode()
+    samples, types = {}, {}
+    for line in text.splitlines():
+        if line.startswith('# TYPE'):
+            _, _, name, kind = line.split()
+            types[name] = kind
+        elif not line.startswith('# HELP'):
+            match = SAMPLE.match(line)
+            assert match, line
+            # Every sample follows the HELP and TYPE lines of its metric
+            assert match.group(1) in types
+            key, value = line.rsplit(' ', 1)
+            samples[key] = float(value)
+    return samples, types
+
+
+@pytest.fixture
+def served():
+    metrics = SweepMetrics(['FIFO', 'LRU'], jobs_total = 4)
+    server = MetricsServer(metrics, port = 0).start()
+    yield metrics, server
+    server.stop()
+
+
+def test_scrape_is_prometheus_text_and_counters_increase(served):
+    metrics, server = served
+    metrics.record('FIFO', 100, 40, 0.01)
+    before, types = scrape(server.url)
+    assert types['pagesim_faults_total'] == types['pagesim_jobs_completed'] == 'counter'
+    assert before['pagesim_faults_total{algorithm="FIFO"}'] == 40
+    assert before['pagesim_fault_rate{algorithm="FIFO"}'] == 0.4
+    assert before['pagesim_jobs_remaining'] == 3
+
+    metrics.record('FIFO', 100, 10, 0.01)
+    metrics.record('LRU', 50, 5, 0.01, pid = 1234, rss = 4096)
+    after, _ = scrape(server.url)
+    for name in ['pagesim_jobs_completed', 'pagesim_faults_total{algorithm="FIFO"}',
+                 'pagesim_accesses_total{algorithm="FIFO"}', 'pagesim_faults_total{algorithm="LRU"}']:
+        assert after[name] > before[name]
+    assert after['pagesim_worker_resident_bytes{pid="1234"}'] == 4096
+
+
+def test_unknown_paths_are_not_found(served):
+    _, server = served
+    with pytest.raises(HTTPError) as error:
+        urlopen(server.url.replace('/metrics', '/nope'), timeout = 5)
+    assert error.value.code == 404
@@ -0,0 +1,80 @@
+import random
+import pytest
+from algorithms import LRU, NUMA_LRU
+from engine import Pager
+from main import allocate_frames
+from numa import NumaTopology, NumaCost
+
+
+def test_frames_are_split_into_contiguous_nodes():
+    topology = NumaTopology(8, nodes = 4)
+    assert [topology.node_of(frame) for frame in range(8)] == [0, 0, 1, 1, 2, 2, 3, 3]
+    assert [topology.home_node(pid) for pid in range(5)] == [0, 1, 2, 3, 0]
+    assert not topology.is_remote(1, 2) and topology.is_remote(1, 4)
+    with pytest.raises(ValueError):
+        NumaTopology(2, nodes = 3)
+
+
+def test_random_policy_matches_the_topology_unaware_allocation():
+    topology = NumaTopology(16, nodes = 2)
+    random.seed(7)
+    expected = allocate_frames(16, 3, 4)
+    random.seed(7)
+    assert topology.allocate(3, 4, 'random') == expected
+
+
+def test_local_policy_fills_the_home_node_first():
+    topology = NumaTopology(16, nodes = 2)
+    allocations = topology.allocate(2, 6, 'local')
+    for pid, frames in allocations.items():
+        assert not any(topology.is_remote(pid, frame) for frame in frames)
+    # Three processes on two nodes: the third overflows onto the other node
+    allocations = topology.allocate(3, 5, 'local')
+    assert sum(topology.is_remote(2, frame) for frame in allocations[2]) == 2
+    with pytest.raises(ValueError):
+        topology.allocate(3, 6, 'nope')
+
+
+def test_interleave_policy_alternates_nodes_from_home():
+    topology = NumaTopology(16, nodes = 4)
+    frames = topology.allocate(2, 6, 'interleave')[1]
+    assert [topology.node_of(frame) for frame in frames] == [1, 2, 3, 0, 1, 2]
+
+
+def test_every_frame_is_given_out_once():
+    topology = NumaTopology(12, nodes = 3)
+    for policy in ['random', 'local', 'interleave']:
+        frames = [frame for frames in topology.allocate(3, 4, policy).values() for frame in frames]
+        assert sorted(frames) == list(range(12))
+    with pytest.raises(ValueError):
+        topology.allocate(4, 4, 'local')
+
+
+def test_cost_charges_the_distance_of_each_access():
+    topology = NumaTopology(4, nodes = 2, distances = [[10, 30], [25, 12]])
+    cost = NumaCost(topology)
+    for pid, frame in [(0, 0), (0, 3), (1, 3), (1, 0)]:
+        cost.access(pid, frame)
+    assert (cost.local, cost.remote, cost.latency_ns) == (2, 2, 10 + 30 + 12 + 25)
+    assert cost.mean_latency() == pytest.approx(77 / 4)
+    assert NumaCost(topology).mean_latency() == 0.0
+
+
+def victims(algorithm, access):
+    pager = Pager(algorithm)
+    return [pager.access(page, 0, page_index)[2] for page_index, page in enumerate(access)]
+
+
+@pytest.mark.parametrize('prefer_remote, victim', [(0, 2), (1, 1)])
+def test_numa_lru_evicts_the_oldest_page_on_the_preferred_side(prefer_remote, victim):
+    numa_lru = NUMA_LRU(4, candidates = 3, prefer_remote = prefer_remote)
+    numa_lru.set_remote([1, 0, 0, 1])
+    # 1 (remote slot) and 2 (local slot) are the two least recently used pages
+    assert victims(numa_lru, [1, 2, 3, 4, 5])[-1] == victim
+
+
+def test_numa_lru_without_remote_frames_is_lru():
+    rng = random.Random(0)
+    access = [rng.randrange(10) for _ in range(500)]
+    for prefer_remote in [0, 1]:
+        assert victims(NUMA_LRU(4, 3, prefer_remote), access) == victims(LRU(4), access)
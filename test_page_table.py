@@ -0,0 +1,55 @@
+import pytest
+from page_table import PageTable
+
+
+def test_levels_split_the_page_number():
+    table = PageTable(1 << 36)
+    assert (table.levels, table.bits, table.fanout) == (4, 9, 512)
+    assert PageTable(8, levels = 4).levels == 3  # No more levels than page bits
+
+
+def test_intermediate_tables_are_allocated_lazily():
+    table = PageTable(1 << 36)
+    assert (table.tables, len(table)) == (1, 0)
+    assert table.get(5) is None and 5 not in table
+    assert table.tables == 1  # Looking a page up allocates nothing
+    table[5][2] = 1
+    assert table.tables == 4  # One table per level under the root
+    table[6]
+    assert table.tables == 4  # Same leaf table
+    table[512]
+    assert table.tables == 5  # A new leaf under the same upper tables
+    assert table.memory_entries() == 5 * 512
+
+
+def test_sparse_high_pages_are_looked_up():
+    table = PageTable(1 << 36)
+    high = [(1 << 36) - 1, 1 << 35, (1 << 35) + 511]
+    for page in high + [0]:
+        table[page][1] = page % 97
+    for page in high:
+        assert table.get(page) == [str(page), page % 97, 0, 0, -1, '-']
+    assert table.get((1 << 35) + 512) is None
+    assert [row[0] for row in table] == [str(page) for page in sorted(high + [0])]
+    # Three paths of three tables: the two pages just above 1 << 35 share their leaf
+    assert table.tables == 1 + 3 * 3
+    with pytest.raises(IndexError):
+        table[1 << 36]
+    assert table.get(-1) is None
+
+
+def test_unmap_reclaims_empty_subtables():
+    table = PageTable(1 << 36)
+    table[0]
+    table[1]
+    table[1 << 35]
+    assert table.tables == 7
+    assert table.unmap(1)[0] == '1'
+    assert table.tables == 7  # 0 still uses the leaf
+    table.unmap(1 << 35)
+    assert table.tables == 4
+    table.unmap(0)
+    assert (table.tables, len(table), list(table)) == (1, 0, [])
+    assert table.unmap(0) is None and table.unmap(1 << 36) is None
+    table[3]
+    assert table.tables == 4
@@ -0,0 +1,55 @@
+import random
+import pytest
+from algorithms import ALGORITHMS
+from main import process_page_step
+from prefetch import SequentialPrefetcher, StridePrefetcher
+from process import Process
+
+
+def sequential_trace(seed, pages = 16, length = 400):
+    # Runs of consecutive pages broken by random jumps
+    rng = random.Random(seed)
+    access, page = [], 0
+    for _ in range(length):
+        page = (page + 1) % pages if rng.random() < 0.7 else rng.randrange(pages)
+        access.append(page)
+    return access
+
+
+@pytest.mark.parametrize('name', ALGORITHMS)
+@pytest.mark.parametrize('prefetcher', [SequentialPrefetcher, StridePrefetcher])
+def test_the_faulting_page_stays_resident(name, prefetcher):
+    for seed in range(8):
+        access = sequential_trace(seed)
+        process = Process(0, list(range(4)), 16 * 1024, 1024)
+        function = ALGORITHMS[name](process.frame_size)
+        read_ahead = prefetcher()
+        for page_id, page in enumerate(access):
+            process_page_step(process, (page_id, (page, 0)), function, access, prefetcher = read_ahead)
+            assert process.page_table[page][2] == 1
+            assert sorted(function.frame) == sorted(p for p in process.frame if p >= 0)
+
+
+def test_prefetching_avoids_sequential_faults():
+    access = list(range(16)) * 4
+    faults = {}
+    for read_ahead in [None, SequentialPrefetcher()]:
+        process = Process(0, list(range(4)), 16 * 1024, 1024)
+        function = ALGORITHMS['LRU'](process.frame_size)
+        faults[read_ahead is None] = sum(process_page_step(process, (page_id, (page, 0)), function, access,
+                                                           prefetcher = read_ahead)
+                                         for page_id, page in enumerate(access))
+    assert faults[True] == len(access)
+    assert faults[False] < faults[True]
+
+
+def test_prefetcher_counts_useful_and_wasted_pages():
+    prefetcher = SequentialPrefetcher(max_window = 4)
+    prefetcher.admitted(5)
+    prefetcher.admitted(6)
+    prefetcher.observe(5, 0)
+    prefetcher.evicted(6)
+    prefetcher.evicted(7)  # Never prefetched
+    assert (prefetcher.issued, prefetcher.useful, prefetcher.wasted) == (2, 1, 1)
+    assert prefetcher.accuracy() == 0.5
+    assert prefetcher.coverage(1) == 0.5
@@ -0,0 +1,59 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+from algorithms import E_CLOCK
+from quick_start import FastForward
+
+STEP = re.compile(r'\[([^\]]*)\] step (\d+): page \d+ \(\w+\), (hit|page fault)(, evicted page (\d+))?')
+
+
+def run_quick_start(*args):
+    # stdin is not a terminal, so rendered steps must not wait for input
+    result = subprocess.run([sys.executable, 'quick_start.py', *args], cwd = Path(__file__).parent,
+                            stdin = subprocess.DEVNULL, capture_output = True, text = True, timeout = 60)
+    assert result.returncode == 0, result.stderr
+    assert 'Enter: next' not in result.stdout
+    # Rendered steps of each algorithm, in the order the algorithms run
+    output = re.sub(r'\x1b\[[0-9;]*m', '', result.stdout)
+    runs = re.split(r'PID 1 Use (\w+)', output)[1:]
+    return {name: STEP.findall(output) for name, output in zip(runs[::2], runs[1::2])}
+
+
+def test_every_renders_only_the_selected_steps():
+    runs = run_quick_start('--length', '60', '--every', '10')
+    assert list(runs) == ['OPT', 'FIFO', 'LRU', 'S_CLOCK', 'E_CLOCK']
+    for steps in runs.values():
+        assert [int(step[1]) for step in steps] == [9, 19, 29, 39, 49, 59]
+        assert {step[0] for step in steps} == {'every 10 steps'}
+
+
+def test_break_evict_renders_only_evictions_of_the_watched_page():
+    runs = run_quick_start('--length', '80', '--break_evict', '3')
+    assert any(runs.values())
+    for steps in runs.values():
+        assert all(step[0] == 'page 3 evicted' and step[4] == '3' for step in steps)
+
+
+def test_break_reset_only_fires_under_e_clock():
+    runs = run_quick_start('--length', '200', '--break_reset')
+    assert runs['E_CLOCK']
+    assert all(step[0] == 'E_CLOCK cleared every use bit' for step in runs['E_CLOCK'])
+    assert not any(runs[name] for name in runs if name != 'E_CLOCK')
+
+
+def test_check_combines_reasons_and_stops_after_q():
+    viewer = FastForward(every = 5, faults = True, evict_pages = [7], pause = False)
+    clock = E_CLOCK(2)
+    viewer.start(clock)
+    assert viewer.check(0, 0, None, clock) is None
+    assert viewer.check(4, 1, 7, clock) == 'page 7 evicted, page fault, every 5 steps'
+    clock.full_resets += 1
+    assert viewer.check(5, 0, None, clock) is None  # Not watching full resets
+    viewer.rendering = False
+    assert viewer.check(9, 1, 7, clock) is None
+
+
+def test_pause_is_off_without_a_terminal(monkeypatch):
+    monkeypatch.setattr(sys.stdin, 'isatty', lambda: False)
+    assert not FastForward(every = 1).pause
@@ -0,0 +1,59 @@
+import numpy as np
+from process import Process
+from algorithms import LRU, S_CLOCK
+from main import process_page_step
+from recorder import TimelineRecorder, TimelineReplay
+
+SEQUENCES = [([0, 1, 2, 0, 3, 0, 4], [0, 1, 0, 1, 0, 0, 1]), ([5, 5, 6, 7, 5, 1], [1, 0, 0, 1, 0, 0])]
+
+
+def record_run(path, algorithm, block):
+    process = Process(0, [7, 2, 9], 8 * 1024, 1024)
+    recorder = TimelineRecorder(path, process, algorithm.__name__, block = block)
+    expected = []
+    for access, modify in SEQUENCES:
+        process.reset()
+        function = algorithm(process.frame_size)
+        recorder.new_sequence()
+        for step in enumerate(zip(access, modify)):
+            fault = process_page_step(process, step, function, access, recorder = recorder)
+            expected.append((step[1][0], step[1][1], fault, list(process.frame)))
+    recorder.close()
+    return expected
+
+
+def test_replay_returns_every_recorded_step(tmp_path):
+    expected = record_run(tmp_path / 'lru', LRU, block = 4)
+    replay = TimelineReplay(tmp_path / 'lru')
+    assert len(replay) == len(expected)
+    assert replay.meta['sequences'] == 2
+    assert replay.seq_starts.tolist() == [0, len(SEQUENCES[0][0])]
+    for step, (page, rw, fault, frame) in enumerate(expected):
+        record = replay[step]
+        assert (int(record['page']), int(record['rw']), int(record['fault'])) == (page, rw, fault)
+        assert record['frame'].tolist() == frame
+    assert replay.columns['seq'].tolist() == [0] * 7 + [1] * 6
+    assert int(np.asarray(replay.columns['fault']).sum()) == sum(fault for _, _, fault, _ in expected)
+
+
+def test_replay_records_evictions_and_use_bits(tmp_path):
+    record_run(tmp_path / 'clock', S_CLOCK, block = 1000)
+    replay = TimelineReplay(tmp_path / 'clock')
+    evicted = replay.columns['evicted'].tolist()
+    # The fifth reference (page 3) is the first one that needs a victim
+    assert evicted[:4] == [-1] * 4 and evicted[4] > -1
+    assert replay.columns['use'].shape == (len(replay), 3)
+    assert replay.columns['use'].any()
+
+
+def test_process_at_rebuilds_the_frame_state(tmp_path):
+    expected = record_run(tmp_path / 'lru', LRU, block = 3)
+    replay = TimelineReplay(tmp_path / 'lru')
+    for step in [0, 6, 7, len(replay) - 1]:
+        process = replay.process_at(step)
+        frame = expected[step][3]
+        assert list(process.frame) == frame
+        for slot, page in enumerate(frame):
+            if page > -1:
+                assert process.page_table[page][1] == [7, 2, 9][slot]
+                assert process.page_table[page][2] == 1
@@ -0,0 +1,50 @@
+import random
+from scheduler import CyclicTrace, Scheduler, sweep_multiprogramming, detect_thrashing
+
+
+def make_traces(count, pages = 16, hot = 4, length = 100, seed = 0):
+    rng = random.Random(seed)
+    traces = []
+    for _ in range(count):
+        working_set = rng.sample(range(pages), hot)
+        access = [rng.choice(working_set) for _ in range(length)]
+        traces.append((access, [0] * length))
+    return traces
+
+
+def test_cyclic_trace_finds_next_use_across_passes():
+    trace = CyclicTrace([3, 1, 3, 2])
+    assert trace[5] == 1
+    assert trace[3:6] == [2, 3, 1]
+    assert trace.index(3, 3) == 4
+    assert trace.index(2, 4) == 7
+
+
+def test_frames_are_shared_out_among_processes():
+    scheduler = Scheduler('LRU', make_traces(4), 32)
+    assert (scheduler.resident, scheduler.frames_per_process) == (4, 8)
+
+
+def test_memory_is_never_overcommitted():
+    scheduler = Scheduler('LRU', make_traces(40), 8)
+    assert scheduler.resident * scheduler.frames_per_process <= 8
+    result = scheduler.run(300000)
+    assert (result['processes'], result['resident'], result['frames']) == (40, 8, 1)
+    assert result['swaps'] > 0
+    # Suspended processes get their turn once resident ones complete a pass
+    assert sum(p.clock > 0 for p in scheduler.processes) > 8
+
+
+def test_no_swapping_when_every_process_fits():
+    result = Scheduler('FIFO', make_traces(4), 16).run(5000)
+    assert result['swaps'] == 0
+    assert result['references'] > 0
+    assert 0 < result['cpu_utilization'] <= 1
+
+
+def test_thrashing_is_detected_past_the_working_sets():
+    traces = make_traces(16, hot = 6)
+    points = sweep_multiprogramming('LRU', traces, 24, [1, 2, 4, 8, 16], 20000, fault_time = 200)
+    assert points[0]['cpu_utilization'] > points[-1]['cpu_utilization']
+    assert detect_thrashing(points) in (8, 16)
+    assert detect_thrashing([]) is None
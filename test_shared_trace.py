@@ -0,0 +1,79 @@
+import multiprocessing
+import random
+import numpy as np
+import pytest
+from engine import run_trace, make_algorithm
+from shared_trace import SharedTraceStore, run_shared_sweep
+
+
+def make_traces(count = 4, seed = 0):
+    rng = random.Random(seed)
+    traces = []
+    for _ in range(count):
+        length = rng.randint(1, 300)
+        traces.append(([rng.randrange(16) for _ in range(length)], [rng.randint(0, 1) for _ in range(length)]))
+    return traces
+
+
+def check_in_worker(name, traces, marker):
+    # Runs in a child process: compare the data, then write through the view
+    store = SharedTraceStore.attach(name)
+    try:
+        for index, (access, modify) in enumerate(traces):
+            pages, rw = store.trace(index)
+            assert pages.tolist() == access and rw.tolist() == modify
+            assert np.shares_memory(pages, store.pages)
+        store.pages[0] = marker
+    finally:
+        store.close()
+
+
+def test_layout_round_trips():
+    traces = make_traces()
+    store = SharedTraceStore.create(traces)
+    try:
+        assert len(store) == len(traces)
+        for index, (access, modify) in enumerate(traces):
+            pages, rw = store.trace(index)
+            assert (pages.tolist(), rw.tolist()) == (access, modify)
+        assert store.shm.size >= 8 * (len(traces) + 2) + 9 * sum(len(access) for access, _ in traces)
+    finally:
+        store.close()
+
+
+def test_worker_attaches_without_copying_and_unlink_frees_the_block():
+    traces = make_traces()
+    store = SharedTraceStore.create(traces)
+    name = store.name
+    try:
+        worker = multiprocessing.get_context('fork').Process(target = check_in_worker, args = (name, traces, 999))
+        worker.start()
+        worker.join(30)
+        assert worker.exitcode == 0
+        # The worker wrote into the same physical pages
+        assert store.pages[0] == 999
+    finally:
+        store.close()
+    assert store.pages is None
+    with pytest.raises(FileNotFoundError):
+        SharedTraceStore.attach(name)
+
+
+def test_attached_store_does_not_unlink():
+    store = SharedTraceStore.create(make_traces(1))
+    try:
+        SharedTraceStore.attach(store.name).close()
+        SharedTraceStore.attach(store.name).close()  # Still there
+    finally:
+        store.close()
+
+
+def test_shared_sweep_matches_the_engine():
+    traces = make_traces(6, seed = 1)
+    store = SharedTraceStore.create(traces)
+    try:
+        results = run_shared_sweep(store, ['FIFO', 'LRU', 'OPT'], 4, workers = 2)
+    finally:
+        store.close()
+    for algorithm, faults in results.items():
+        assert faults == [run_trace(make_algorithm(algorithm), access, modify, 4) for access, modify in traces]
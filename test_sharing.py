@@ -0,0 +1,42 @@
+import random
+from sharing import CowMapper, simulate_sharing
+
+
+def test_shared_pages_map_to_one_physical_page_until_written():
+    mapper = CowMapper(3, total_pages = 8, shared_pages = 4)
+    assert mapper.key(0, 2) == mapper.key(1, 2) == 2
+    assert mapper.key(0, 6) != mapper.key(1, 6)
+
+    assert mapper.write(0, 2)
+    assert mapper.key(0, 2) == 8 + 2
+    assert mapper.key(1, 2) == 2
+    assert not mapper.write(0, 2)  # Already private
+    assert not mapper.write(0, 6)  # Never shared
+
+
+def test_last_sharer_keeps_the_page():
+    mapper = CowMapper(2, total_pages = 4, shared_pages = 4)
+    assert mapper.write(0, 1)
+    assert not mapper.write(1, 1)
+    assert mapper.key(1, 1) == 1
+
+
+def test_a_single_process_shares_nothing():
+    mapper = CowMapper(1, total_pages = 4, shared_pages = 4)
+    assert mapper.shared_pages == 0
+
+
+def test_sharing_avoids_duplicates_and_faults():
+    rng = random.Random(0)
+    traces = []
+    for _ in range(4):
+        access = [rng.randrange(16) for _ in range(400)]
+        traces.append((access, [int(rng.random() < 0.02) for _ in access]))
+    private = simulate_sharing('LRU', traces, 24, 16, 0)
+    shared = simulate_sharing('LRU', traces, 24, 16, 16)
+    assert private['cow_faults'] == 0 and private['peak_duplicates_avoided'] == 0
+    assert shared['references'] == private['references'] == 1600
+    assert shared['faults'] < private['faults']
+    assert shared['cow_faults'] > 0
+    # Each resident shared page stands in for at most three copies
+    assert 0 < shared['mean_duplicates_avoided'] <= shared['peak_duplicates_avoided'] <= 3 * 16
@@ -0,0 +1,65 @@
+import math
+import random
+import statistics
+import pytest
+from stats import RunningStats, StatsCollector, t_critical
+
+
+@pytest.mark.parametrize('level, df, expected', [(0.95, 1, 12.706), (0.95, 2, 4.303), (0.95, 5, 2.571),
+                                                 (0.99, 1, 63.657), (0.90, 30, 1.697), (0.95, 40, 2.021),
+                                                 (0.95, 120, 1.980), (0.80, 1, 3.078), (0.80, 2, 1.886),
+                                                 (0.80, 10, 1.372)])
+def test_t_critical_matches_the_t_table(level, df, expected):
+    assert t_critical(level, df) == pytest.approx(expected, abs = 2e-3)
+
+
+def test_t_critical_falls_with_more_samples_towards_the_normal_quantile():
+    values = [t_critical(0.95, df) for df in range(1, 200)]
+    assert values == sorted(values, reverse = True)
+    assert t_critical(0.95, 10 ** 6) == pytest.approx(statistics.NormalDist().inv_cdf(0.975), rel = 1e-5)
+    assert t_critical(0.95, 0) == math.inf
+
+
+def test_running_stats_match_statistics():
+    rng = random.Random(0)
+    values = [rng.gauss(0.5, 0.1) for _ in range(1000)]
+    stats = RunningStats()
+    for value in values:
+        stats.push(value)
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.variance() == pytest.approx(statistics.variance(values))
+    assert stats.stddev() == pytest.approx(statistics.stdev(values))
+    low, high = stats.confidence_interval()
+    assert high - stats.mean == pytest.approx(t_critical(0.95, 999) * statistics.stdev(values) / math.sqrt(1000))
+    assert low < stats.mean < high
+
+
+def test_merge_equals_one_pass():
+    rng = random.Random(1)
+    values = [rng.random() for _ in range(101)]
+    left, right, whole = RunningStats(), RunningStats(), RunningStats()
+    for i, value in enumerate(values):
+        (left if i < 37 else right).push(value)
+        whole.push(value)
+    left.merge(right)
+    left.merge(RunningStats())
+    assert left.n == whole.n
+    assert left.mean == pytest.approx(whole.mean)
+    assert left.variance() == pytest.approx(whole.variance())
+
+
+def test_single_observation_has_no_interval():
+    stats = RunningStats()
+    stats.push(0.3)
+    assert stats.variance() == 0.0
+    assert stats.half_width() == math.inf
+
+
+def test_small_samples_do_not_converge_early():
+    # Two sequences 0.2 apart: the exact t value at one degree of freedom keeps the interval wide
+    collector = StatsCollector(0.95)
+    collector.push('LRU', 0, 4, 0.4)
+    collector.push('LRU', 0, 4, 0.6)
+    assert collector.by_algorithm()['LRU'].half_width() == pytest.approx(12.706 * 0.1)
+    assert not collector.converged(1.0)
+    assert not StatsCollector().converged(1.0)
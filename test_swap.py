@@ -0,0 +1,87 @@
+from swap import SwapDevice
+
+
+def test_clean_pages_are_dropped_and_zero_filled():
+    swap = SwapDevice()
+    swap.access(0, 1, 0)
+    assert swap.evict(0, 1) is None
+    assert swap.page_in(0, 1) is None
+    assert (swap.write_backs, swap.zero_fills, swap.page_ins) == (0, 1, 0)
+    assert swap.io_bytes() == 0
+
+
+def test_dirty_page_is_written_back_and_read_in():
+    swap = SwapDevice(page_size = 4096)
+    swap.access(0, 7, 1)
+    slot = swap.evict(0, 7)
+    assert slot == 0
+    assert swap.page_in(0, 7) == slot
+    assert (swap.write_backs, swap.write_ios, swap.page_ins, swap.read_ios) == (1, 1, 1, 1)
+    assert swap.io_bytes() == 2 * 4096
+
+    # Evicted clean again: the copy in the slot is still valid, nothing is written
+    assert swap.evict(0, 7) == slot
+    assert swap.write_backs == 1
+
+
+def test_queued_write_back_serves_page_in_from_cache():
+    swap = SwapDevice(cluster_size = 4)
+    swap.access(0, 3, 1)
+    slot = swap.evict(0, 3)
+    assert swap.page_in(0, 3) == slot
+    assert (swap.cache_hits, swap.page_ins, swap.read_ios) == (1, 0, 0)
+
+
+def test_redirtied_page_in_queue_is_written_once():
+    swap = SwapDevice(cluster_size = 4)
+    for _ in range(3):
+        swap.access(0, 3, 1)
+        swap.evict(0, 3)
+        swap.page_in(0, 3)
+    swap.flush()
+    assert swap.write_backs == 1
+    assert swap.write_ios == 1
+    assert swap.io_bytes() == swap.page_size
+
+
+def test_adjacent_slots_share_one_io():
+    swap = SwapDevice(cluster_size = 8, io_latency_ns = 1000, io_page_ns = 10)
+    for page in range(8):
+        swap.access(0, page, 1)
+        swap.evict(0, page)
+    assert (swap.write_backs, swap.write_ios) == (8, 1)
+    assert swap.io_time_ns == 1000 + 8 * 10
+
+
+def test_release_frees_slots_for_reuse_lowest_first():
+    swap = SwapDevice()
+    for page in range(3):
+        swap.access(0, page, 1)
+        swap.evict(0, page)
+    swap.access(1, 0, 1)
+    assert swap.evict(1, 0) == 3
+    swap.release(0)
+    swap.access(1, 1, 1)
+    assert swap.evict(1, 1) == 0
+    assert swap.page_in(0, 2) is None  # The released process starts from zero-filled pages
+
+
+def test_page_table_shows_swap_addresses_without_leaking_colour():
+    from colorama import Fore
+    from algorithms import FIFO
+    from main import process_page_step
+    from process import Process
+
+    process = Process(0, [0, 1], 8 * 1024, 1024)
+    swap = SwapDevice(1024)
+    function = FIFO(process.frame_size)
+    access, modify = [0, 1, 2, 0], [1, 1, 0, 0]
+    for step in enumerate(zip(access, modify)):
+        process_page_step(process, step, function, access, swap = swap)
+    # 2 wrote the dirty page 0 out to slot 0; 0 was read back from it and wrote 1 out to slot 1
+    rows = {int(row[0].replace(Fore.GREEN, '')): row for row in process.page_table}
+    assert rows[0][0].startswith(Fore.GREEN) and rows[0][-1] == '0' + Fore.RESET
+    assert rows[1][-1] == '1'  # Evicted pages keep their swap address
+    assert rows[2][-1] == '-' + Fore.RESET
+    for row in rows.values():
+        assert row[0].startswith(Fore.GREEN) == row[-1].endswith(Fore.RESET)
@@ -0,0 +1,67 @@
+from swap import SwapDevice
+from tiers import CompressedPool, TierChain
+
+
+def make_pool(capacity_kb, ratio, **kwargs):
+    # Sized the way main.py sizes --compressed_kb
+    return CompressedPool(capacity_kb * 1024, 4096, ratio, spread = 0, **kwargs)
+
+
+def test_capacity_in_kb_scales_with_the_compression_ratio():
+    for ratio, fits in [(4.0, 8), (2.0, 4)]:
+        pool = make_pool(8, ratio)
+        assert pool.compressed_size(0, 1) == 4096 // ratio
+        assert all(pool.store(0, page) == [] for page in range(fits))
+        assert pool.used == 8 * 1024
+        # One more page pushes the oldest one out
+        assert pool.store(0, fits) == [(0, 0)]
+        assert (pool.stores, pool.write_backs, pool.peak) == (fits + 1, 1, 8 * 1024)
+
+
+def test_incompressible_pages_are_rejected():
+    pool = make_pool(8, 1.0)
+    assert pool.store(0, 1) == [(0, 1)]
+    assert (pool.rejects, pool.used) == (1, 0)
+    assert make_pool(0, 4.0).store(0, 1) == [(0, 1)]
+
+
+def test_spread_sizes_are_the_same_for_every_algorithm():
+    pool, other = CompressedPool(1 << 20), CompressedPool(1 << 20)
+    sizes = [pool.compressed_size(pid, page) for pid in range(3) for page in range(50)]
+    assert sizes == [other.compressed_size(pid, page) for pid in range(3) for page in range(50)]
+    assert len(set(sizes)) > 1
+    assert all(4096 / 3 * 0.5 <= size <= 4096 / 3 * 1.5 for size in sizes)
+
+
+def test_full_pool_spills_dirty_pages_to_swap():
+    chain = TierChain(make_pool(2, 4.0), SwapDevice(4096))  # Two compressed pages
+    for page in range(3):
+        chain.access(0, page, 1)
+        chain.evict(0, page)
+    # Page 0 left the pool for swap; 1 and 2 are compressed
+    assert list(chain.pool.entries) == [(0, 1), (0, 2)]
+    assert chain.swap.write_backs == 1
+    chain.flush()
+    assert chain.page_in(0, 0) is not None
+    assert (chain.swap.page_ins, chain.pool.hits) == (1, 0)
+
+
+def test_faults_promote_pages_back_from_the_pool():
+    chain = TierChain(make_pool(8, 4.0))
+    chain.access(0, 5, 0)
+    chain.evict(0, 5)  # Clean pages are compressed too
+    assert (0, 5) in chain.pool.entries
+    assert chain.page_in(0, 5) is None  # Never written to swap
+    # The load is exclusive: the page leaves the pool and frees its room
+    assert (chain.pool.hits, chain.pool.used, chain.swap.page_ins, chain.swap.zero_fills) == (1, 0, 0, 0)
+    assert not chain.pool.load(0, 5)
+    assert chain.time_ns() == chain.pool.compress_ns + chain.pool.decompress_ns
+
+
+def test_release_drops_only_the_process_pages():
+    chain = TierChain(make_pool(8, 4.0))
+    for pid in range(2):
+        chain.evict(pid, 1)
+    chain.release(0)
+    assert list(chain.pool.entries) == [(1, 1)]
+    assert chain.pool.used == 1024
@@ -0,0 +1,58 @@
+import pytest
+from algorithms import FIFO
+from main import process_page_step
+from process import Process
+from tlb import TLB, effective_access_time
+
+
+def test_lru_replacement_within_a_set():
+    tlb = TLB(entries = 4, ways = 2)  # Two sets: even and odd pages
+    assert [tlb.lookup(page) for page in [0, 2, 0, 4, 0, 2]] == [False, False, True, False, True, False]
+    # 4 replaced 2, the least recently used entry of the even set; 2 then replaced 4
+    assert list(tlb.sets[0]) == [0, 2]
+    assert (tlb.hits, tlb.misses) == (2, 4)
+
+
+def test_sets_do_not_compete():
+    tlb = TLB(entries = 4, ways = 2)
+    for page in [0, 2, 1, 3, 5]:
+        tlb.lookup(page)
+    assert tlb.lookup(0) and tlb.lookup(2)
+    assert not tlb.lookup(1)
+
+
+def test_huge_page_entries_cover_many_base_pages():
+    tlb = TLB(entries = 4, ways = 4, page_size = 16384, base_page_size = 4096)
+    assert [tlb.lookup(page) for page in [0, 1, 3, 4, 7]] == [False, True, True, False, True]
+    assert tlb.reach() == 4 * 16384
+    tlb.invalidate(2, current = 1)  # The entry still maps the incoming page
+    assert tlb.lookup(0)
+    tlb.invalidate(2)
+    assert not tlb.lookup(0)
+
+
+def test_invalid_geometry_is_rejected():
+    with pytest.raises(ValueError):
+        TLB(entries = 6, ways = 4)
+    with pytest.raises(ValueError):
+        TLB(page_size = 6144)
+
+
+def test_evicted_pages_are_shot_down():
+    process = Process(0, [0, 1], 8 * 1024, 1024)
+    tlb = TLB(entries = 8, ways = 8, page_size = 1024, base_page_size = 1024)
+    function = FIFO(process.frame_size)
+    access = [0, 1, 2, 0]
+    for page_id, page in enumerate(access):
+        process_page_step(process, (page_id, (page, 0)), function, access, [tlb])
+    # 2 evicted 0, so the last reference to 0 misses although the TLB had room for it
+    assert (tlb.hits, tlb.misses) == (0, 4)
+    assert 1 not in tlb.sets[0] and 0 in tlb.sets[0] and 2 in tlb.sets[0]
+
+
+def test_effective_access_time_formula():
+    # 1ns lookup + 100ns access, 10% of references walk 4 levels, 1% fault at 10us
+    assert effective_access_time(1000, 100, 10, mem_ns = 100, tlb_ns = 1, fault_ns = 10000,
+                                 walk_levels = 4) == pytest.approx(1 + 100 + 0.1 * 400 + 0.01 * 10000)
+    assert effective_access_time(10, 0, 0, mem_ns = 50, tlb_ns = 2) == 52
+    assert effective_access_time(0, 0, 0) == 0.0
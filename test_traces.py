@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from traces import (parse_lackey_chunk, addresses_to_pages, iter_lackey_trace, convert_lackey_trace, load_trace,
+                    save_trace, compact_pages)
+
+
+def test_parse_skips_banners_and_keeps_ops():
+    chunk = (b'==1234== Lackey, an example Valgrind tool\n'
+             b'I  04016c10,3\n'
+             b' S 7ff000ffe,8\n'
+             b' L 04222cac,4\n'
+             b' M 0421fffe,4\n'
+             b'==1234== \n')
+    addresses, sizes, rw = parse_lackey_chunk(chunk)
+    assert addresses.tolist() == [0x04016c10, 0x7ff000ffe, 0x04222cac, 0x0421fffe]
+    assert sizes.tolist() == [3, 8, 4, 4]
+    assert rw.tolist() == [0, 1, 0, 1]
+
+
+def test_parse_handles_crlf_and_missing_final_newline():
+    addresses, sizes, rw = parse_lackey_chunk(b' L 1000,4\r\n S 2000,16\r\n L 3000,2')
+    assert addresses.tolist() == [0x1000, 0x2000, 0x3000]
+    assert sizes.tolist() == [4, 16, 2]
+    assert rw.tolist() == [0, 1, 0]
+
+
+def test_parse_can_drop_instruction_fetches():
+    addresses, _, _ = parse_lackey_chunk(b'I  1000,4\n L 2000,4\n', include_instructions = False)
+    assert addresses.tolist() == [0x2000]
+
+
+def test_parse_rejects_malformed_lines():
+    addresses, _, _ = parse_lackey_chunk(b' L zz00,4\n X 1000,4\n L 1000\n L 3000,4\n')
+    assert addresses.tolist() == [0x3000]
+
+
+def test_straddling_access_touches_every_page():
+    records = addresses_to_pages([4094, 8192, 100], [4, 8192, 0], np.array([1, 0, 0], dtype = np.uint8), 4096)
+    assert records['page'].tolist() == [0, 1, 2, 3, 0]
+    assert records['rw'].tolist() == [1, 1, 0, 0, 0]
+
+
+def test_non_power_of_two_page_size():
+    records = addresses_to_pages([2999, 3000], [2, 1], np.zeros(2, dtype = np.uint8), 3000)
+    assert records['page'].tolist() == [0, 1, 1]
+
+
+def test_streaming_matches_whole_file_across_chunk_boundaries(tmp_path):
+    lines = [b' L %x,%d' % (4096 * i + 4090, 12) for i in range(50)]
+    path = tmp_path / 'lackey.txt'
+    path.write_bytes(b'\n'.join(lines) + b'\n')
+    whole = np.concatenate(list(iter_lackey_trace(path, 4096)))
+    chunked = np.concatenate(list(iter_lackey_trace(path, 4096, chunk_bytes = 7)))
+    assert whole['page'].tolist() == chunked['page'].tolist()
+    assert whole.size == 100  # Every access straddles two pages
+
+
+def test_convert_and_binary_round_trip(tmp_path):
+    src, dst = tmp_path / 'lackey.txt', tmp_path / 'lackey.bin'
+    src.write_bytes(b' S 2000,4\n L 5000,4\n')
+    assert convert_lackey_trace(src, dst, 4096) == 2
+    assert load_trace(dst)['page'].tolist() == [2, 5]
+
+    save_trace(dst, [3, 1, 3], [0, 1, 0])
+    trace = load_trace(dst)
+    assert trace['page'].tolist() == [3, 1, 3]
+    assert trace['rw'].tolist() == [0, 1, 0]
+
+
+def test_compact_pages_renumbers_by_first_appearance():
+    dense, original = compact_pages([900, 5, 900, 77])
+    assert dense.tolist() == [0, 1, 0, 2]
+    assert original.tolist() == [900, 5, 77]
+
+
+def test_trace_sweep_rejects_options_it_cannot_model(tmp_path, capsys):
+    import main
+
+    path = tmp_path / 'trace.bin'
+    save_trace(path, [3, 1, 3, 2, 1], [0, 1, 0, 0, 0])
+    for option in [['--swap'], ['--tlb_entries', '16'], ['--prefetch', 'sequential'], ['--numa_nodes', '2'],
+                   ['--record', str(tmp_path)], ['--ci_target', '0.1']]:
+        with pytest.raises(ValueError):
+            main.main(['--trace', str(path), *option])
+    main.main(['--trace', str(path)])
+    assert 'FIFO' in capsys.readouterr().out
@@ -0,0 +1,180 @@
+import zlib
+from collections import OrderedDict
+from swap import SwapDevice
+
+
+class CompressedPool:
+    """
+    zswap-style compressed memory tier.
+    Evicted pages are stored compressed up to a byte capacity; when full, the least
+    recently stored pages are written back to the next tier. The compressed size of a
+    page is modelled as page_size / ratio with a per-page spread, derived from a hash of
+    the page so every algorithm sees the same size for the same page. Pages that do not
+    compress below `max_fraction` of a page are rejected and go straight to the next tier.
+    Clean pages are compressed too, so a later fault on them is served from the pool; this
+    is a modelling choice, zswap only stores pages on their way to swap and drops clean
+    file-backed pages.
+    """
+
+    def __init__(self, capacity, page_size = 4096, ratio = 3.0, spread = 0.5, max_fraction = 0.9,
+                 compress_ns = 2000, decompress_ns = 1000):
+        """
+        :param capacity: Pool capacity in bytes
+        :param page_size: Page size in bytes
+        :param ratio: Mean compression ratio
+        :param spread: Relative spread of compressed sizes around the mean (0 for a fixed ratio)
+        :param max_fraction: Largest compressed size, as a fraction of a page, that is stored
+        :param compress_ns: Time to compress one page
+        :param decompress_ns: Time to decompress one page
+        """
+        self.capacity = capacity
+        self.page_size = page_size
+        self.ratio = ratio
+        self.spread = spread
+        self.max_fraction = max_fraction
+        self.compress_ns = compress_ns
+        self.decompress_ns = decompress_ns
+
+        self.entries = OrderedDict()  # (pid, page) -> compressed size, oldest first
+        self.used = 0
+        self.peak = 0
+
+        self.stores = 0
+        self.hits = 0
+        self.rejects = 0
+        self.write_backs = 0
+        self.time_ns = 0
+
+    def compressed_size(self, pid, page):
+        """
+        :return: Modelled compressed size of a page in bytes
+        """
+        u = zlib.crc32(f"{pid}:{page}".encode()) / 0xFFFFFFFF
+        return max(1, int(self.page_size / self.ratio * (1 + self.spread * (2 * u - 1))))
+
+    def store(self, pid, page):
+        """
+        Compresses an evicted page into the pool.
+
+        :param pid: Process ID
+        :param page: Page number
+        :return: List of (pid, page) pushed out to make room (or the page itself if rejected)
+        """
+        if self.capacity <= 0:
+            return [(pid, page)]
+        size = self.compressed_size(pid, page)
+        self.time_ns += self.compress_ns
+        if size > self.page_size * self.max_fraction or size > self.capacity:
+            self.rejects += 1
+            return [(pid, page)]
+
+        demoted = []
+        while self.used + size > self.capacity:
+            key, old_size = self.entries.popitem(last = False)
+            self.used -= old_size
+            self.write_backs += 1
+            demoted.append(key)
+        self.entries[(pid, page)] = size
+        self.used += size
+        self.peak = max(self.peak, self.used)
+        self.stores += 1
+        return demoted
+
+    def load(self, pid, page):
+        """
+        Serves a fault from the pool if the page is there; the entry is freed (exclusive load).
+
+        :return: True on a pool hit
+        """
+        size = self.entries.pop((pid, page), None)
+        if size is None:
+            return False
+        self.used -= size
+        self.hits += 1
+        self.time_ns += self.decompress_ns
+        return True
+
+    def release(self, pid):
+        """
+        Drops every entry of a process.
+
+        :param pid: Process ID
+        """
+        for key in [key for key in self.entries if key[0] == pid]:
+            self.used -= self.entries.pop(key)
+
+
+class TierChain:
+    """
+    Memory hierarchy below the frames: compressed pool, then swap.
+    It exposes the SwapDevice interface (access, page_in, evict, flush, release), so it
+    plugs into the simulation wherever a swap device does. Evicted pages demote into the
+    pool, pages pushed out of the pool are written back to swap, and faults are served
+    by the first tier holding the page.
+    """
+
+    def __init__(self, pool, swap = None):
+        """
+        :param pool: CompressedPool in front of the swap device
+        :param swap: SwapDevice (a default one if None)
+        """
+        self.pool = pool
+        self.swap = SwapDevice(pool.page_size) if swap is None else swap
+
+    def access(self, pid, page, rw):
+        self.swap.access(pid, page, rw)
+
+    def page_in(self, pid, page):
+        """
+        Services a page fault from the compressed pool, or else from swap.
+
+        :return: Swap slot of the page, or None if it has none
+        """
+        if self.pool.load(pid, page):
+            return self.swap.slots.get((pid, page))
+        return self.swap.page_in(pid, page)
+
+    def evict(self, pid, page):
+        """
+        Demotes an evicted page into the pool; pages the pool pushes out go to swap.
+
+        :return: Swap slot of the page, or None if it has none
+        """
+        for key in self.pool.store(pid, page):
+            self.swap.evict(*key)
+        return self.swap.slots.get((pid, page))
+
+    def flush(self):
+        self.swap.flush()
+
+    def release(self, pid):
+        self.pool.release(pid)
+        self.swap.release(pid)
+
+    def time_ns(self):
+        """
+        :return: Simulated time spent below the frames: compression plus swap I/O
+        """
+        return self.pool.time_ns + self.swap.io_time_ns
+
+
+if __name__ == '__main__':
+    import random
+    from engine import Pager
+    from algorithms import LRU
+
+    random.seed(42)
+    access = [random.choice(range(64)) if random.random() < 0.8 else random.randrange(512) for _ in range(50000)]
+    for capacity_pages in [0, 16, 64, 256]:
+        chain = TierChain(CompressedPool(capacity_pages * 4096))
+        pager = Pager(LRU(32))
+        for page_index, page in enumerate(access):
+            fault, _, old_page = pager.access(page, 1, page_index)
+            if old_page is not None:
+                chain.evict(0, old_page)
+            if fault:
+                chain.page_in(0, page)
+            chain.access(0, page, 1)
+        chain.flush()
+        print(f"pool {capacity_pages:3d} pages: {chain.pool.hits} pool hits, {chain.swap.page_ins} swap-ins, "
+              f"{chain.time_ns() / 1e6:.1f}ms below RAM")
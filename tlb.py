@@ -0,0 +1,120 @@
+from collections import OrderedDict
+
+
+class TLB:
+    """
+    Set-associative translation look-aside buffer with LRU replacement inside each set.
+    An entry maps `page_size` bytes, so a TLB for huge pages covers many base pages
+    (the pages of a `Process`) with a single entry.
+    """
+
+    def __init__(self, entries = 64, ways = 4, page_size = 4096, base_page_size = 4096):
+        """
+        :param entries: Total number of entries
+        :param ways: Associativity (entries per set); equal to entries for a fully associative TLB
+        :param page_size: Bytes mapped by one entry
+        :param base_page_size: Page size of the simulated process in bytes
+        """
+        if entries < 1 or ways < 1 or entries % ways:
+            raise ValueError('entries must be a positive multiple of ways')
+        if page_size % base_page_size:
+            raise ValueError('TLB page size must be a multiple of the base page size')
+        self.entries = entries
+        self.ways = ways
+        self.page_size = page_size
+        self.set_count = entries // ways
+        self.pages_per_entry = page_size // base_page_size
+
+        self.sets = [OrderedDict() for _ in range(self.set_count)]
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self):
+        return f"{self.entries}-entry {self.ways}-way TLB ({self.page_size // 1024}KB pages)"
+
+    def flush(self):
+        """
+        Drops every entry (e.g. on a context switch); hit and miss counters are kept.
+        """
+        for tlb_set in self.sets:
+            tlb_set.clear()
+
+    def reset(self):
+        """
+        Drops every entry and clears the counters.
+        """
+        self.flush()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, page):
+        """
+        Translates a page, filling the entry on a miss.
+
+        :param page: Base page number being accessed
+        :return: True on a TLB hit, False on a miss
+        """
+        vpn = page // self.pages_per_entry
+        tlb_set = self.sets[vpn % self.set_count]
+        if vpn in tlb_set:
+            tlb_set.move_to_end(vpn)
+            self.hits += 1
+            return True
+
+        if len(tlb_set) >= self.ways:
+            tlb_set.popitem(last = False)  # Evict the least recently used entry in the set
+        tlb_set[vpn] = None
+        self.misses += 1
+        return False
+
+    def invalidate(self, page, current = None):
+        """
+        Removes the entry covering a page, e.g. after the page has been evicted.
+
+        :param page: Base page number
+        :param current: Page being loaded in its place; an entry that also covers it is kept
+        """
+        vpn = page // self.pages_per_entry
+        if current is not None and current // self.pages_per_entry == vpn:
+            return
+        self.sets[vpn % self.set_count].pop(vpn, None)
+
+    def reach(self):
+        """
+        :return: Bytes of memory the TLB can map at once
+        """
+        return self.entries * self.page_size
+
+
+def effective_access_time(accesses, tlb_misses, faults, mem_ns = 100, tlb_ns = 1, fault_ns = 8000000, walk_levels = 4):
+    """
+    Average time of one memory reference in nanoseconds.
+    Every reference pays the TLB lookup and the memory access; a TLB miss adds a page
+    walk of `walk_levels` memory reads, and a page fault adds the fault-service time.
+
+    :param accesses: Number of references
+    :param tlb_misses: Number of TLB misses
+    :param faults: Number of page faults
+    :param mem_ns: Memory access latency
+    :param tlb_ns: TLB lookup latency
+    :param fault_ns: Page-fault service latency
+    :param walk_levels: Memory reads per page-table walk
+    :return: Effective access time in nanoseconds
+    """
+    if accesses == 0:
+        return 0.0
+    miss_rate = tlb_misses / accesses
+    fault_rate = faults / accesses
+    return tlb_ns + mem_ns + miss_rate * walk_levels * mem_ns + fault_rate * fault_ns
+
+
+if __name__ == '__main__':
+    import random
+
+    random.seed(42)
+    pages = [random.randint(0, 4095) for _ in range(100000)]
+    for size in [4096, 2 * 1024 * 1024]:
+        tlb = TLB(64, 4, size)
+        for page in pages:
+            tlb.lookup(page)
+        print(f"{tlb}: reach {tlb.reach() // 1024}KB, miss rate {tlb.misses / len(pages) * 100:.2f}%")
@@ -0,0 +1,250 @@
+import os
+import time
+import numpy as np
+
+
+# Record layout of a binary page trace: one (page, rw) pair per access
+TRACE_DTYPE = np.dtype([('page', '<i8'), ('rw', 'u1')])
+
+# Lookup table from ASCII byte to hexadecimal digit value (255 marks a non-hex byte)
+_HEX_LUT = np.full(256, 255, dtype = np.uint8)
+for _i, _c in enumerate(b'0123456789abcdef'):
+    _HEX_LUT[_c] = _i
+for _i, _c in enumerate(b'ABCDEF'):
+    _HEX_LUT[_c] = 10 + _i
+
+# Lackey operation codes and the rw bit each one maps to (M = load + store)
+_OP_RW = {ord('I'): 0, ord('L'): 0, ord('S'): 1, ord('M'): 1}
+_MAX_HEX_DIGITS = 16
+_MAX_SIZE_DIGITS = 8
+
+
+# Convert a page size in bytes into a shift amount, or None if it is not a power of two
+def page_shift(page_size):
+    if page_size < 1:
+        raise ValueError('page_size must be greater than 0')
+    return page_size.bit_length() - 1 if page_size & (page_size - 1) == 0 else None
+
+
+# Decode right-aligned digit fields that end just before `ends` into integers
+def _decode_digits(buf, starts, ends, base):
+    values = np.zeros(starts.size, dtype = np.uint64)
+    valid = np.ones(starts.size, dtype = bool)
+    width = int((ends - starts).max()) if starts.size else 0
+    # One vectorized pass per digit column, most significant column first
+    for offset in range(width, 0, -1):
+        position = ends - offset
+        present = position >= starts
+        digits = _HEX_LUT[buf[np.maximum(position, starts)]]
+        valid &= ~present | (digits < base)
+        digits = np.where(present, digits, 0).astype(np.uint64)
+        values = values * np.uint64(base) + digits
+    return values, valid
+
+
+def parse_lackey_chunk(chunk, include_instructions = True):
+    """
+    Parse a block of complete Valgrind Lackey lines (`I  addr,size`, ` L addr,size`, ...).
+    Lines that are not memory references (e.g. `==pid==` banners) are skipped.
+
+    :param chunk: Bytes holding whole lines only
+    :param include_instructions: Whether instruction fetches (`I`) are kept
+    :return: Tuple of (addresses, sizes, rw) NumPy arrays
+    """
+    buf = np.frombuffer(chunk, dtype = np.uint8)
+    if buf.size == 0:
+        empty = np.empty(0, dtype = np.uint64)
+        return empty, empty, np.empty(0, dtype = np.uint8)
+
+    # Line boundaries; a trailing line without a newline still counts
+    newlines = np.flatnonzero(buf == ord('\n'))
+    if newlines.size == 0 or newlines[-1] != buf.size - 1:
+        newlines = np.append(newlines, buf.size)
+    starts = np.concatenate(([0], newlines[:-1] + 1))
+    lengths = newlines - starts
+    keep = lengths >= 5
+    starts, ends = starts[keep], newlines[keep]
+
+    # `I` sits in column 0, data accesses in column 1; the address starts in column 3
+    first = buf[starts]
+    second = buf[starts + 1]
+    op = np.where(first == ord(' '), second, first)
+    rw = np.full(starts.size, 255, dtype = np.uint8)
+    for code, bit in _OP_RW.items():
+        if code == ord('I') and not include_instructions:
+            continue
+        rw[op == code] = bit
+    keep = (rw != 255) & (buf[starts + 2] == ord(' '))
+
+    # Locate the comma that separates address and size on each line
+    commas = np.flatnonzero(buf == ord(','))
+    if commas.size == 0:
+        empty = np.empty(0, dtype = np.uint64)
+        return empty, empty, np.empty(0, dtype = np.uint8)
+    comma_idx = np.minimum(np.searchsorted(commas, starts), commas.size - 1)
+    comma = commas[comma_idx]
+    addr_start = starts + 3
+    # Lackey pads `I` lines with a second blank before the address
+    addr_start = addr_start + (buf[np.minimum(addr_start, buf.size - 1)] == ord(' '))
+    keep &= (comma < ends) & (comma > addr_start) & (comma - addr_start <= _MAX_HEX_DIGITS)
+    keep &= (ends - comma > 1) & (ends - comma - 1 <= _MAX_SIZE_DIGITS)
+
+    starts, ends, comma, addr_start, rw = starts[keep], ends[keep], comma[keep], addr_start[keep], rw[keep]
+    # Strip a carriage return left by CRLF files
+    ends = ends - (buf[ends - 1] == ord('\r'))
+
+    addresses, valid_addr = _decode_digits(buf, addr_start, comma, 16)
+    sizes, valid_size = _decode_digits(buf, comma + 1, ends, 10)
+    valid = valid_addr & valid_size
+    return addresses[valid], sizes[valid], rw[valid]
+
+
+def addresses_to_pages(addresses, sizes, rw, page_size):
+    """
+    Map byte accesses to page references. An access that straddles a page boundary
+    produces one reference for every page it touches, in ascending order.
+
+    :param addresses: Byte addresses of the accesses
+    :param sizes: Access sizes in bytes (0 is treated as 1)
+    :param rw: Read/write bit of each access
+    :param page_size: Page size in bytes
+    :return: Structured array with TRACE_DTYPE records
+    """
+    addresses = np.asarray(addresses, dtype = np.uint64)
+    last_byte = addresses + np.maximum(np.asarray(sizes, dtype = np.uint64), 1) - np.uint64(1)
+    shift = page_shift(page_size)
+    if shift is not None:
+        first_page = addresses >> np.uint64(shift)
+        last_page = last_byte >> np.uint64(shift)
+    else:
+        first_page = addresses // np.uint64(page_size)
+        last_page = last_byte // np.uint64(page_size)
+
+    span = (last_page - first_page + np.uint64(1)).astype(np.int64)
+    records = np.empty(int(span.sum()), dtype = TRACE_DTYPE)
+    if span.size and span.max() == 1:
+        records['page'] = first_page.astype(np.int64)
+        records['rw'] = rw
+        return records
+
+    # Expand straddling accesses: page = first_page + position inside its group
+    group_start = np.repeat(np.cumsum(span) - span, span)
+    records['page'] = np.repeat(first_page.astype(np.int64), span) + (np.arange(records.size) - group_start)
+    records['rw'] = np.repeat(rw, span)
+    return records
+
+
+def iter_lackey_trace(path, page_size, chunk_bytes = 1 << 24, include_instructions = True):
+    """
+    Stream a Lackey trace file as page references, one NumPy block per chunk.
+
+    :param path: Path of the text trace
+    :param page_size: Page size in bytes
+    :param chunk_bytes: Number of bytes read per chunk
+    :param include_instructions: Whether instruction fetches (`I`) are kept
+    :return: Generator of structured arrays with TRACE_DTYPE records
+    """
+    tail = b''
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(chunk_bytes)
+            if not data:
+                break
+            data = tail + data
+            cut = data.rfind(b'\n') + 1
+            tail = data[cut:]
+            if cut:
+                yield addresses_to_pages(*parse_lackey_chunk(data[:cut], include_instructions), page_size)
+    if tail:
+        yield addresses_to_pages(*parse_lackey_chunk(tail, include_instructions), page_size)
+
+
+def convert_lackey_trace(path, out_path, page_size, chunk_bytes = 1 << 24, include_instructions = True):
+    """
+    Convert a text Lackey trace into a binary page trace.
+
+    :param path: Path of the text trace
+    :param out_path: Path of the binary trace to write
+    :param page_size: Page size in bytes
+    :param chunk_bytes: Number of bytes read per chunk
+    :param include_instructions: Whether instruction fetches (`I`) are kept
+    :return: Number of page references written
+    """
+    total = 0
+    with open(out_path, 'wb') as out:
+        for records in iter_lackey_trace(path, page_size, chunk_bytes, include_instructions):
+            records.tofile(out)
+            total += records.size
+    return total
+
+
+# Memory-map a binary page trace written by convert_lackey_trace/save_trace
+def load_trace(path):
+    return np.memmap(path, dtype = TRACE_DTYPE, mode = 'r')
+
+
+# Write page and rw sequences as a binary page trace
+def save_trace(path, access, modify):
+    records = np.empty(len(access), dtype = TRACE_DTYPE)
+    records['page'] = access
+    records['rw'] = modify
+    records.tofile(path)
+
+
+# Iterate over a binary page trace in fixed-size blocks without loading it whole
+def iter_trace(path, chunk_records = 1 << 20):
+    trace = load_trace(path)
+    for start in range(0, trace.size, chunk_records):
+        yield trace[start:start + chunk_records]
+
+
+# Stream a trace in either supported format as blocks of (page, rw) records
+def open_trace(path, trace_format = 'bin', page_size = 4096):
+    if trace_format == 'lackey':
+        return iter_lackey_trace(path, page_size)
+    return iter_trace(path)
+
+
+# Load a whole trace in either supported format (binary traces stay memory-mapped)
+def read_trace(path, trace_format = 'bin', page_size = 4096):
+    if trace_format == 'lackey':
+        return np.concatenate(list(iter_lackey_trace(path, page_size)))
+    return load_trace(path)
+
+
+def compact_pages(pages):
+    """
+    Renumber pages densely into [0, N) in order of first appearance, so a trace taken
+    from a sparse address space fits a `Process` page table.
+
+    :param pages: Page numbers
+    :return: Tuple of (dense pages, original page of each dense number)
+    """
+    pages = np.asarray(pages)
+    uniques, first_seen, inverse = np.unique(pages, return_index = True, return_inverse = True)
+    order = np.argsort(first_seen)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    return rank[inverse.reshape(-1)], uniques[order]
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    lines = [b'==1234== Lackey, an example Valgrind tool',
+             b'I  04016c10,3',
+             b' S 7ff000ffe,8',
+             b' L 04222cac,4',
+             b' M 0421fffe,4']
+    sample = b'\n'.join(lines * 500000) + b'\n'
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, 'lackey.txt')
+        dst = os.path.join(tmp, 'lackey.bin')
+        with open(src, 'wb') as f:
+            f.write(sample)
+
+        T0 = time.perf_counter()
+        n = convert_lackey_trace(src, dst, 4096)
+        T1 = time.perf_counter()
+        print(f"{n} page references, {len(sample) / (T1 - T0) / 2 ** 20:.1f} MB/s")
+        print(load_trace(dst)[:5])
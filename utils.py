@@ -17,11 +17,12 @@ def cal_tabulate_lines(table):
 
 
 # Function to display a fault table comparing different algorithms' page faults
-def show_fault_table(alg_faults, length_pages):
+def show_fault_table(alg_faults, length_pages, extra_rows = None):
     """
     Display the number of page faults and the page fault rate for each algorithm.
     :param alg_faults: Dictionary containing the number of page faults for each algorithm
     :param length_pages: Total number of pages accessed
+    :param extra_rows: Optional dictionary of row title -> {algorithm: value} appended below the fault rows
     """
     algorithms = list(alg_faults.keys())
     headers = [''] + algorithms
@@ -29,6 +30,8 @@ def show_fault_table(alg_faults, length_pages):
     for fault in alg_faults.values():
         tables[0].append(str(fault))  # Append fault count
         tables[1].append(f"{fault / length_pages * 100:.2f}%")  # Calculate and append fault rate
+    for title, values in (extra_rows or {}).items():
+        tables.append([title] + [str(values.get(algorithm, '')) for algorithm in algorithms])
 
     disp_tables = tabulate(tables, headers = headers, tablefmt = 'presto', stralign = 'center')
     del_line, _ = cal_tabulate_lines(disp_tables)
@@ -42,6 +45,85 @@ def show_fault_table(alg_faults, length_pages):
     print(disp_tables)
 
 
+# Function to display how many frames each process held over time under each allocation policy
+def show_frame_history(histories):
+    """
+    Display the frames held by every process at each sampled point in time.
+    :param histories: Dictionary of policy name -> list of (time, [frames held by each process])
+    """
+    for name, history in histories.items():
+        pid_num = len(history[0][1])
+        headers = ['Time'] + [f'PID {pid}' for pid in range(pid_num)] + ['Total']
+        tables = [[t] + frames + [sum(frames)] for t, frames in history]
+        disp_tables = tabulate(tables, headers = headers, tablefmt = 'presto', stralign = 'center', numalign = 'center')
+        del_line, _ = cal_tabulate_lines(disp_tables)
+        title_texts = f"{name} Frames Held Over Time".center(len(del_line))
+        title_texts = Fore.CYAN + title_texts + Fore.RESET
+
+        print('\n')
+        print(del_line)
+        print(title_texts)
+        print(del_line)
+        print(disp_tables)
+
+
+# Function to display fault-rate confidence intervals per process and frame count
+def show_stats_table(collector):
+    """
+    Display the mean fault rate and its confidence interval for each algorithm, process and frame count.
+    :param collector: StatsCollector filled during the simulation
+    """
+    algorithms = list(dict.fromkeys(key[0] for key in collector.stats))
+    groups = sorted(set(key[1:] for key in collector.stats))
+    headers = ['PID', 'Frames', 'Sequences'] + algorithms
+    tables = []
+    for pid, frame_size in groups:
+        row = [pid, frame_size, collector.stats[(algorithms[0], pid, frame_size)].n]
+        for algorithm in algorithms:
+            stats = collector.stats[(algorithm, pid, frame_size)]
+            row.append(f"{stats.mean * 100:.2f}% ± {stats.half_width(collector.level) * 100:.2f}%")
+        tables.append(row)
+
+    disp_tables = tabulate(tables, headers = headers, tablefmt = 'presto', stralign = 'center', numalign = 'center')
+    del_line, _ = cal_tabulate_lines(disp_tables)
+    title_texts = f"Fault Rate {collector.level * 100:.0f}% Confidence Intervals".center(len(del_line))
+    title_texts = Fore.CYAN + title_texts + Fore.RESET
+
+    print('\n')
+    print(del_line)
+    print(title_texts)
+    print(del_line)
+    print(disp_tables)
+
+
+# Function to display CPU utilization and throughput against the degree of multiprogramming
+def show_schedule_table(sweeps, onsets):
+    """
+    Display the scheduler measurements of every algorithm as the number of processes rises.
+    :param sweeps: Dictionary of algorithm name -> list of measurements from scheduler.sweep_multiprogramming
+    :param onsets: Dictionary of algorithm name -> degree at which thrashing sets in (None if never)
+    """
+    headers = ['Processes', 'Resident', 'Frames', 'CPU', 'Paging device', 'Throughput', 'Fault rate', 'Mean fault wait']
+    for name, points in sweeps.items():
+        tables = [[p['processes'], p['resident'], p['frames'], f"{p['cpu_utilization'] * 100:.2f}%",
+                   f"{p['device_utilization'] * 100:.2f}%", f"{p['throughput']:.4f}", f"{p['fault_rate'] * 100:.2f}%",
+                   f"{p['mean_fault_wait']:.1f}"] for p in points]
+        disp_tables = tabulate(tables, headers = headers, tablefmt = 'presto', stralign = 'center', numalign = 'center')
+        del_line, _ = cal_tabulate_lines(disp_tables)
+        title_texts = f"{name} Multiprogramming".center(len(del_line))
+        title_texts = Fore.CYAN + title_texts + Fore.RESET
+        onset = onsets[name]
+        summary = f"Thrashing sets in at {onset} processes" if onset is not None else "No thrashing detected"
+
+        print('\n')
+        print(del_line)
+        print(title_texts)
+        print(del_line)
+        print(disp_tables)
+        print(del_line)
+        print(summary.center(len(del_line)))
+
+
 # Function to display the page replacement simulation tables for all algorithms
 def show_all_table(table: list, delay: int = 1):
     """
@@ -0,0 +1,40 @@
+import random
+
+
+# Generate a random memory access sequence for testing (from `rng`, the random module by default)
+def generate_access_sequence(max_page, length, rng = random):
+    if max_page < 1 or length < 1:
+        raise ValueError('Both max_page and length must be greater than 0')
+
+    # Generate random page access and modify bit sequences
+    access_sequence = [rng.randint(0, max_page - 1) for _ in range(length)]
+    modify_bits = [rng.randint(0, 1) for _ in range(length)]
+
+    return {
+        'access': access_sequence,
+        'modify': modify_bits
+    }
+
+
+# Generate the sequences of the fault sweep round by round, one per process per round, as
+# (pid, access, modify) triples; with rounds = None the generator never ends
+def generate_sequences(num_processes, max_page, min_length, max_length, rounds = None, rng = random):
+    round_n = 0
+    while rounds is None or round_n < rounds:
+        for pid in range(num_processes):
+            sequence = generate_access_sequence(max_page, rng.randint(min_length, max_length), rng)
+            yield pid, sequence['access'], sequence['modify']
+        round_n += 1
+
+
+# Generate one long trace per process, each the concatenation of `sequences` random sequences
+def generate_process_traces(num_processes, sequences, max_page, min_length, max_length):
+    traces = []
+    for _ in range(num_processes):
+        access, modify = [], []
+        for _ in range(sequences):
+            sequence = generate_access_sequence(max_page, random.randint(min_length, max_length))
+            access += sequence['access']
+            modify += sequence['modify']
+        traces.append((access, modify))
+    return traces